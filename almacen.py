@@ -0,0 +1,292 @@
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+
+import pandas as pd
+
+# Campos de agregación del dashboard -> columnas de la tabla `evaluaciones`
+COLUMNAS = {
+    "Grado": "grado",
+    "Seccion": "seccion",
+    "Curso": "curso",
+    "Competencia": "competencia",
+    "Nivel": "nivel",
+}
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS fuentes (
+    bimestre TEXT PRIMARY KEY,
+    archivo TEXT NOT NULL,
+    mtime REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS alumnos (
+    bimestre TEXT NOT NULL,
+    fila INTEGER NOT NULL,
+    alumno_id INTEGER NOT NULL,
+    grado_seccion TEXT,
+    grado TEXT,
+    seccion TEXT,
+    nombre_alumno TEXT,
+    PRIMARY KEY (bimestre, fila)
+);
+CREATE TABLE IF NOT EXISTS competencias (
+    bimestre TEXT NOT NULL,
+    col_idx INTEGER NOT NULL,
+    columna TEXT NOT NULL,
+    curso TEXT,
+    competencia TEXT,
+    PRIMARY KEY (bimestre, col_idx)
+);
+CREATE TABLE IF NOT EXISTS evaluaciones (
+    bimestre TEXT NOT NULL,
+    alumno_id INTEGER NOT NULL,
+    fila INTEGER,
+    grado TEXT,
+    seccion TEXT,
+    curso TEXT,
+    competencia TEXT,
+    nivel TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_evaluaciones_filtros
+    ON evaluaciones (bimestre, grado, seccion, curso, competencia);
+CREATE INDEX IF NOT EXISTS idx_evaluaciones_alumno
+    ON evaluaciones (alumno_id);
+-- Conteos por nivel ya agregados al guardar: las tendencias leen de aquí
+CREATE TABLE IF NOT EXISTS conteos (
+    bimestre TEXT NOT NULL,
+    grado TEXT,
+    seccion TEXT,
+    curso TEXT,
+    competencia TEXT,
+    nivel TEXT,
+    cantidad INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_conteos_grado
+    ON conteos (grado, seccion, curso, competencia);
+CREATE INDEX IF NOT EXISTS idx_conteos_curso
+    ON conteos (curso, competencia);
+CREATE INDEX IF NOT EXISTS idx_conteos_competencia
+    ON conteos (competencia);
+"""
+
+CONTEOS_DESDE_EVALUACIONES = """
+INSERT INTO conteos
+SELECT bimestre, grado, seccion, curso, competencia, nivel, COUNT(*)
+FROM evaluaciones WHERE bimestre = ?
+GROUP BY grado, seccion, curso, competencia, nivel
+"""
+
+
+class AlmacenEvaluaciones:
+    """Almacén SQLite local con las evaluaciones en formato largo de cada bimestre.
+
+    Permite conservar el historial de varios años sin mantener en memoria las
+    tablas agregadas: los callbacks consultan por índice solo lo que necesitan.
+    Las claves llevan el año ("2025-II"), así que el II de un año nuevo no
+    reemplaza al del anterior.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        with closing(self._conectar()) as con, con:
+            con.executescript(ESQUEMA)
+            self._migrar(con)
+
+    @staticmethod
+    def _migrar(con):
+        columnas = {fila[1] for fila in con.execute("PRAGMA table_info(evaluaciones)")}
+        if "fila" not in columnas:
+            # Almacenes anteriores: la fila se recupera por nro, que entonces era único
+            con.execute("ALTER TABLE evaluaciones ADD COLUMN fila INTEGER")
+            con.execute(
+                "UPDATE evaluaciones SET fila = (SELECT a.fila FROM alumnos a "
+                "WHERE a.bimestre = evaluaciones.bimestre AND a.alumno_id = evaluaciones.alumno_id)"
+            )
+        # Bimestres guardados antes de que existiera la tabla de conteos
+        for (bimestre,) in con.execute("SELECT bimestre FROM fuentes WHERE bimestre NOT IN (SELECT DISTINCT bimestre FROM conteos)").fetchall():
+            con.execute(CONTEOS_DESDE_EVALUACIONES, (bimestre,))
+
+    def _conectar(self):
+        # Una conexión por consulta: SQLite es barato de abrir y así no se
+        # comparten conexiones entre hilos del servidor.
+        return sqlite3.connect(self.path)
+
+    def vigente(self, bimestre: str, archivo: str, mtime: float) -> bool:
+        with closing(self._conectar()) as con:
+            fila = con.execute("SELECT archivo, mtime FROM fuentes WHERE bimestre = ?", (bimestre,)).fetchone()
+        return fila is not None and fila[0] == archivo and fila[1] == mtime
+
+    def guardado_como(self, archivo: str, mtime: float):
+        """Clave con la que ya se guardó esta versión del Excel, o None."""
+        with closing(self._conectar()) as con:
+            fila = con.execute("SELECT bimestre FROM fuentes WHERE archivo = ? AND mtime = ?", (archivo, mtime)).fetchone()
+        return fila[0] if fila else None
+
+    def guardar(self, bimestre: str, archivo: str, mtime: float, df: pd.DataFrame, df_long: pd.DataFrame, mapeo_columnas: dict):
+        alumnos = df.reset_index(drop=True)
+        filas_alumnos = [
+            (bimestre, fila, int(r.alumno_id), r.grado_seccion if "grado_seccion" in alumnos else None, r.grado, r.seccion, r.nombre_alumno)
+            for fila, r in zip(alumnos.index, alumnos.itertuples(index=False))
+        ]
+        filas_competencias = [
+            (bimestre, int(idx), str(df.columns[idx]), info["curso"], info["competencia"])
+            for idx, info in mapeo_columnas.items()
+        ]
+        filas_evaluaciones = list(
+            zip(
+                [bimestre] * len(df_long),
+                df_long["alumno_id"].astype(int).tolist(),
+                df_long["fila"].astype(int).tolist(),
+                df_long["Grado"].tolist(),
+                df_long["Seccion"].tolist(),
+                df_long["Curso"].tolist(),
+                df_long["Competencia"].tolist(),
+                df_long["Nivel"].tolist(),
+            )
+        )
+
+        with closing(self._conectar()) as con, con:
+            for tabla in ("fuentes", "alumnos", "competencias", "evaluaciones", "conteos"):
+                con.execute(f"DELETE FROM {tabla} WHERE bimestre = ?", (bimestre,))
+            con.execute("INSERT INTO fuentes VALUES (?, ?, ?)", (bimestre, archivo, mtime))
+            con.executemany("INSERT INTO alumnos VALUES (?, ?, ?, ?, ?, ?, ?)", filas_alumnos)
+            con.executemany("INSERT INTO competencias VALUES (?, ?, ?, ?, ?)", filas_competencias)
+            con.executemany(
+                "INSERT INTO evaluaciones (bimestre, alumno_id, fila, grado, seccion, curso, competencia, nivel) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                filas_evaluaciones,
+            )
+            con.execute(CONTEOS_DESDE_EVALUACIONES, (bimestre,))
+
+    def bimestres(self) -> list:
+        with closing(self._conectar()) as con:
+            return [fila[0] for fila in con.execute("SELECT bimestre FROM fuentes ORDER BY bimestre")]
+
+    def version(self) -> str:
+        """Cambia cada vez que se guarda, renombra o reemplaza un bimestre."""
+        with closing(self._conectar()) as con:
+            filas = con.execute("SELECT bimestre, archivo, mtime FROM fuentes ORDER BY bimestre").fetchall()
+        return "|".join(f"{bimestre}:{archivo}:{mtime}" for bimestre, archivo, mtime in filas)
+
+    def renombrar(self, anterior: str, nuevo: str):
+        """Cambia la clave de un bimestre ya guardado (p. ej. "II" -> "2025-II")."""
+        with closing(self._conectar()) as con, con:
+            for tabla in ("fuentes", "alumnos", "competencias", "evaluaciones", "conteos"):
+                con.execute(f"UPDATE {tabla} SET bimestre = ? WHERE bimestre = ?", (nuevo, anterior))
+
+    def alumnos(self, bimestre: str) -> pd.DataFrame:
+        """Padrón del bimestre en el orden de `df_data`, sin las notas."""
+        with closing(self._conectar()) as con:
+            return pd.read_sql_query(
+                "SELECT grado, seccion, nombre_alumno FROM alumnos WHERE bimestre = ? ORDER BY fila",
+                con,
+                params=(bimestre,),
+            )
+
+    def contexto(self, bimestre: str) -> dict:
+        """Contexto ligero: padrón de alumnos y totales, sin las tablas agregadas."""
+        with closing(self._conectar()) as con:
+            alumnos = pd.read_sql_query(
+                "SELECT fila, alumno_id, grado_seccion, grado, seccion, nombre_alumno FROM alumnos WHERE bimestre = ? ORDER BY fila",
+                con,
+                params=(bimestre,),
+            )
+            competencias = pd.read_sql_query(
+                "SELECT col_idx, columna, curso, competencia FROM competencias WHERE bimestre = ? ORDER BY col_idx",
+                con,
+                params=(bimestre,),
+            )
+            niveles = pd.read_sql_query(
+                "SELECT fila, competencia, nivel FROM evaluaciones WHERE bimestre = ?",
+                con,
+                params=(bimestre,),
+            )
+            total_cursos, total_competencias = con.execute(
+                "SELECT COUNT(DISTINCT curso), COUNT(DISTINCT competencia) FROM evaluaciones WHERE bimestre = ?",
+                (bimestre,),
+            ).fetchone()
+            nivel_counts = dict(
+                con.execute("SELECT nivel, COUNT(*) FROM evaluaciones WHERE bimestre = ? GROUP BY nivel", (bimestre,)).fetchall()
+            )
+
+        # Se reconstruye la tabla ancha respetando la posición original de cada
+        # columna, porque `mapeo_columnas` se indexa por posición.
+        columnas = competencias["columna"].tolist()
+        ancho = niveles.pivot(index="fila", columns="competencia", values="nivel")
+        ancho = ancho.reindex(columns=columnas)
+        df = alumnos.set_index("fila").join(ancho).reset_index(drop=True)
+
+        mapeo_columnas = {
+            int(r.col_idx): {"curso": r.curso, "competencia": r.competencia} for r in competencias.itertuples(index=False)
+        }
+
+        return {
+            "bimestre": bimestre,
+            "almacen": self,
+            "df_data": df,
+            "df_estadisticas": df.rename(columns={"grado": "Grado", "seccion": "Seccion"}),
+            "mapeo_columnas": mapeo_columnas,
+            "total_evaluaciones": len(niveles),
+            "total_cursos": total_cursos,
+            "total_competencias": total_competencias,
+            "total_grados": df["grado"].nunique(),
+            "total_secciones": df["seccion"].nunique(),
+            "nivel_counts": nivel_counts,
+        }
+
+    @staticmethod
+    def _where(bimestre, filtros: dict):
+        condiciones = [] if bimestre is None else ["bimestre = ?"]
+        params = [] if bimestre is None else [bimestre]
+        for campo, valor in filtros.items():
+            condiciones.append(f"{COLUMNAS[campo]} = ?")
+            params.append(valor)
+        return " AND ".join(condiciones) or "1 = 1", params
+
+    def agregado(self, bimestre: str, campos: list, filtros: dict) -> pd.DataFrame:
+        """Equivalente SQL de `agg(campos)` en `cargar_bimestre`, restringido a `filtros`."""
+        where, params = self._where(bimestre, filtros)
+        grupo = ", ".join(f"{COLUMNAS[c]} AS {c}" for c in campos + ["Nivel"])
+        orden = ", ".join(campos + ["Nivel"])
+        with closing(self._conectar()) as con:
+            tabla = pd.read_sql_query(
+                f"SELECT {grupo}, COUNT(*) AS Cantidad FROM evaluaciones WHERE {where} GROUP BY {orden} ORDER BY {orden}",
+                con,
+                params=params,
+            )
+        total = tabla.groupby(campos)["Cantidad"].transform("sum")
+        tabla["Porcentaje"] = (tabla["Cantidad"] / total * 100).round(1)
+        return tabla
+
+    def valores(self, bimestre: str, campo: str, filtros: dict) -> list:
+        where, params = self._where(bimestre, filtros)
+        columna = COLUMNAS[campo]
+        with closing(self._conectar()) as con:
+            filas = con.execute(
+                f"SELECT DISTINCT {columna} FROM evaluaciones WHERE {where} AND {columna} IS NOT NULL", params
+            ).fetchall()
+        return sorted(fila[0] for fila in filas)
+
+    def tendencia(self, filtros: dict) -> pd.DataFrame:
+        """Bimestre, Nivel, Cantidad y Porcentaje de cada bimestre, desde `conteos`."""
+        where, params = self._where(None, filtros)
+        with closing(self._conectar()) as con:
+            tabla = pd.read_sql_query(
+                f"SELECT bimestre AS Bimestre, nivel AS Nivel, SUM(cantidad) AS Cantidad FROM conteos "
+                f"WHERE {where} GROUP BY bimestre, nivel ORDER BY bimestre, nivel",
+                con,
+                params=params,
+            )
+        total = tabla.groupby("Bimestre")["Cantidad"].transform("sum")
+        tabla["Porcentaje"] = (tabla["Cantidad"] / total * 100).round(1)
+        return tabla
+
+    def valores_tendencia(self, campo: str, filtros: dict) -> list:
+        """Valores de `campo` presentes en algún bimestre, desde `conteos`."""
+        where, params = self._where(None, filtros)
+        columna = COLUMNAS[campo]
+        with closing(self._conectar()) as con:
+            filas = con.execute(
+                f"SELECT DISTINCT {columna} FROM conteos WHERE {where} AND {columna} IS NOT NULL", params
+            ).fetchall()
+        return sorted(fila[0] for fila in filas)
@@ -0,0 +1,313 @@
+"""Prueba de carga del dashboard con varios docentes simultáneos.
+
+Cada usuario virtual abre la página y repite una secuencia realista
+(cambio de bimestre -> cambio de pestaña -> cascada de filtros -> tabla de
+alumnos) enviando los mismos POST a `/_dash-update-component` que enviaría el
+navegador. Al final se reporta el rendimiento total y la latencia
+p50/p95/p99 por callback, para ajustar workers/hilos en el `Procfile`, junto
+con el tamaño promedio de cada respuesta (comparar con DASHBOARD_COMPACTO=0
+para ver el ahorro del modo compacto) y cuántas llamadas idénticas se unieron
+a un cálculo en curso (ver coalescencia.py).
+
+Uso:
+    python carga_prueba.py --usuarios 20 --iteraciones 5
+    python carga_prueba.py --url http://127.0.0.1:8000 --usuarios 40   # contra gunicorn ya iniciado
+    python carga_prueba.py --usuarios 1 --perfilar <token>              # con DASHBOARD_PERFIL_TOKEN=<token>
+    python carga_prueba.py --usuarios 20 --token <token>                # y muestra /admin/coalescencia
+"""
+import argparse
+import json
+import random
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+PESTANAS = ["tab-secundaria", "tab-curso", "tab-seccion", "tab-alumno", "tab-riesgo", "tab-tendencias", "tab-consulta"]
+# Filtros que un docente suele cambiar, en el orden de la pantalla
+FILTROS = [
+    "competencia-secundaria",
+    "curso-select",
+    "filtro-curso-grado",
+    "competencia-comparacion-grado",
+    "filtro-seccion-seccion",
+    "competencia-comparacion-seccion",
+    "seccion-select",
+    "mapa-indicador",
+    "alumno-grado-select",
+    "riesgo-grado-select",
+    "tendencia-curso-select",
+    "consulta-grados",
+]
+
+
+def percentil(valores: list, p: float) -> float:
+    """Percentil por rango más cercano sobre una lista ya ordenada."""
+    if not valores:
+        return 0.0
+    idx = max(0, min(len(valores) - 1, int(round(p / 100 * len(valores))) - 1))
+    return valores[idx]
+
+
+def parsear_salidas(output: str) -> list:
+    """`..a.children...b.value..` -> [("a", "children"), ("b", "value")]."""
+    if output.startswith(".."):
+        partes = output[2:-2].split("...")
+    else:
+        partes = [output]
+    return [tuple(parte.rsplit(".", 1)) for parte in partes]
+
+
+def recorrer_layout(nodo, estado: dict, presentes: set):
+    """Guarda las propiedades iniciales de cada componente con `id` del layout
+    y registra los ids que quedan presentes en la página."""
+    if isinstance(nodo, list):
+        for hijo in nodo:
+            recorrer_layout(hijo, estado, presentes)
+        return
+    if not isinstance(nodo, dict) or "props" not in nodo:
+        return
+    props = nodo["props"]
+    if isinstance(props.get("id"), str):
+        presentes.add(props["id"])
+        for prop, valor in props.items():
+            if prop != "children":
+                estado[(props["id"], prop)] = valor
+    recorrer_layout(props.get("children"), estado, presentes)
+
+
+class Cliente:
+    def __init__(self, url: str, cabeceras: dict = None):
+        self.url = url.rstrip("/")
+        self.cabeceras = cabeceras or {}
+
+    def get_json(self, ruta: str, cabeceras: dict = None):
+        req = urllib.request.Request(self.url + ruta, headers=cabeceras or {})
+        with urllib.request.urlopen(req, timeout=60) as resp:
+            return json.loads(resp.read())
+
+    def post_json(self, ruta: str, payload: dict):
+        datos = json.dumps(payload).encode("utf-8")
+        req = urllib.request.Request(self.url + ruta, data=datos, headers={"Content-Type": "application/json", **self.cabeceras})
+        with urllib.request.urlopen(req, timeout=60) as resp:
+            cuerpo = resp.read()
+            return resp.status, (json.loads(cuerpo) if cuerpo else None), len(cuerpo)
+
+
+class Metricas:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencias = defaultdict(list)
+        self.errores = defaultdict(int)
+        self.bytes = defaultdict(int)
+
+    def registrar(self, nombre: str, segundos: float, ok: bool, tamano: int = 0):
+        with self._lock:
+            self.latencias[nombre].append(segundos)
+            self.bytes[nombre] += tamano
+            if not ok:
+                self.errores[nombre] += 1
+
+
+class UsuarioVirtual:
+    """Reproduce el ciclo del renderer de Dash: cambia una propiedad y dispara,
+    en orden de dependencias, todos los callbacks afectados."""
+
+    def __init__(self, cliente: Cliente, dependencias: list, layout, metricas: Metricas, rng: random.Random):
+        self.cliente = cliente
+        self.metricas = metricas
+        self.rng = rng
+        self.estado = {}
+        self.presentes = set()
+        self.iniciales = set()
+        recorrer_layout(layout, self.estado, self.presentes)
+        # Los callbacks con ids por patrón (resultados de búsqueda) no se reproducen
+        self.callbacks = []
+        for dep in dependencias:
+            if any(e["id"].startswith("{") for e in dep["inputs"]):
+                continue
+            self.callbacks.append(
+                dict(
+                    dep,
+                    salidas=parsear_salidas(dep["output"]),
+                    entradas={(e["id"], e["property"]) for e in dep["inputs"]},
+                    componentes={e["id"] for e in dep["inputs"]} | {i for i, _ in parsear_salidas(dep["output"])},
+                )
+            )
+
+    def _valor(self, dependencia: dict) -> dict:
+        return {
+            "id": dependencia["id"],
+            "property": dependencia["property"],
+            "value": self.estado.get((dependencia["id"], dependencia["property"])),
+        }
+
+    def _disparar(self, dep: dict, activadores: set) -> set:
+        salidas = [{"id": i, "property": p} for i, p in dep["salidas"]]
+        payload = {
+            "output": dep["output"],
+            "outputs": salidas if len(salidas) > 1 else salidas[0],
+            "inputs": [self._valor(e) for e in dep["inputs"]],
+            # En las llamadas iniciales el renderer no informa propiedades cambiadas
+            "changedPropIds": [f"{i}.{p}" for i, p in activadores - self.iniciales],
+            "state": [self._valor(e) for e in dep.get("state", [])],
+        }
+        nombre = ", ".join(f"{i}.{p}" for i, p in dep["salidas"])
+        inicio = time.perf_counter()
+        try:
+            status, cuerpo, tamano = self.cliente.post_json("/_dash-update-component", payload)
+            ok = status in (200, 204)
+        except (urllib.error.URLError, OSError):
+            status, cuerpo, tamano, ok = None, None, 0, False
+        self.metricas.registrar(nombre, time.perf_counter() - inicio, ok, tamano)
+
+        nuevos = set()
+        if status == 200 and cuerpo:
+            for comp_id, props in cuerpo.get("response", {}).items():
+                for prop, valor in props.items():
+                    if prop == "children":
+                        # Los componentes insertados disparan sus callbacks iniciales
+                        insertados = set()
+                        recorrer_layout(valor, self.estado, insertados)
+                        self.presentes |= insertados
+                        entradas = {e for dep in self.callbacks for e in dep["entradas"] if e[0] in insertados}
+                        self.iniciales |= entradas
+                        nuevos |= entradas
+                    else:
+                        self.estado[(comp_id, prop)] = valor
+                    nuevos.add((comp_id, prop))
+        return nuevos
+
+    def propagar(self, cambiados: set, iniciales: bool = False):
+        """Dispara los callbacks cuyas entradas cambiaron. Un callback espera a
+        que terminen los pendientes que producen alguna de sus entradas."""
+        self.iniciales = set(cambiados) if iniciales else set()
+        por_disparar = {}
+        frontera = {prop: None for prop in cambiados}
+        while True:
+            for idx, dep in enumerate(self.callbacks):
+                if not dep["componentes"] <= self.presentes:
+                    continue
+                # Como el renderer, un callback no se redispara con sus propias salidas
+                activadores = {prop for prop in dep["entradas"] & frontera.keys() if frontera[prop] != idx}
+                if dep.get("prevent_initial_call") and activadores <= self.iniciales:
+                    continue
+                if activadores:
+                    por_disparar.setdefault(idx, set()).update(activadores)
+            if not por_disparar:
+                return
+            producidas = {s for idx in por_disparar for s in self.callbacks[idx]["salidas"]}
+            listos = [
+                idx
+                for idx in por_disparar
+                if not self.callbacks[idx]["entradas"] & (producidas - set(self.callbacks[idx]["salidas"]))
+            ] or [min(por_disparar)]
+            frontera = {}
+            for idx in listos:
+                for prop in self._disparar(self.callbacks[idx], por_disparar.pop(idx)):
+                    frontera[prop] = idx
+
+    def abrir_pagina(self):
+        self.propagar({entrada for dep in self.callbacks for entrada in dep["entradas"]}, iniciales=True)
+
+    def cambiar(self, comp_id: str, prop: str, valor):
+        self.estado[(comp_id, prop)] = valor
+        self.propagar({(comp_id, prop)})
+
+    def elegir_opcion(self, comp_id: str):
+        opciones = self.estado.get((comp_id, "options")) or []
+        if opciones:
+            opcion = self.rng.choice(opciones)
+            self.cambiar(comp_id, "value", opcion["value"] if isinstance(opcion, dict) else opcion)
+
+    def secuencia(self):
+        self.elegir_opcion("bimestre-select")
+        self.cambiar("tabs-principal", "value", self.rng.choice(PESTANAS))
+        for comp_id in self.rng.sample(FILTROS, 3):
+            self.elegir_opcion(comp_id)
+        self.cambiar("tabs-principal", "value", "tab-alumno")
+        self.elegir_opcion("alumno-grado-select")
+        self.elegir_opcion("alumno-seccion-select")
+        self.elegir_opcion("alumno-curso-select")
+
+
+def iniciar_servidor_local(puerto: int):
+    """Levanta el dashboard en un hilo con el servidor multihilo de werkzeug."""
+    from werkzeug.serving import WSGIRequestHandler, make_server
+
+    from dashboard_web import server
+
+    class ManejadorSilencioso(WSGIRequestHandler):
+        def log_request(self, *args, **kwargs):
+            pass
+
+    servidor = make_server("127.0.0.1", puerto, server, threaded=True, request_handler=ManejadorSilencioso)
+    threading.Thread(target=servidor.serve_forever, daemon=True).start()
+    return servidor, f"http://127.0.0.1:{puerto}"
+
+
+def imprimir_reporte(metricas: Metricas, duracion: float):
+    total = sum(len(v) for v in metricas.latencias.values())
+    errores = sum(metricas.errores.values())
+    total_kb = sum(metricas.bytes.values()) / 1024
+    print(f"\nSolicitudes: {total}  Errores: {errores}  Duración: {duracion:.1f}s  Rendimiento: {total / duracion:.1f} req/s  Transferido: {total_kb:,.0f} KB\n")
+    print(f"{'callback':<70} {'n':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'KB prom':>8} {'err':>5}")
+    filas = []
+    for nombre, latencias in metricas.latencias.items():
+        ordenadas = sorted(latencias)
+        kb = metricas.bytes[nombre] / len(ordenadas) / 1024
+        filas.append((nombre, len(ordenadas), *(percentil(ordenadas, p) * 1000 for p in (50, 95, 99)), kb, metricas.errores[nombre]))
+    for nombre, n, p50, p95, p99, kb, err in sorted(filas, key=lambda f: f[3], reverse=True):
+        etiqueta = nombre if len(nombre) <= 70 else nombre[:67] + "..."
+        print(f"{etiqueta:<70} {n:>6} {p50:>9.1f} {p95:>9.1f} {p99:>9.1f} {kb:>8.1f} {err:>5}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Prueba de carga de los callbacks del dashboard")
+    parser.add_argument("--url", help="Servidor ya iniciado (p. ej. gunicorn). Si se omite, se levanta uno local.")
+    parser.add_argument("--puerto", type=int, default=8051, help="Puerto del servidor local")
+    parser.add_argument("--usuarios", type=int, default=10, help="Usuarios virtuales concurrentes")
+    parser.add_argument("--iteraciones", type=int, default=3, help="Secuencias por usuario tras abrir la página")
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--perfilar", metavar="TOKEN", help="Envía X-Perfilar para perfilar cada callback (ver /admin/perfiles)")
+    parser.add_argument("--token", help="Token de administrador (DASHBOARD_PERFIL_TOKEN) para leer /admin/coalescencia al final")
+    args = parser.parse_args()
+
+    servidor = None
+    url = args.url
+    if not url:
+        servidor, url = iniciar_servidor_local(args.puerto)
+
+    cliente = Cliente(url, {"X-Perfilar": args.perfilar} if args.perfilar else None)
+    dependencias = cliente.get_json("/_dash-dependencies")
+    layout = cliente.get_json("/_dash-layout")
+    metricas = Metricas()
+
+    def sesion(n: int):
+        usuario = UsuarioVirtual(cliente, dependencias, layout, metricas, random.Random(args.semilla + n))
+        usuario.abrir_pagina()
+        for _ in range(args.iteraciones):
+            usuario.secuencia()
+
+    inicio = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.usuarios) as pool:
+        list(pool.map(sesion, range(args.usuarios)))
+    imprimir_reporte(metricas, time.perf_counter() - inicio)
+    token = args.token or args.perfilar
+    try:
+        coalescencia = cliente.get_json("/admin/coalescencia", {"X-Perfilar": token} if token else None)
+        print(
+            f"\nCoalescencia: {coalescencia['calculadas']} callbacks calculados, "
+            f"{coalescencia['unidas']} llamadas idénticas unidas a un cálculo en curso"
+        )
+    except (urllib.error.URLError, OSError, ValueError):
+        pass  # sin token de administrador o con DASHBOARD_COALESCER=0
+
+    if servidor is not None:
+        servidor.shutdown()
+
+
+if __name__ == "__main__":
+    main()
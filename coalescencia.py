@@ -0,0 +1,133 @@
+import functools
+import hashlib
+import threading
+import time
+from collections import Counter
+
+from flask import Response, abort, g, jsonify, request
+
+RUTA_CALLBACKS = "/_dash-update-component"
+
+
+class _Vuelo:
+    def __init__(self):
+        self.listo = threading.Event()
+        self.resultado = None
+        self.error = None
+
+
+class Coalescedor:
+    """Une las llamadas concurrentes idénticas a un callback en un solo cálculo.
+
+    La clave es (cuerpo de la solicitud, versión de los datos): el cuerpo ya
+    identifica el callback (`output`), sus entradas y el disparador. La primera
+    solicitud calcula; las que llegan con la misma clave mientras tanto esperan
+    y reciben una copia de la misma respuesta. Solo une solicitudes de un mismo
+    proceso, así que sirve con workers de varios hilos (`gunicorn --threads`).
+
+    `version` se llama en cada solicitud; `autorizar` decide quién puede ver
+    los conteos en `/admin/coalescencia` (sin él, la ruta no se publica).
+    Además, cada `intervalo_log` segundos (0 lo desactiva) la primera solicitud
+    imprime los conteos en el log, que se ve en cualquier despliegue.
+    """
+
+    def __init__(self, version=lambda: "", autorizar=None, intervalo_log: float = 0):
+        self.version = version
+        self.autorizar = autorizar
+        self.intervalo_log = intervalo_log
+        self._proximo_log = time.monotonic() + intervalo_log
+        self._lock = threading.Lock()
+        self._en_vuelo = {}
+        self.calculadas = Counter()
+        self.unidas = Counter()
+
+    def ejecutar(self, clave, nombre: str, funcion):
+        with self._lock:
+            vuelo = self._en_vuelo.get(clave)
+            lider = vuelo is None
+            if lider:
+                vuelo = self._en_vuelo[clave] = _Vuelo()
+                self.calculadas[nombre] += 1
+            else:
+                self.unidas[nombre] += 1
+            resumen = self._resumen_para_log()
+        if resumen is not None:
+            # Con varias salidas el nombre es "..a.prop...b.prop.."; basta el primer componente
+            unidas = ", ".join(
+                f"{cb.strip('.').split('.')[0]}={c['unidas']}" for cb, c in resumen["callbacks"].items() if c["unidas"]
+            )
+            print(
+                f"[coalescencia] {resumen['calculadas']} calculadas, {resumen['unidas']} unidas"
+                f", {resumen['en_vuelo']} en vuelo" + (f" ({unidas})" if unidas else ""),
+                flush=True,
+            )
+
+        if not lider:
+            vuelo.listo.wait()
+            if vuelo.error is not None:
+                raise vuelo.error
+            return vuelo.resultado
+
+        try:
+            vuelo.resultado = funcion()
+        except BaseException as error:
+            vuelo.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._en_vuelo[clave]
+            vuelo.listo.set()
+        return vuelo.resultado
+
+    def instalar(self, server):
+        """Envuelve la vista de Dash que ejecuta los callbacks y publica los conteos."""
+        for regla in server.url_map.iter_rules():
+            if regla.rule.endswith(RUTA_CALLBACKS):
+                server.view_functions[regla.endpoint] = self._envolver(server, server.view_functions[regla.endpoint])
+        if self.autorizar is not None:
+            server.add_url_rule("/admin/coalescencia", "coalescencia", self.estado)
+
+    def _envolver(self, server, vista):
+        @functools.wraps(vista)
+        def envuelta(*args, **kwargs):
+            # Una llamada que se está perfilando (ver perfilador.py) debe calcular por sí misma
+            if g.get("perfil") is not None:
+                return vista(*args, **kwargs)
+            cuerpo = request.get_data(cache=True)
+            clave = hashlib.sha1(self.version().encode("utf-8") + b"\0" + cuerpo).hexdigest()
+            nombre = (request.get_json(silent=True) or {}).get("output", "?")
+
+            def calcular():
+                respuesta = server.make_response(vista(*args, **kwargs))
+                return respuesta.get_data(), respuesta.status_code, list(respuesta.headers.items())
+
+            datos, status, cabeceras = self.ejecutar(clave, nombre, calcular)
+            # Cada solicitud recibe su propio objeto Response (after_request puede modificarlo)
+            return Response(datos, status=status, headers=cabeceras)
+
+        return envuelta
+
+    def resumen(self) -> dict:
+        """Totales y conteos por callback; se llama con `_lock` tomado."""
+        callbacks = {
+            nombre: {"calculadas": self.calculadas[nombre], "unidas": self.unidas[nombre]}
+            for nombre in sorted(set(self.calculadas) | set(self.unidas))
+        }
+        return {
+            "calculadas": sum(self.calculadas.values()),
+            "unidas": sum(self.unidas.values()),
+            "en_vuelo": len(self._en_vuelo),
+            "callbacks": callbacks,
+        }
+
+    def _resumen_para_log(self):
+        if self.intervalo_log <= 0 or time.monotonic() < self._proximo_log:
+            return None
+        self._proximo_log = time.monotonic() + self.intervalo_log
+        return self.resumen()
+
+    def estado(self):
+        if not self.autorizar():
+            abort(403)
+        with self._lock:
+            return jsonify(self.resumen())
@@ -1,12 +1,25 @@
+import os
+import threading
 import warnings
+from functools import lru_cache
 from pathlib import Path
 
 import dash
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
 from dash import dcc, html
-from dash.dependencies import Input, Output
+from dash.dependencies import ALL, Input, Output, State
+
+from almacen import AlmacenEvaluaciones
+from coalescencia import Coalescedor
+from indice_alumnos import IndiceAlumnos
+from indice_bits import IndiceBits
+from inspect_excel import detectar_layout, fila_cursos, tabla_desde_raw
+from perfilador import Perfilador
+from tendencias import MotorTendencias, TendenciasAlmacen, clave_bimestre
 
 warnings.filterwarnings("ignore")
 
@@ -21,22 +34,89 @@ BIMESTRE_FILES = {
     "II": "DASHBOARD_II_BIMESTRE.xlsx",
     "III": "DASHBOARD_III_BIMESTRE.xlsx",
 }
+# Tablas agregadas del contexto y los campos por los que se agrupan
+AGREGADOS = {
+    "df_secundaria_comp": ["Competencia"],
+    "df_curso_comp": ["Curso", "Competencia"],
+    "df_curso_comp_grado": ["Grado", "Curso", "Competencia"],
+    "df_seccion_comp": ["Seccion", "Curso", "Competencia"],
+    "df_grado_comp": ["Grado", "Competencia"],
+    "df_seccion_comp_simple": ["Seccion", "Competencia"],
+    # Una misma sección (p. ej. RESPONSABILIDAD) existe en varios grados; la
+    # tendencia de una sección se toma de esta tabla y no de las anteriores
+    "df_grado_seccion_comp": ["Grado", "Seccion", "Curso", "Competencia"],
+}
+# Escala del puntaje ponderado (C=1 ... AD=4) usado en el mapa de calor
+NIVEL_PESOS = {"AD": 4, "A": 3, "B": 2, "C": 1}
+INDICADORES_MAPA = {
+    "AD": "% en AD",
+    "A": "% en A",
+    "B": "% en B",
+    "C": "% en C",
+    "puntaje": "Puntaje ponderado (C=1 ... AD=4)",
+}
+MAX_RANKING_RIESGO = 100
+# Modo compacto: clases CSS en lugar de estilos por celda y plantilla de
+# gráficos reducida, para respuestas más livianas en conexiones lentas.
+COMPACTO = os.environ.get("DASHBOARD_COMPACTO", "1") != "0"
+NIVEL_CLASES = {"AD": "nivel-ad", "A": "nivel-a", "B": "nivel-b", "C": "nivel-c"}
+ESTILOS_CELDA = {
+    "nro": {"padding": "8px", "border": "1px solid #ddd", "textAlign": "center", "backgroundColor": "white", "position": "sticky", "left": "0", "zIndex": "5"},
+    "alumno": {"padding": "8px", "border": "1px solid #ddd", "backgroundColor": "white", "position": "sticky", "left": "50px", "zIndex": "5", "fontSize": "13px"},
+    "texto": {"padding": "8px", "border": "1px solid #ddd", "fontSize": "13px"},
+    "nivel": {"padding": "8px", "border": "1px solid #ddd", "textAlign": "center", "fontWeight": "bold"},
+}
+# Ruta opcional de la base SQLite con el historial de evaluaciones
+DB_PATH = os.environ.get("DASHBOARD_DB")
+# Año escolar de los Excel actuales (obligatorio con almacén): cada bimestre se
+# guarda como "2025-II" para que el año siguiente no lo reemplace
+PERIODO = os.environ.get("DASHBOARD_PERIODO")
+# Bimestres del almacén que se mantienen cargados a la vez (los demás se leen al pedirlos)
+CONTEXTOS_EN_MEMORIA = int(os.environ.get("DASHBOARD_CONTEXTOS", "4"))
+# Perfilado bajo demanda de callbacks: sin token no se instala nada
+PERFIL_TOKEN = os.environ.get("DASHBOARD_PERFIL_TOKEN")
+PERFIL_DIR = Path(__file__).resolve().parent / os.environ.get("DASHBOARD_PERFILES", "perfiles")
+PERFIL_LENTO_MS = float(os.environ.get("DASHBOARD_PERFIL_LENTO_MS", "500"))
+# Une las llamadas concurrentes idénticas a un mismo callback (ver coalescencia.py)
+COALESCER = os.environ.get("DASHBOARD_COALESCER", "1") != "0"
+COALESCER_LOG = float(os.environ.get("DASHBOARD_COALESCER_LOG", "300"))
+
+
+def plantilla_ligera() -> go.layout.Template:
+    """Solo la parte de la plantilla "plotly" que usan nuestros gráficos (~0.7 KB
+    frente a ~7.5 KB), para no repetirla completa en cada figura enviada."""
+    base = pio.templates["plotly"].layout.to_plotly_json()
+    claves = ["autotypenumbers", "colorway", "font", "hovermode", "hoverlabel", "paper_bgcolor", "plot_bgcolor", "xaxis", "yaxis", "title"]
+    return go.layout.Template(
+        layout={k: base[k] for k in claves if k in base},
+        data={
+            "bar": [go.Bar(marker={"line": {"color": "#E5ECF6", "width": 0.5}})],
+            "heatmap": [go.Heatmap(colorbar={"outlinewidth": 0, "ticks": ""})],
+        },
+    )
+
+
+if COMPACTO:
+    pio.templates["ligera"] = plantilla_ligera()
+    pio.templates.default = "ligera"
 
 
 def resolver_path(nombre_archivo: str) -> Path:
     return Path(__file__).resolve().parent / nombre_archivo
 
 
-def cargar_bimestre(nombre_archivo: str) -> dict:
+def leer_bimestre(nombre_archivo: str):
     path = resolver_path(nombre_archivo)
     if not path.exists():
         raise FileNotFoundError(f"No existe el archivo: {nombre_archivo}")
 
+    # Una sola lectura: las filas de cursos y encabezados se detectan sobre ella
     raw = pd.read_excel(path, sheet_name="DATA", header=None)
-    curso_row = raw.iloc[1]
-
-    # La fila 3 (índice 3) contiene los encabezados reales
-    df = pd.read_excel(path, sheet_name="DATA", header=3)
+    layout = detectar_layout(raw)
+    if layout["faltantes_obligatorias"]:
+        raise ValueError(f"{nombre_archivo}: faltan las columnas {', '.join(layout['faltantes_obligatorias'])}")
+    curso_row = fila_cursos(raw, layout)
+    df = tabla_desde_raw(raw, layout["fila_encabezados"])
     df = df.rename(
         columns={
             "nro": "alumno_id",
@@ -68,8 +148,10 @@ def cargar_bimestre(nombre_archivo: str) -> dict:
 
     comp_to_curso = {info["competencia"]: info["curso"] for info in mapeo_columnas.values()}
 
-    df_long = df.melt(
-        id_vars=["grado", "seccion", "alumno_id", "nombre_alumno"],
+    # `fila` es la posición del alumno en `df`; el nro puede repetirse
+    df = df.reset_index(drop=True)
+    df_long = df.assign(fila=np.arange(len(df))).melt(
+        id_vars=["grado", "seccion", "alumno_id", "nombre_alumno", "fila"],
         value_vars=compet_cols,
         var_name="Competencia",
         value_name="Nivel",
@@ -80,6 +162,11 @@ def cargar_bimestre(nombre_archivo: str) -> dict:
     df_long = df_long[df_long["Nivel"] != "-"]
     df_long["Grado"] = df_long["grado"]
     df_long["Seccion"] = df_long["seccion"]
+    return df, df_long, mapeo_columnas
+
+
+def cargar_bimestre(nombre_archivo: str) -> dict:
+    df, df_long, mapeo_columnas = leer_bimestre(nombre_archivo)
 
     def agg(campos):
         tabla = df_long.groupby(campos + ["Nivel"]).size().reset_index(name="Cantidad")
@@ -87,13 +174,6 @@ def cargar_bimestre(nombre_archivo: str) -> dict:
         tabla["Porcentaje"] = (tabla["Cantidad"] / tabla["Total"] * 100).round(1)
         return tabla.drop(columns="Total")
 
-    df_secundaria_comp = agg(["Competencia"])
-    df_curso_comp = agg(["Curso", "Competencia"])
-    df_curso_comp_grado = agg(["Grado", "Curso", "Competencia"])
-    df_seccion_comp = agg(["Seccion", "Curso", "Competencia"])
-    df_grado_comp = agg(["Grado", "Competencia"])
-    df_seccion_comp_simple = agg(["Seccion", "Competencia"])
-
     total_evaluaciones = len(df_long)
     total_cursos = df_long["Curso"].nunique()
     total_competencias = df_long["Competencia"].nunique()
@@ -103,12 +183,7 @@ def cargar_bimestre(nombre_archivo: str) -> dict:
 
     context = {
         "df_data": df,
-        "df_secundaria_comp": df_secundaria_comp,
-        "df_curso_comp": df_curso_comp,
-        "df_curso_comp_grado": df_curso_comp_grado,
-        "df_seccion_comp": df_seccion_comp,
-        "df_grado_comp": df_grado_comp,
-        "df_seccion_comp_simple": df_seccion_comp_simple,
+        **{nombre: agg(campos) for nombre, campos in AGREGADOS.items()},
         "df_estadisticas": df.rename(columns={"grado": "Grado", "seccion": "Seccion"}),
         "mapeo_columnas": mapeo_columnas,
         "total_evaluaciones": total_evaluaciones,
@@ -121,39 +196,453 @@ def cargar_bimestre(nombre_archivo: str) -> dict:
     return context
 
 
+def sincronizar_almacen(almacen: AlmacenEvaluaciones, bimestre: str, nombre_archivo: str):
+    """Vuelca el bimestre al almacén solo si el Excel cambió desde la última carga."""
+    path = resolver_path(nombre_archivo)
+    if not path.exists():
+        raise FileNotFoundError(f"No existe el archivo: {nombre_archivo}")
+    mtime = path.stat().st_mtime
+    if almacen.vigente(bimestre, nombre_archivo, mtime):
+        return
+    anterior = almacen.guardado_como(nombre_archivo, mtime)
+    if anterior is not None:
+        # El mismo Excel sin cambios no se duplica como bimestre de otro año
+        raise ValueError(f"{nombre_archivo} ya está guardado como {anterior}; revise DASHBOARD_PERIODO")
+    df, df_long, mapeo_columnas = leer_bimestre(nombre_archivo)
+    almacen.guardar(bimestre, nombre_archivo, mtime, df, df_long, mapeo_columnas)
+
+
+ALMACEN = AlmacenEvaluaciones(DB_PATH) if DB_PATH else None
+if ALMACEN is not None and not PERIODO:
+    raise RuntimeError("Con DASHBOARD_DB hay que indicar el año de los Excel en DASHBOARD_PERIODO (p. ej. 2025)")
+
 CONTEXTOS_BIMESTRE = {}
 for clave, archivo in BIMESTRE_FILES.items():
     try:
-        CONTEXTOS_BIMESTRE[clave] = cargar_bimestre(archivo)
+        if ALMACEN is None:
+            CONTEXTOS_BIMESTRE[clave] = cargar_bimestre(archivo)
+        else:
+            if clave in ALMACEN.bimestres():
+                # Almacenes creados antes de que las claves llevaran el año
+                ALMACEN.renombrar(clave, f"{PERIODO}-{clave}")
+            sincronizar_almacen(ALMACEN, f"{PERIODO}-{clave}", archivo)
     except FileNotFoundError:
         continue
+    except ValueError as error:
+        # Un libro mal formado no debe impedir cargar los demás bimestres
+        print(f"[!] Se omite el bimestre {clave}: {error}")
+        continue
 
-if not CONTEXTOS_BIMESTRE:
+# Con almacén se listan también los bimestres de años anteriores cuyo Excel ya
+# no está, pero su contexto solo se carga cuando un callback lo pide
+BIMESTRES = sorted(CONTEXTOS_BIMESTRE if ALMACEN is None else ALMACEN.bimestres(), key=clave_bimestre)
+
+if not BIMESTRES:
     raise RuntimeError("No hay archivos de bimestre disponibles")
 
-DEFAULT_BIMESTRE = "III" if "III" in CONTEXTOS_BIMESTRE else next(iter(CONTEXTOS_BIMESTRE))
+DEFAULT_BIMESTRE = BIMESTRES[-1]
 
 
-def ctx_bimestre(bimestre: str) -> dict:
-    return CONTEXTOS_BIMESTRE.get(bimestre, CONTEXTOS_BIMESTRE[DEFAULT_BIMESTRE])
+def codificar_niveles(df_data: pd.DataFrame, mapeo_columnas: dict) -> np.ndarray:
+    """Matriz int8 alumnos x competencias con el peso de cada nivel (C=1 ... AD=4, 0 = sin nota)."""
+    columnas = df_data.iloc[:, sorted(mapeo_columnas)]
+    codigos = columnas.apply(lambda col: col.astype(str).str.strip().map(NIVEL_PESOS))
+    return codigos.fillna(0).to_numpy(dtype=np.int8)
+
+
+def indexar_bits(ctx: dict) -> IndiceBits:
+    """Bitsets por grado, sección, curso, competencia y nivel sobre la matriz de niveles."""
+    columnas = [ctx["mapeo_columnas"][idx] for idx in sorted(ctx["mapeo_columnas"])]
+    return IndiceBits(
+        ctx["matriz_niveles"],
+        por_alumno={"Grado": ctx["df_data"]["grado"].to_numpy(), "Seccion": ctx["df_data"]["seccion"].to_numpy()},
+        por_columna={"Curso": [c["curso"] for c in columnas], "Competencia": [c["competencia"] for c in columnas]},
+        niveles=NIVEL_PESOS,
+    )
+
+
+def preparar_contexto(ctx: dict) -> dict:
+    ctx["matriz_niveles"] = codificar_niveles(ctx["df_data"], ctx["mapeo_columnas"])
+    ctx["indice_bits"] = indexar_bits(ctx)
+    return ctx
+
+
+for ctx in CONTEXTOS_BIMESTRE.values():
+    preparar_contexto(ctx)
+
 
+def padron(bimestre: str) -> pd.DataFrame:
+    """Nombre, grado y sección de cada fila de `df_data`, sin cargar el contexto del almacén."""
+    if ALMACEN is None:
+        return CONTEXTOS_BIMESTRE[bimestre]["df_data"]
+    return ALMACEN.alumnos(bimestre)
+
+
+INDICE_ALUMNOS = IndiceAlumnos()
+SECCIONES_POR_GRADO = {}
+for clave in BIMESTRES:
+    alumnos_bimestre = padron(clave)
+    INDICE_ALUMNOS.agregar_bimestre(clave, alumnos_bimestre)
+    for grado, seccion in alumnos_bimestre[["grado", "seccion"]].drop_duplicates().itertuples(index=False):
+        SECCIONES_POR_GRADO.setdefault(grado, set()).add(seccion)
+
+
+def ranking_riesgo(bimestre: str, grado=None, seccion=None, n: int = 10, por_seccion: bool = False) -> pd.DataFrame:
+    """Alumnos con más niveles C (y luego B) sobre la matriz de niveles del bimestre.
+
+    Los conteos salen de reducciones por fila de la matriz int8. Sin agrupar,
+    `partition` da el riesgo del N-ésimo alumno y solo se ordenan los que lo
+    igualan o superan (con el desempate por puntaje); con `por_seccion` se
+    devuelve el top-N de cada grado/sección. N se acota a 1..MAX_RANKING_RIESGO.
+    """
+    n = min(max(1, int(n)), MAX_RANKING_RIESGO)
+    ctx = ctx_bimestre(bimestre)
+    df_data = ctx["df_data"]
+    matriz = ctx["matriz_niveles"]
+
+    mascara = np.ones(len(df_data), dtype=bool)
+    if grado:
+        mascara &= (df_data["grado"] == grado).to_numpy()
+    if seccion:
+        mascara &= (df_data["seccion"] == seccion).to_numpy()
+    filas = np.flatnonzero(mascara)
+    sub = matriz[filas]
+
+    cantidad_c = (sub == NIVEL_PESOS["C"]).sum(axis=1)
+    cantidad_b = (sub == NIVEL_PESOS["B"]).sum(axis=1)
+    evaluadas = (sub > 0).sum(axis=1)
+    puntaje = np.divide(sub.sum(axis=1, dtype=np.int32), evaluadas, out=np.zeros(len(filas)), where=evaluadas > 0)
+    # Clave de riesgo: primero cantidad de C, luego de B, luego menor puntaje
+    riesgo = cantidad_c * (matriz.shape[1] + 1) + cantidad_b
+    hay_riesgo = riesgo > 0
+
+    if por_seccion:
+        grupos = (df_data["grado"] + " - " + df_data["seccion"]).to_numpy()[filas]
+        orden = np.lexsort((puntaje, -riesgo, grupos))
+        inicio_grupo = np.r_[0, np.flatnonzero(grupos[orden][1:] != grupos[orden][:-1]) + 1]
+        rango = np.arange(len(orden)) - np.repeat(inicio_grupo, np.diff(np.r_[inicio_grupo, len(orden)]))
+        elegidos = orden[(rango < n) & hay_riesgo[orden]]
+    else:
+        candidatos = np.flatnonzero(hay_riesgo)
+        if len(candidatos) > n:
+            # Umbral = n-ésimo mayor riesgo; los empatados en el umbral se
+            # conservan todos para que el puntaje decida entre ellos
+            corte = len(candidatos) - n
+            umbral = np.partition(riesgo[candidatos], corte)[corte]
+            candidatos = candidatos[riesgo[candidatos] >= umbral]
+        elegidos = candidatos[np.lexsort((puntaje[candidatos], -riesgo[candidatos]))][:n]
+
+    alumnos = df_data.iloc[filas[elegidos]]
+    return pd.DataFrame(
+        {
+            "Nro": alumnos["alumno_id"].to_numpy(),
+            "Alumno": alumnos["nombre_alumno"].to_numpy(),
+            "Grado": alumnos["grado"].to_numpy(),
+            "Seccion": alumnos["seccion"].to_numpy(),
+            "C": cantidad_c[elegidos],
+            "B": cantidad_b[elegidos],
+            "Evaluadas": evaluadas[elegidos],
+            "Puntaje": puntaje[elegidos].round(2),
+        }
+    )
+
+
+def bimestre_valido(bimestre: str) -> str:
+    return bimestre if bimestre in BIMESTRES else DEFAULT_BIMESTRE
+
+
+CARGA_CONTEXTO = threading.Lock()
+
+
+@lru_cache(maxsize=CONTEXTOS_EN_MEMORIA)
+def contexto_almacen(bimestre: str) -> dict:
+    return preparar_contexto(ALMACEN.contexto(bimestre))
+
+
+def ctx_bimestre(bimestre: str) -> dict:
+    bimestre = bimestre_valido(bimestre)
+    if ALMACEN is None:
+        return CONTEXTOS_BIMESTRE[bimestre]
+    # Un solo hilo lee del almacén a la vez: varias solicitudes al mismo
+    # bimestre no lo cargan por duplicado
+    with CARGA_CONTEXTO:
+        return contexto_almacen(bimestre)
+
+
+def consultar_agregado(bimestre: str, tabla: str, **filtros) -> pd.DataFrame:
+    """Filas de la tabla agregada `tabla` que cumplen `filtros` (p. ej. Grado="PRIMERO")."""
+    if ALMACEN is not None:
+        return ALMACEN.agregado(bimestre_valido(bimestre), AGREGADOS[tabla], filtros)
+    df = ctx_bimestre(bimestre)[tabla]
+    for campo, valor in filtros.items():
+        df = df[df[campo] == valor]
+    return df
+
+
+def valores_agregado(bimestre: str, tabla: str, campo: str, **filtros) -> list:
+    if ALMACEN is not None:
+        return ALMACEN.valores(bimestre_valido(bimestre), campo, filtros)
+    return sorted(consultar_agregado(bimestre, tabla, **filtros)[campo].unique())
+
+
+# Eje de tiempo: en memoria cada contexto aporta sus tablas agregadas una sola
+# vez y los gráficos de tendencia solo filtran lo ya calculado; con almacén
+# cada gráfico consulta SQLite para no cargar el historial completo.
+if ALMACEN is None:
+    TENDENCIAS = MotorTendencias()
+    for clave in BIMESTRES:
+        TENDENCIAS.agregar(clave, {tuple(campos): consultar_agregado(clave, tabla) for tabla, campos in AGREGADOS.items()})
+else:
+    TENDENCIAS = TendenciasAlmacen(ALMACEN, BIMESTRES)
 
 ctx_base = ctx_bimestre(DEFAULT_BIMESTRE)
 
 app = dash.Dash(__name__, suppress_callback_exceptions=True)
 server = app.server
+PERFILADOR = Perfilador(PERFIL_DIR, PERFIL_TOKEN, PERFIL_LENTO_MS) if PERFIL_TOKEN else None
+if PERFILADOR is not None:
+    PERFILADOR.instalar(server)
+
+
+def version_datos() -> str:
+    """Versión de los datos para la clave de coalescencia: con almacén, su tabla
+    de fuentes; en memoria, la fecha de modificación de cada Excel."""
+    if ALMACEN is not None:
+        return ALMACEN.version()
+    paths = [resolver_path(archivo) for archivo in BIMESTRE_FILES.values()]
+    return "|".join(f"{path.name}:{path.stat().st_mtime}" for path in paths if path.exists())
+
+
+if COALESCER:
+    # Los conteos van al log cada COALESCER_LOG segundos; /admin/coalescencia
+    # pide el mismo token que los perfiles
+    Coalescedor(version_datos, PERFILADOR.autorizado if PERFILADOR is not None else None, COALESCER_LOG).instalar(server)
 
 # Valores iniciales
-cursos_base = sorted(ctx_base["df_curso_comp"]["Curso"].unique())
+cursos_base = valores_agregado(DEFAULT_BIMESTRE, "df_curso_comp", "Curso")
 curso_default = cursos_base[0] if cursos_base else None
-competencias_sec = sorted(ctx_base["df_secundaria_comp"]["Competencia"].unique())
+competencias_sec = valores_agregado(DEFAULT_BIMESTRE, "df_secundaria_comp", "Competencia")
 comp_sec_default = competencias_sec[0] if competencias_sec else None
-grado_base = sorted(ctx_base["df_curso_comp_grado"]["Grado"].unique())
-seccion_base = sorted(ctx_base["df_seccion_comp"]["Seccion"].unique())
-comp_grado_base = sorted(ctx_base["df_grado_comp"]["Competencia"].unique())
-comp_seccion_base = sorted(ctx_base["df_seccion_comp_simple"]["Competencia"].unique())
+grado_base = valores_agregado(DEFAULT_BIMESTRE, "df_curso_comp_grado", "Grado")
+seccion_base = valores_agregado(DEFAULT_BIMESTRE, "df_seccion_comp", "Seccion")
+comp_grado_base = valores_agregado(DEFAULT_BIMESTRE, "df_grado_comp", "Competencia")
+comp_seccion_base = valores_agregado(DEFAULT_BIMESTRE, "df_seccion_comp_simple", "Competencia")
 alumno_grados = sorted(ctx_base["df_estadisticas"]["Grado"].unique())
 
+
+# Contenido de cada pestaña. Solo la pestaña inicial va en el layout; las demás
+# se construyen la primera vez que se seleccionan (ver `renderizar_tab`).
+def layout_tab_secundaria():
+    return [
+        html.H2("Desempeño por Competencia", style={"color": "#2c3e50", "marginTop": 20}),
+        html.Div([
+            html.Label("Competencia", style={"fontWeight": "bold"}),
+            dcc.Dropdown(id="competencia-secundaria", options=[{"label": c, "value": c} for c in competencias_sec], value=comp_sec_default),
+        ], style={"marginBottom": 20}),
+        html.Div(id="grafico-secundaria"),
+        html.Hr(),
+        html.H2("Porcentaje por Curso y Competencia", style={"color": "#2c3e50", "marginTop": 20}),
+        html.Div([
+            html.Div([
+                html.Label("Curso", style={"fontWeight": "bold"}),
+                dcc.Dropdown(id="curso-select", options=[{"label": c, "value": c} for c in cursos_base], value=curso_default),
+            ], style={"width": "48%", "display": "inline-block"}),
+            html.Div([
+                html.Label("Competencia", style={"fontWeight": "bold"}),
+                dcc.Dropdown(id="competencia-curso-select"),
+            ], style={"width": "48%", "display": "inline-block", "marginLeft": "4%"}),
+        ]),
+        html.Div(id="grafico-curso", style={"marginTop": 20}),
+    ]
+
+
+def layout_tab_curso():
+    return [
+        html.H2("Porcentaje por Grado, Curso y Competencia", style={"color": "#2c3e50", "marginTop": 20}),
+        html.Div([
+            html.Div([
+                html.Label("Grado", style={"fontWeight": "bold"}),
+                dcc.Dropdown(id="filtro-curso-grado", options=[{"label": g, "value": g} for g in grado_base], value=grado_base[0] if grado_base else None),
+            ], style={"width": "32%", "display": "inline-block"}),
+            html.Div([
+                html.Label("Curso", style={"fontWeight": "bold"}),
+                dcc.Dropdown(id="filtro-curso-curso"),
+            ], style={"width": "32%", "display": "inline-block", "marginLeft": "2%"}),
+            html.Div([
+                html.Label("Competencia", style={"fontWeight": "bold"}),
+                dcc.Dropdown(id="filtro-curso-competencia"),
+            ], style={"width": "32%", "display": "inline-block", "marginLeft": "2%"}),
+        ]),
+        html.Div(id="grafico-curso-grado", style={"marginTop": 20}),
+        html.Hr(style={"margin": "40px 0"}),
+        html.H2("Comparación entre Grados", style={"color": "#2c3e50"}),
+        html.Div([
+            html.Label("Seleccionar Competencia", style={"fontWeight": "bold"}),
+            dcc.Dropdown(id="competencia-comparacion-grado", options=[{"label": c, "value": c} for c in comp_grado_base], value=comp_grado_base[0] if comp_grado_base else None, style={"marginBottom": 20}),
+        ]),
+        html.Div(id="grafico-comparacion-grados"),
+    ]
+
+
+def layout_tab_seccion():
+    return [
+        html.H2("Mapa de Calor: Secciones × Competencias", style={"color": "#2c3e50", "marginTop": 20}),
+        html.Div([
+            html.Div([
+                html.Label("Indicador", style={"fontWeight": "bold"}),
+                dcc.Dropdown(id="mapa-indicador", options=[{"label": v, "value": k} for k, v in INDICADORES_MAPA.items()], value="C", clearable=False),
+            ], style={"width": "48%", "display": "inline-block"}),
+            html.Div([
+                html.Label("Curso (vacío = todos)", style={"fontWeight": "bold"}),
+                dcc.Dropdown(id="mapa-curso", options=[{"label": c, "value": c} for c in cursos_base], value=None, placeholder="Todos los cursos"),
+            ], style={"width": "48%", "display": "inline-block", "marginLeft": "4%"}),
+        ]),
+        html.Div(id="grafico-mapa-secciones", style={"marginTop": 20}),
+        html.Hr(style={"margin": "40px 0"}),
+        html.H2("Porcentaje por Sección, Curso y Competencia", style={"color": "#2c3e50"}),
+        html.Div([
+            html.Div([
+                html.Label("Sección", style={"fontWeight": "bold"}),
+                dcc.Dropdown(id="filtro-seccion-seccion", options=[{"label": s, "value": s} for s in seccion_base], value=seccion_base[0] if seccion_base else None),
+            ], style={"width": "32%", "display": "inline-block"}),
+            html.Div([
+                html.Label("Curso", style={"fontWeight": "bold"}),
+                dcc.Dropdown(id="filtro-seccion-curso"),
+            ], style={"width": "32%", "display": "inline-block", "marginLeft": "2%"}),
+            html.Div([
+                html.Label("Competencia", style={"fontWeight": "bold"}),
+                dcc.Dropdown(id="filtro-seccion-competencia"),
+            ], style={"width": "32%", "display": "inline-block", "marginLeft": "2%"}),
+        ]),
+        html.Div(id="grafico-seccion-filtros", style={"marginTop": 20}),
+        html.Hr(style={"margin": "40px 0"}),
+        html.H2("Comparación entre Secciones", style={"color": "#2c3e50"}),
+        html.Div([
+            html.Label("Seleccionar Competencia", style={"fontWeight": "bold"}),
+            dcc.Dropdown(id="competencia-comparacion-seccion", options=[{"label": c, "value": c} for c in comp_seccion_base], value=comp_seccion_base[0] if comp_seccion_base else None, style={"marginBottom": 20}),
+        ]),
+        html.Div(id="grafico-comparacion-secciones"),
+        html.Hr(style={"margin": "40px 0"}),
+        html.H2("Detalle por Sección", style={"color": "#2c3e50"}),
+        html.Div([
+            html.Div([
+                html.Label("Sección", style={"fontWeight": "bold"}),
+                dcc.Dropdown(id="seccion-select", options=[{"label": s, "value": s} for s in seccion_base], value=seccion_base[0] if seccion_base else None),
+            ], style={"width": "48%", "display": "inline-block"}),
+            html.Div([
+                html.Label("Competencia", style={"fontWeight": "bold"}),
+                dcc.Dropdown(id="competencia-seccion-select"),
+            ], style={"width": "48%", "display": "inline-block", "marginLeft": "4%"}),
+        ]),
+        html.Div(id="grafico-seccion", style={"marginTop": 20}),
+    ]
+
+
+def layout_tab_alumno():
+    return [
+        html.H2("Buscar Alumno", style={"color": "#2c3e50", "marginTop": 20}),
+        html.P("Escriba parte del nombre o apellido (sin importar tildes ni mayúsculas) para ver su perfil en todos los bimestres", style={"color": "#7f8c8d", "marginBottom": 20}),
+        dcc.Input(id="buscar-alumno", type="text", placeholder="Ej. chumbe antony", debounce=False, style={"width": "100%", "padding": "8px", "fontSize": "14px", "border": "1px solid #8a8886", "borderRadius": "2px"}),
+        html.Div(id="resultados-busqueda-alumno", style={"marginTop": 10}),
+        html.Div(id="perfil-alumno", style={"marginTop": 20}),
+        html.Hr(style={"margin": "40px 0"}),
+        html.H2("Listado de Alumnos", style={"color": "#2c3e50"}),
+        html.P("Seleccione Grado, Sección y Curso para ver el listado de estudiantes y sus calificaciones", style={"color": "#7f8c8d", "marginBottom": 20}),
+        html.Div([
+            html.Div([
+                html.Label("Grado", style={"fontWeight": "bold"}),
+                dcc.Dropdown(id="alumno-grado-select", options=[{"label": g, "value": g} for g in alumno_grados], value=alumno_grados[0] if alumno_grados else None),
+            ], style={"width": "31%", "display": "inline-block"}),
+            html.Div([
+                html.Label("Sección", style={"fontWeight": "bold"}),
+                dcc.Dropdown(id="alumno-seccion-select"),
+            ], style={"width": "31%", "display": "inline-block", "marginLeft": "3%"}),
+            html.Div([
+                html.Label("Curso", style={"fontWeight": "bold"}),
+                dcc.Dropdown(id="alumno-curso-select"),
+            ], style={"width": "31%", "display": "inline-block", "marginLeft": "3%"}),
+        ]),
+        html.Div(id="tabla-alumnos", style={"marginTop": 30}),
+    ]
+
+
+def layout_tab_riesgo():
+    return [
+        html.H2("Alumnos en Riesgo", style={"color": "#2c3e50", "marginTop": 20}),
+        html.P("Alumnos con más competencias en C y luego en B. Deje Grado o Sección vacíos para ver todo el colegio.", style={"color": "#7f8c8d", "marginBottom": 20}),
+        html.Div([
+            html.Div([
+                html.Label("Grado", style={"fontWeight": "bold"}),
+                dcc.Dropdown(id="riesgo-grado-select", options=[{"label": g, "value": g} for g in alumno_grados], placeholder="Todos los grados"),
+            ], style={"width": "31%", "display": "inline-block"}),
+            html.Div([
+                html.Label("Sección", style={"fontWeight": "bold"}),
+                dcc.Dropdown(id="riesgo-seccion-select", placeholder="Todas las secciones"),
+            ], style={"width": "31%", "display": "inline-block", "marginLeft": "3%"}),
+            html.Div([
+                html.Label("Cantidad de alumnos", style={"fontWeight": "bold"}),
+                dcc.Input(id="riesgo-cantidad", type="number", min=1, max=MAX_RANKING_RIESGO, step=1, value=10, debounce=True, style={"width": "100%", "padding": "6px"}),
+            ], style={"width": "31%", "display": "inline-block", "marginLeft": "3%", "verticalAlign": "top"}),
+        ]),
+        dcc.Checklist(id="riesgo-por-seccion", options=[{"label": " Mostrar el top por cada sección", "value": "si"}], value=[], style={"marginTop": 10}),
+        html.Div(id="tabla-riesgo", style={"marginTop": 30}),
+    ]
+
+
+def layout_tab_tendencias():
+    return [
+        html.H2("Evolución por Bimestre", style={"color": "#2c3e50", "marginTop": 20}),
+        html.P("Porcentaje de cada nivel en todos los bimestres cargados. Deje los filtros vacíos para ver todo el colegio.", style={"color": "#7f8c8d", "marginBottom": 20}),
+        html.Div([
+            html.Div([
+                html.Label("Grado", style={"fontWeight": "bold"}),
+                dcc.Dropdown(id="tendencia-grado-select", options=[{"label": g, "value": g} for g in TENDENCIAS.valores("Grado")], placeholder="Todos los grados"),
+            ], style={"width": "22%", "display": "inline-block"}),
+            html.Div([
+                html.Label("Sección", style={"fontWeight": "bold"}),
+                dcc.Dropdown(id="tendencia-seccion-select", placeholder="Todas las secciones"),
+            ], style={"width": "22%", "display": "inline-block", "marginLeft": "4%"}),
+            html.Div([
+                html.Label("Curso", style={"fontWeight": "bold"}),
+                dcc.Dropdown(id="tendencia-curso-select", options=[{"label": c, "value": c} for c in TENDENCIAS.valores("Curso")], placeholder="Todos los cursos"),
+            ], style={"width": "22%", "display": "inline-block", "marginLeft": "4%"}),
+            html.Div([
+                html.Label("Competencia", style={"fontWeight": "bold"}),
+                dcc.Dropdown(id="tendencia-competencia-select", placeholder="Todas las competencias"),
+            ], style={"width": "22%", "display": "inline-block", "marginLeft": "4%"}),
+        ]),
+        html.Div(id="grafico-tendencia", style={"marginTop": 30}),
+    ]
+
+
+def layout_tab_consulta():
+    return [
+        html.H2("Consulta por Varios Grados y Secciones", style={"color": "#2c3e50", "marginTop": 20}),
+        html.P("Elija uno o más valores en cada filtro (p. ej. CUARTO y QUINTO, tres secciones, MATEMATICA). Un filtro vacío incluye todo.", style={"color": "#7f8c8d", "marginBottom": 20}),
+        html.Div([
+            html.Div([
+                html.Label("Grados", style={"fontWeight": "bold"}),
+                dcc.Dropdown(id="consulta-grados", options=[{"label": g, "value": g} for g in alumno_grados], value=[], multi=True, placeholder="Todos los grados"),
+            ], style={"width": "48%", "display": "inline-block", "verticalAlign": "top"}),
+            html.Div([
+                html.Label("Secciones", style={"fontWeight": "bold"}),
+                dcc.Dropdown(id="consulta-secciones", value=[], multi=True, placeholder="Todas las secciones"),
+            ], style={"width": "48%", "display": "inline-block", "marginLeft": "4%", "verticalAlign": "top"}),
+        ], style={"marginBottom": 15}),
+        html.Div([
+            html.Div([
+                html.Label("Cursos", style={"fontWeight": "bold"}),
+                dcc.Dropdown(id="consulta-cursos", options=[{"label": c, "value": c} for c in cursos_base], value=[], multi=True, placeholder="Todos los cursos"),
+            ], style={"width": "48%", "display": "inline-block", "verticalAlign": "top"}),
+            html.Div([
+                html.Label("Competencias", style={"fontWeight": "bold"}),
+                dcc.Dropdown(id="consulta-competencias", value=[], multi=True, placeholder="Todas las competencias"),
+            ], style={"width": "48%", "display": "inline-block", "marginLeft": "4%", "verticalAlign": "top"}),
+        ]),
+        html.Div(id="grafico-consulta", style={"marginTop": 30}),
+    ]
+
+
 app.layout = html.Div(
     [
         html.Div(
@@ -179,7 +668,7 @@ app.layout = html.Div(
                         html.Label("Bimestre", style={"color": "#ffffff", "fontWeight": "bold", "marginRight": "10px"}),
                         dcc.Dropdown(
                             id="bimestre-select",
-                            options=[{"label": f"Bimestre {k}", "value": k} for k in sorted(CONTEXTOS_BIMESTRE.keys())],
+                            options=[{"label": f"Bimestre {k}", "value": k} for k in TENDENCIAS.bimestres],
                             value=DEFAULT_BIMESTRE,
                             clearable=False,
                             style={"minWidth": "200px", "color": "#000"},
@@ -198,6 +687,7 @@ app.layout = html.Div(
             },
         ),
         html.Div(id="metricas-dinamicas", style={"display": "flex", "flexWrap": "wrap", "marginBottom": 30, "gap": "10px"}),
+        dcc.Store(id="tabs-renderizadas", storage_type="memory", data=["tab-secundaria"]),
         dcc.Tabs(
             id="tabs-principal",
             value="tab-secundaria",
@@ -205,125 +695,37 @@ app.layout = html.Div(
                 dcc.Tab(
                     label="📚 1. Nivel Secundaria",
                     value="tab-secundaria",
-                    children=
-                    html.Div([
-                        html.H2("Desempeño por Competencia", style={"color": "#2c3e50", "marginTop": 20}),
-                        html.Div([
-                            html.Label("Competencia", style={"fontWeight": "bold"}),
-                            dcc.Dropdown(id="competencia-secundaria", options=[{"label": c, "value": c} for c in competencias_sec], value=comp_sec_default),
-                        ], style={"marginBottom": 20}),
-                        html.Div(id="grafico-secundaria"),
-                        html.Hr(),
-                        html.H2("Porcentaje por Curso y Competencia", style={"color": "#2c3e50", "marginTop": 20}),
-                        html.Div([
-                            html.Div([
-                                html.Label("Curso", style={"fontWeight": "bold"}),
-                                dcc.Dropdown(id="curso-select", options=[{"label": c, "value": c} for c in cursos_base], value=curso_default),
-                            ], style={"width": "48%", "display": "inline-block"}),
-                            html.Div([
-                                html.Label("Competencia", style={"fontWeight": "bold"}),
-                                dcc.Dropdown(id="competencia-curso-select"),
-                            ], style={"width": "48%", "display": "inline-block", "marginLeft": "4%"}),
-                        ]),
-                        html.Div(id="grafico-curso", style={"marginTop": 20}),
-                    ], style={"padding": 20}),
+                    children=html.Div(layout_tab_secundaria(), id="contenido-tab-secundaria", style={"padding": 20}),
                 ),
                 dcc.Tab(
                     label="🎓 2. Por Curso",
                     value="tab-curso",
-                    children=
-                    html.Div([
-                        html.H2("Porcentaje por Grado, Curso y Competencia", style={"color": "#2c3e50", "marginTop": 20}),
-                        html.Div([
-                            html.Div([
-                                html.Label("Grado", style={"fontWeight": "bold"}),
-                                dcc.Dropdown(id="filtro-curso-grado", options=[{"label": g, "value": g} for g in grado_base], value=grado_base[0] if grado_base else None),
-                            ], style={"width": "32%", "display": "inline-block"}),
-                            html.Div([
-                                html.Label("Curso", style={"fontWeight": "bold"}),
-                                dcc.Dropdown(id="filtro-curso-curso"),
-                            ], style={"width": "32%", "display": "inline-block", "marginLeft": "2%"}),
-                            html.Div([
-                                html.Label("Competencia", style={"fontWeight": "bold"}),
-                                dcc.Dropdown(id="filtro-curso-competencia"),
-                            ], style={"width": "32%", "display": "inline-block", "marginLeft": "2%"}),
-                        ]),
-                        html.Div(id="grafico-curso-grado", style={"marginTop": 20}),
-                        html.Hr(style={"margin": "40px 0"}),
-                        html.H2("Comparación entre Grados", style={"color": "#2c3e50"}),
-                        html.Div([
-                            html.Label("Seleccionar Competencia", style={"fontWeight": "bold"}),
-                            dcc.Dropdown(id="competencia-comparacion-grado", options=[{"label": c, "value": c} for c in comp_grado_base], value=comp_grado_base[0] if comp_grado_base else None, style={"marginBottom": 20}),
-                        ]),
-                        html.Div(id="grafico-comparacion-grados"),
-                    ], style={"padding": 20}),
+                    children=html.Div(id="contenido-tab-curso", style={"padding": 20}),
                 ),
                 dcc.Tab(
                     label="👥 3. Por Sección",
                     value="tab-seccion",
-                    children=
-                    html.Div([
-                        html.H2("Porcentaje por Sección, Curso y Competencia", style={"color": "#2c3e50", "marginTop": 20}),
-                        html.Div([
-                            html.Div([
-                                html.Label("Sección", style={"fontWeight": "bold"}),
-                                dcc.Dropdown(id="filtro-seccion-seccion", options=[{"label": s, "value": s} for s in seccion_base], value=seccion_base[0] if seccion_base else None),
-                            ], style={"width": "32%", "display": "inline-block"}),
-                            html.Div([
-                                html.Label("Curso", style={"fontWeight": "bold"}),
-                                dcc.Dropdown(id="filtro-seccion-curso"),
-                            ], style={"width": "32%", "display": "inline-block", "marginLeft": "2%"}),
-                            html.Div([
-                                html.Label("Competencia", style={"fontWeight": "bold"}),
-                                dcc.Dropdown(id="filtro-seccion-competencia"),
-                            ], style={"width": "32%", "display": "inline-block", "marginLeft": "2%"}),
-                        ]),
-                        html.Div(id="grafico-seccion-filtros", style={"marginTop": 20}),
-                        html.Hr(style={"margin": "40px 0"}),
-                        html.H2("Comparación entre Secciones", style={"color": "#2c3e50"}),
-                        html.Div([
-                            html.Label("Seleccionar Competencia", style={"fontWeight": "bold"}),
-                            dcc.Dropdown(id="competencia-comparacion-seccion", options=[{"label": c, "value": c} for c in comp_seccion_base], value=comp_seccion_base[0] if comp_seccion_base else None, style={"marginBottom": 20}),
-                        ]),
-                        html.Div(id="grafico-comparacion-secciones"),
-                        html.Hr(style={"margin": "40px 0"}),
-                        html.H2("Detalle por Sección", style={"color": "#2c3e50"}),
-                        html.Div([
-                            html.Div([
-                                html.Label("Sección", style={"fontWeight": "bold"}),
-                                dcc.Dropdown(id="seccion-select", options=[{"label": s, "value": s} for s in seccion_base], value=seccion_base[0] if seccion_base else None),
-                            ], style={"width": "48%", "display": "inline-block"}),
-                            html.Div([
-                                html.Label("Competencia", style={"fontWeight": "bold"}),
-                                dcc.Dropdown(id="competencia-seccion-select"),
-                            ], style={"width": "48%", "display": "inline-block", "marginLeft": "4%"}),
-                        ]),
-                        html.Div(id="grafico-seccion", style={"marginTop": 20}),
-                    ], style={"padding": 20}),
+                    children=html.Div(id="contenido-tab-seccion", style={"padding": 20}),
                 ),
                 dcc.Tab(
                     label="👤 4. Por Alumno",
                     value="tab-alumno",
-                    children=
-                    html.Div([
-                        html.H2("Listado de Alumnos", style={"color": "#2c3e50", "marginTop": 20}),
-                        html.P("Seleccione Grado, Sección y Curso para ver el listado de estudiantes y sus calificaciones", style={"color": "#7f8c8d", "marginBottom": 20}),
-                        html.Div([
-                            html.Div([
-                                html.Label("Grado", style={"fontWeight": "bold"}),
-                                dcc.Dropdown(id="alumno-grado-select", options=[{"label": g, "value": g} for g in alumno_grados], value=alumno_grados[0] if alumno_grados else None),
-                            ], style={"width": "31%", "display": "inline-block"}),
-                            html.Div([
-                                html.Label("Sección", style={"fontWeight": "bold"}),
-                                dcc.Dropdown(id="alumno-seccion-select"),
-                            ], style={"width": "31%", "display": "inline-block", "marginLeft": "3%"}),
-                            html.Div([
-                                html.Label("Curso", style={"fontWeight": "bold"}),
-                                dcc.Dropdown(id="alumno-curso-select"),
-                            ], style={"width": "31%", "display": "inline-block", "marginLeft": "3%"}),
-                        ]),
-                        html.Div(id="tabla-alumnos", style={"marginTop": 30}),
-                    ], style={"padding": 20}),
+                    children=html.Div(id="contenido-tab-alumno", style={"padding": 20}),
+                ),
+                dcc.Tab(
+                    label="⚠️ 5. Alumnos en Riesgo",
+                    value="tab-riesgo",
+                    children=html.Div(id="contenido-tab-riesgo", style={"padding": 20}),
+                ),
+                dcc.Tab(
+                    label="📈 6. Tendencias",
+                    value="tab-tendencias",
+                    children=html.Div(id="contenido-tab-tendencias", style={"padding": 20}),
+                ),
+                dcc.Tab(
+                    label="🔎 7. Consulta Libre",
+                    value="tab-consulta",
+                    children=html.Div(id="contenido-tab-consulta", style={"padding": 20}),
                 ),
             ],
         ),
@@ -373,6 +775,14 @@ app.index_string = """\
             tbody td { border-bottom: 1px solid #edebe9; padding: 10px; color: #323130; }
             tbody tr:hover { background: #f3f2f1; }
             hr { border: none; border-top: 1px solid #edebe9; margin: 30px 0; }
+            .celda-nro { padding: 8px; border: 1px solid #ddd; text-align: center; background-color: white; position: sticky; left: 0; z-index: 5; }
+            .celda-alumno { padding: 8px; border: 1px solid #ddd; background-color: white; position: sticky; left: 50px; z-index: 5; font-size: 13px; }
+            .celda-texto { padding: 8px; border: 1px solid #ddd; font-size: 13px; }
+            .celda-nivel { padding: 8px; border: 1px solid #ddd; text-align: center; font-weight: bold; background-color: #ecf0f1; }
+            .celda-nivel.nivel-ad { background-color: #d5f4e6; }
+            .celda-nivel.nivel-a { background-color: #a9dfbf; }
+            .celda-nivel.nivel-b { background-color: #fdeaa1; }
+            .celda-nivel.nivel-c { background-color: #f5b7b1; }
         </style>
     </head>
     <body>
@@ -388,7 +798,7 @@ app.index_string = """\
 
 
 @app.callback(
-    Output("metricas-dinamicas", "children"),
+    [Output("metricas-dinamicas", "children"), Output("titulo-bimestre", "children")],
     [Input("tabs-principal", "value"), Input("bimestre-select", "value")],
 )
 def actualizar_metricas(tab_activa, bimestre):
@@ -400,7 +810,6 @@ def actualizar_metricas(tab_activa, bimestre):
     total_grados = ctx["total_grados"]
     total_secciones = ctx["total_secciones"]
     nivel_counts = ctx["nivel_counts"]
-    df_curso_comp_grado = ctx["df_curso_comp_grado"]
 
     metricas = []
 
@@ -424,8 +833,7 @@ def actualizar_metricas(tab_activa, bimestre):
             ], className="metric-card"),
         ]
     elif tab_activa == "tab-curso":
-        cursos_por_grado = df_curso_comp_grado.groupby("Grado")["Curso"].nunique()
-        total_grados_curso = len(cursos_por_grado)
+        total_grados_curso = len(valores_agregado(bimestre, "df_curso_comp_grado", "Grado"))
         metricas = [
             html.Div([
                 html.H3("🎓 Total de Grados", style={"fontSize": "18px", "margin": 0}),
@@ -433,11 +841,11 @@ def actualizar_metricas(tab_activa, bimestre):
             ], className="metric-card"),
             html.Div([
                 html.H3("📚 Total de Cursos", style={"fontSize": "18px", "margin": 0}),
-                html.H2(f"{df_curso_comp_grado['Curso'].nunique()}", style={"color": "#9b59b6", "margin": "10px 0"}),
+                html.H2(f"{len(valores_agregado(bimestre, 'df_curso_comp_grado', 'Curso'))}", style={"color": "#9b59b6", "margin": "10px 0"}),
             ], className="metric-card"),
             html.Div([
                 html.H3("🎯 Total de Competencias", style={"fontSize": "18px", "margin": 0}),
-                html.H2(f"{df_curso_comp_grado['Competencia'].nunique()}", style={"color": "#16a085", "margin": "10px 0"}),
+                html.H2(f"{len(valores_agregado(bimestre, 'df_curso_comp_grado', 'Competencia'))}", style={"color": "#16a085", "margin": "10px 0"}),
             ], className="metric-card"),
             html.Div([
                 html.H3("👥 Promedio Evaluaciones por Grado", style={"fontSize": "18px", "margin": 0}),
@@ -487,81 +895,321 @@ def actualizar_metricas(tab_activa, bimestre):
             ], className="metric-card"),
         ]
 
-    return metricas
+    elif tab_activa == "tab-riesgo":
+        matriz = ctx["matriz_niveles"]
+        con_c = int(((matriz == NIVEL_PESOS["C"]).sum(axis=1) > 0).sum())
+        metricas = [
+            html.Div([
+                html.H3("⚠️ Alumnos con algún C", style={"fontSize": "18px", "margin": 0}),
+                html.H2(f"{con_c:,}", style={"color": "#e74c3c", "margin": "10px 0"}),
+                html.P(f"{(con_c / len(df_data) * 100 if len(df_data) else 0):.1f}%", style={"color": "#7f8c8d", "margin": 0}),
+            ], className="metric-card"),
+            html.Div([
+                html.H3("📊 Alumnos con 3+ C", style={"fontSize": "18px", "margin": 0}),
+                html.H2(f"{int(((matriz == NIVEL_PESOS['C']).sum(axis=1) >= 3).sum()):,}", style={"color": "#f39c12", "margin": "10px 0"}),
+            ], className="metric-card"),
+        ]
+
+    elif tab_activa == "tab-tendencias":
+        general = TENDENCIAS.serie()
+        ad = general[general["Nivel"] == "AD"].set_index("Bimestre")["Porcentaje"]
+        variacion = ad.iloc[-1] - ad.iloc[0] if len(ad) > 1 else 0.0
+        metricas = [
+            html.Div([
+                html.H3("🗓️ Bimestres cargados", style={"fontSize": "18px", "margin": 0}),
+                html.H2(f"{len(TENDENCIAS.bimestres)}", style={"color": "#3498db", "margin": "10px 0"}),
+                html.P(" → ".join(TENDENCIAS.bimestres), style={"color": "#7f8c8d", "margin": 0}),
+            ], className="metric-card"),
+            html.Div([
+                html.H3("🎯 Variación de AD", style={"fontSize": "18px", "margin": 0}),
+                html.H2(f"{variacion:+.1f} pts", style={"color": "#27ae60" if variacion >= 0 else "#e74c3c", "margin": "10px 0"}),
+                html.P("Primer vs. último bimestre", style={"color": "#7f8c8d", "margin": 0}),
+            ], className="metric-card"),
+        ]
+
+    return metricas, f"Dashboard Académico - {bimestre} Bimestre"
+
+
+LAYOUTS_TAB = {
+    "tab-secundaria": layout_tab_secundaria,
+    "tab-curso": layout_tab_curso,
+    "tab-seccion": layout_tab_seccion,
+    "tab-alumno": layout_tab_alumno,
+    "tab-riesgo": layout_tab_riesgo,
+    "tab-tendencias": layout_tab_tendencias,
+    "tab-consulta": layout_tab_consulta,
+}
+
+
+@app.callback(
+    [Output(f"contenido-{tab}", "children") for tab in LAYOUTS_TAB] + [Output("tabs-renderizadas", "data")],
+    Input("tabs-principal", "value"),
+    State("tabs-renderizadas", "data"),
+    prevent_initial_call=True,
+)
+def renderizar_tab(tab_activa, renderizadas):
+    """Construye una pestaña la primera vez que se abre y la conserva en la sesión.
+
+    Mientras sus componentes no estén en el layout, Dash no ejecuta sus callbacks,
+    así que las pestañas no visitadas no generan trabajo en el servidor.
+    """
+    renderizadas = renderizadas or []
+    if tab_activa not in LAYOUTS_TAB or tab_activa in renderizadas:
+        return [dash.no_update] * (len(LAYOUTS_TAB) + 1)
+    contenidos = [LAYOUTS_TAB[tab]() if tab == tab_activa else dash.no_update for tab in LAYOUTS_TAB]
+    return contenidos + [renderizadas + [tab_activa]]
+
+
+# Cada pestaña se actualiza con un único callback: sus dropdowns son a la vez
+# entrada y salida, así que un cambio de bimestre o de filtro resuelve las
+# selecciones por defecto y los gráficos de toda la pestaña en una sola
+# solicitud, en lugar de una cascada de callbacks encadenados.
+SIN_CAMBIO = (dash.no_update, dash.no_update)
+
+
+def opciones_y_default(valores: list):
+    return [{"label": v, "value": v} for v in valores], valores[0] if valores else None
 
 
 @app.callback(
     [
-        Output("titulo-bimestre", "children"),
+        Output("competencia-secundaria", "options"),
+        Output("competencia-secundaria", "value"),
+        Output("grafico-secundaria", "children"),
         Output("curso-select", "options"),
         Output("curso-select", "value"),
+        Output("competencia-curso-select", "options"),
+        Output("competencia-curso-select", "value"),
+        Output("grafico-curso", "children"),
+    ],
+    [
+        Input("bimestre-select", "value"),
+        Input("competencia-secundaria", "value"),
+        Input("curso-select", "value"),
+        Input("competencia-curso-select", "value"),
+    ],
+)
+def actualizar_tab_secundaria(bimestre, competencia, curso, competencia_curso):
+    disparador = dash.ctx.triggered_id
+    inicio = disparador in (None, "bimestre-select")
+
+    comp_opts = SIN_CAMBIO
+    if inicio:
+        competencias = valores_agregado(bimestre, "df_secundaria_comp", "Competencia")
+        comp_opts = opciones_y_default(competencias)
+        if competencia in competencias:
+            comp_opts = (comp_opts[0], competencia)
+        competencia = comp_opts[1]
+    grafico_sec = dash.no_update
+    if inicio or disparador == "competencia-secundaria":
+        grafico_sec = update_secundaria(competencia, bimestre)
+
+    curso_opts = SIN_CAMBIO
+    if inicio:
+        curso_opts = opciones_y_default(valores_agregado(bimestre, "df_curso_comp", "Curso"))
+        curso = curso_opts[1]
+    comp_curso_opts = SIN_CAMBIO
+    if inicio or disparador == "curso-select":
+        comp_curso_opts = update_curso_comp_options(curso, bimestre)
+        competencia_curso = comp_curso_opts[1]
+    grafico_curso = dash.no_update
+    if disparador != "competencia-secundaria":
+        grafico_curso = update_curso(curso, competencia_curso, bimestre)
+
+    return (*comp_opts, grafico_sec, *curso_opts, *comp_curso_opts, grafico_curso)
+
+
+@app.callback(
+    [
         Output("filtro-curso-grado", "options"),
         Output("filtro-curso-grado", "value"),
-        Output("filtro-seccion-seccion", "options"),
-        Output("filtro-seccion-seccion", "value"),
+        Output("filtro-curso-curso", "options"),
+        Output("filtro-curso-curso", "value"),
+        Output("filtro-curso-competencia", "options"),
+        Output("filtro-curso-competencia", "value"),
+        Output("grafico-curso-grado", "children"),
         Output("competencia-comparacion-grado", "options"),
         Output("competencia-comparacion-grado", "value"),
-        Output("competencia-comparacion-seccion", "options"),
-        Output("competencia-comparacion-seccion", "value"),
-        Output("alumno-grado-select", "options"),
-        Output("alumno-grado-select", "value"),
+        Output("grafico-comparacion-grados", "children"),
+    ],
+    [
+        Input("bimestre-select", "value"),
+        Input("filtro-curso-grado", "value"),
+        Input("filtro-curso-curso", "value"),
+        Input("filtro-curso-competencia", "value"),
+        Input("competencia-comparacion-grado", "value"),
     ],
-    Input("bimestre-select", "value"),
 )
-def sincronizar_bimestre(bimestre):
-    ctx = ctx_bimestre(bimestre)
-
-    df_curso_comp = ctx["df_curso_comp"]
-    df_curso_comp_grado = ctx["df_curso_comp_grado"]
-    df_seccion_comp = ctx["df_seccion_comp"]
-    df_grado_comp = ctx["df_grado_comp"]
-    df_seccion_comp_simple = ctx["df_seccion_comp_simple"]
-    df_estadisticas = ctx["df_estadisticas"]
-
-    cursos = sorted(df_curso_comp["Curso"].unique())
-    curso_val = cursos[0] if cursos else None
-
-    grados = sorted(df_curso_comp_grado["Grado"].unique())
-    grado_val = grados[0] if grados else None
-
-    secciones = sorted(df_seccion_comp["Seccion"].unique())
-    seccion_val = secciones[0] if secciones else None
-
-    comps_grado = sorted(df_grado_comp["Competencia"].unique())
-    comp_grado_val = comps_grado[0] if comps_grado else None
+def actualizar_tab_curso(bimestre, grado, curso, competencia, comp_comparacion):
+    disparador = dash.ctx.triggered_id
+    inicio = disparador in (None, "bimestre-select")
+
+    grado_opts = SIN_CAMBIO
+    if inicio:
+        grado_opts = opciones_y_default(valores_agregado(bimestre, "df_curso_comp_grado", "Grado"))
+        grado = grado_opts[1]
+    curso_opts = SIN_CAMBIO
+    if inicio or disparador == "filtro-curso-grado":
+        curso_opts = update_curso_options_grado(grado, bimestre)
+        curso = curso_opts[1]
+    comp_opts = SIN_CAMBIO
+    if inicio or disparador in ("filtro-curso-grado", "filtro-curso-curso"):
+        comp_opts = update_competencia_options_grado(grado, curso, bimestre)
+        competencia = comp_opts[1]
+    grafico = dash.no_update
+    if disparador != "competencia-comparacion-grado":
+        grafico = update_grafico_curso_grado(grado, curso, competencia, bimestre)
+
+    comparacion_opts = SIN_CAMBIO
+    if inicio:
+        comparacion_opts = opciones_y_default(valores_agregado(bimestre, "df_grado_comp", "Competencia"))
+        comp_comparacion = comparacion_opts[1]
+    grafico_comparacion = dash.no_update
+    if inicio or disparador == "competencia-comparacion-grado":
+        grafico_comparacion = update_comp_grados(comp_comparacion, bimestre)
+
+    return (*grado_opts, *curso_opts, *comp_opts, grafico, *comparacion_opts, grafico_comparacion)
 
-    comps_seccion = sorted(df_seccion_comp_simple["Competencia"].unique())
-    comp_sec_val = comps_seccion[0] if comps_seccion else None
 
-    grados_alumno = sorted(df_estadisticas["Grado"].unique())
-    grado_alumno_val = grados_alumno[0] if grados_alumno else None
-
-    titulo = f"Dashboard Académico - {bimestre} Bimestre"
+@app.callback(
+    [
+        Output("mapa-curso", "options"),
+        Output("mapa-curso", "value"),
+        Output("grafico-mapa-secciones", "children"),
+        Output("filtro-seccion-seccion", "options"),
+        Output("filtro-seccion-seccion", "value"),
+        Output("filtro-seccion-curso", "options"),
+        Output("filtro-seccion-curso", "value"),
+        Output("filtro-seccion-competencia", "options"),
+        Output("filtro-seccion-competencia", "value"),
+        Output("grafico-seccion-filtros", "children"),
+        Output("competencia-comparacion-seccion", "options"),
+        Output("competencia-comparacion-seccion", "value"),
+        Output("grafico-comparacion-secciones", "children"),
+        Output("seccion-select", "options"),
+        Output("seccion-select", "value"),
+        Output("competencia-seccion-select", "options"),
+        Output("competencia-seccion-select", "value"),
+        Output("grafico-seccion", "children"),
+    ],
+    [
+        Input("bimestre-select", "value"),
+        Input("mapa-indicador", "value"),
+        Input("mapa-curso", "value"),
+        Input("filtro-seccion-seccion", "value"),
+        Input("filtro-seccion-curso", "value"),
+        Input("filtro-seccion-competencia", "value"),
+        Input("competencia-comparacion-seccion", "value"),
+        Input("seccion-select", "value"),
+        Input("competencia-seccion-select", "value"),
+    ],
+)
+def actualizar_tab_seccion(bimestre, indicador, mapa_curso, seccion, curso, competencia, comp_comparacion, seccion_detalle, comp_detalle):
+    disparador = dash.ctx.triggered_id
+    inicio = disparador in (None, "bimestre-select")
+
+    mapa_opts = SIN_CAMBIO
+    if inicio:
+        mapa_opts = (opciones_y_default(valores_agregado(bimestre, "df_curso_comp", "Curso"))[0], None)
+        mapa_curso = None
+    grafico_mapa = dash.no_update
+    if inicio or disparador in ("mapa-indicador", "mapa-curso"):
+        grafico_mapa = update_mapa_secciones(indicador, mapa_curso, bimestre)
+
+    seccion_opts = SIN_CAMBIO
+    if inicio:
+        seccion_opts = opciones_y_default(valores_agregado(bimestre, "df_seccion_comp", "Seccion"))
+        seccion = seccion_opts[1]
+    curso_opts = SIN_CAMBIO
+    if inicio or disparador == "filtro-seccion-seccion":
+        curso_opts = update_curso_options_seccion(seccion, bimestre)
+        curso = curso_opts[1]
+    comp_opts = SIN_CAMBIO
+    if inicio or disparador in ("filtro-seccion-seccion", "filtro-seccion-curso"):
+        comp_opts = update_competencia_options_seccion(seccion, curso, bimestre)
+        competencia = comp_opts[1]
+    grafico_filtros = dash.no_update
+    if inicio or disparador in ("filtro-seccion-seccion", "filtro-seccion-curso", "filtro-seccion-competencia"):
+        grafico_filtros = update_grafico_seccion_filtros(seccion, curso, competencia, bimestre)
+
+    comparacion_opts = SIN_CAMBIO
+    if inicio:
+        comparacion_opts = opciones_y_default(valores_agregado(bimestre, "df_seccion_comp_simple", "Competencia"))
+        comp_comparacion = comparacion_opts[1]
+    grafico_comparacion = dash.no_update
+    if inicio or disparador == "competencia-comparacion-seccion":
+        grafico_comparacion = update_comp_secciones(comp_comparacion, bimestre)
+
+    detalle_opts = SIN_CAMBIO
+    if inicio:
+        secciones = valores_agregado(bimestre, "df_seccion_comp", "Seccion")
+        detalle_opts = opciones_y_default(secciones)
+        if seccion_detalle in secciones:
+            detalle_opts = (detalle_opts[0], seccion_detalle)
+        seccion_detalle = detalle_opts[1]
+    comp_detalle_opts = SIN_CAMBIO
+    if inicio or disparador == "seccion-select":
+        comp_detalle_opts = update_seccion_comp_options(seccion_detalle, bimestre)
+        comp_detalle = comp_detalle_opts[1]
+    grafico_detalle = dash.no_update
+    if inicio or disparador in ("seccion-select", "competencia-seccion-select"):
+        grafico_detalle = update_seccion(seccion_detalle, comp_detalle, bimestre)
 
     return (
-        titulo,
-        [{"label": c, "value": c} for c in cursos],
-        curso_val,
-        [{"label": g, "value": g} for g in grados],
-        grado_val,
-        [{"label": s, "value": s} for s in secciones],
-        seccion_val,
-        [{"label": c, "value": c} for c in comps_grado],
-        comp_grado_val,
-        [{"label": c, "value": c} for c in comps_seccion],
-        comp_sec_val,
-        [{"label": g, "value": g} for g in grados_alumno],
-        grado_alumno_val,
+        *mapa_opts,
+        grafico_mapa,
+        *seccion_opts,
+        *curso_opts,
+        *comp_opts,
+        grafico_filtros,
+        *comparacion_opts,
+        grafico_comparacion,
+        *detalle_opts,
+        *comp_detalle_opts,
+        grafico_detalle,
     )
 
 
 @app.callback(
-    Output("grafico-secundaria", "children"),
-    [Input("competencia-secundaria", "value"), Input("bimestre-select", "value")],
+    [
+        Output("alumno-grado-select", "options"),
+        Output("alumno-grado-select", "value"),
+        Output("alumno-seccion-select", "options"),
+        Output("alumno-seccion-select", "value"),
+        Output("alumno-curso-select", "options"),
+        Output("alumno-curso-select", "value"),
+        Output("tabla-alumnos", "children"),
+    ],
+    [
+        Input("bimestre-select", "value"),
+        Input("alumno-grado-select", "value"),
+        Input("alumno-seccion-select", "value"),
+        Input("alumno-curso-select", "value"),
+    ],
 )
+def actualizar_tab_alumno(bimestre, grado, seccion, curso):
+    disparador = dash.ctx.triggered_id
+    inicio = disparador in (None, "bimestre-select")
+
+    grado_opts = SIN_CAMBIO
+    if inicio:
+        grado_opts = opciones_y_default(sorted(ctx_bimestre(bimestre)["df_estadisticas"]["Grado"].unique()))
+        grado = grado_opts[1]
+    seccion_opts = SIN_CAMBIO
+    if inicio or disparador == "alumno-grado-select":
+        seccion_opts = update_alumno_seccion(grado, bimestre)
+        seccion = seccion_opts[1]
+    curso_opts = SIN_CAMBIO
+    if inicio or disparador in ("alumno-grado-select", "alumno-seccion-select"):
+        curso_opts = update_alumno_curso(grado, seccion, bimestre)
+        curso = curso_opts[1]
+    tabla = mostrar_tabla_alumnos(grado, seccion, curso, bimestre)
+
+    return (*grado_opts, *seccion_opts, *curso_opts, tabla)
+
+
 def update_secundaria(competencia, bimestre):
-    ctx = ctx_bimestre(bimestre)
-    df_filt = ctx["df_secundaria_comp"][ctx["df_secundaria_comp"]["Competencia"] == competencia]
+    df_filt = consultar_agregado(bimestre, "df_secundaria_comp", Competencia=competencia)
     if df_filt.empty:
         return html.Div("Sin datos", style={"padding": 20})
 
@@ -581,26 +1229,15 @@ def update_secundaria(competencia, bimestre):
     return dcc.Graph(figure=fig)
 
 
-@app.callback(
-    [Output("competencia-curso-select", "options"), Output("competencia-curso-select", "value")],
-    [Input("curso-select", "value"), Input("bimestre-select", "value")],
-)
 def update_curso_comp_options(curso, bimestre):
-    ctx = ctx_bimestre(bimestre)
-    df_curso_comp = ctx["df_curso_comp"]
-    comps = sorted(df_curso_comp[df_curso_comp["Curso"] == curso]["Competencia"].unique())
+    comps = valores_agregado(bimestre, "df_curso_comp", "Competencia", Curso=curso)
     return [{"label": c, "value": c} for c in comps], comps[0] if comps else None
 
 
-@app.callback(
-    Output("grafico-curso", "children"),
-    [Input("curso-select", "value"), Input("competencia-curso-select", "value"), Input("bimestre-select", "value")],
-)
 def update_curso(curso, competencia, bimestre):
     if not competencia:
         return html.Div()
-    df_curso_comp = ctx_bimestre(bimestre)["df_curso_comp"]
-    df_filt = df_curso_comp[(df_curso_comp["Curso"] == curso) & (df_curso_comp["Competencia"] == competencia)]
+    df_filt = consultar_agregado(bimestre, "df_curso_comp", Curso=curso, Competencia=competencia)
     if df_filt.empty:
         return html.Div("Sin datos", style={"padding": 20})
 
@@ -619,43 +1256,20 @@ def update_curso(curso, competencia, bimestre):
     return dcc.Graph(figure=fig)
 
 
-@app.callback(
-    [Output("filtro-curso-curso", "options"), Output("filtro-curso-curso", "value")],
-    [Input("filtro-curso-grado", "value"), Input("bimestre-select", "value")],
-)
 def update_curso_options_grado(grado, bimestre):
-    df_curso_comp_grado = ctx_bimestre(bimestre)["df_curso_comp_grado"]
-    cursos = sorted(df_curso_comp_grado[df_curso_comp_grado["Grado"] == grado]["Curso"].unique())
+    cursos = valores_agregado(bimestre, "df_curso_comp_grado", "Curso", Grado=grado)
     return [{"label": c, "value": c} for c in cursos], cursos[0] if cursos else None
 
 
-@app.callback(
-    [Output("filtro-curso-competencia", "options"), Output("filtro-curso-competencia", "value")],
-    [Input("filtro-curso-grado", "value"), Input("filtro-curso-curso", "value"), Input("bimestre-select", "value")],
-)
 def update_competencia_options_grado(grado, curso, bimestre):
-    df_curso_comp_grado = ctx_bimestre(bimestre)["df_curso_comp_grado"]
-    comps = sorted(
-        df_curso_comp_grado[(df_curso_comp_grado["Grado"] == grado) & (df_curso_comp_grado["Curso"] == curso)][
-            "Competencia"
-        ].unique()
-    )
+    comps = valores_agregado(bimestre, "df_curso_comp_grado", "Competencia", Grado=grado, Curso=curso)
     return [{"label": c, "value": c} for c in comps], comps[0] if comps else None
 
 
-@app.callback(
-    Output("grafico-curso-grado", "children"),
-    [Input("filtro-curso-grado", "value"), Input("filtro-curso-curso", "value"), Input("filtro-curso-competencia", "value"), Input("bimestre-select", "value")],
-)
 def update_grafico_curso_grado(grado, curso, competencia, bimestre):
     if not competencia:
         return html.Div()
-    df_curso_comp_grado = ctx_bimestre(bimestre)["df_curso_comp_grado"]
-    df_filt = df_curso_comp_grado[
-        (df_curso_comp_grado["Grado"] == grado)
-        & (df_curso_comp_grado["Curso"] == curso)
-        & (df_curso_comp_grado["Competencia"] == competencia)
-    ]
+    df_filt = consultar_agregado(bimestre, "df_curso_comp_grado", Grado=grado, Curso=curso, Competencia=competencia)
     if df_filt.empty:
         return html.Div("Sin datos", style={"padding": 20})
 
@@ -674,43 +1288,22 @@ def update_grafico_curso_grado(grado, curso, competencia, bimestre):
     return dcc.Graph(figure=fig)
 
 
-@app.callback(
-    [Output("filtro-seccion-curso", "options"), Output("filtro-seccion-curso", "value")],
-    [Input("filtro-seccion-seccion", "value"), Input("bimestre-select", "value")],
-)
 def update_curso_options_seccion(seccion, bimestre):
-    df_seccion_comp = ctx_bimestre(bimestre)["df_seccion_comp"]
-    cursos = sorted(df_seccion_comp[df_seccion_comp["Seccion"] == seccion]["Curso"].unique())
+    cursos = valores_agregado(bimestre, "df_seccion_comp", "Curso", Seccion=seccion)
     return [{"label": c, "value": c} for c in cursos], cursos[0] if cursos else None
 
 
-@app.callback(
-    [Output("filtro-seccion-competencia", "options"), Output("filtro-seccion-competencia", "value")],
-    [Input("filtro-seccion-seccion", "value"), Input("filtro-seccion-curso", "value"), Input("bimestre-select", "value")],
-)
 def update_competencia_options_seccion(seccion, curso, bimestre):
     if not curso:
         return [], None
-    df_seccion_comp = ctx_bimestre(bimestre)["df_seccion_comp"]
-    comps = sorted(
-        df_seccion_comp[(df_seccion_comp["Seccion"] == seccion) & (df_seccion_comp["Curso"] == curso)]["Competencia"].unique()
-    )
+    comps = valores_agregado(bimestre, "df_seccion_comp", "Competencia", Seccion=seccion, Curso=curso)
     return [{"label": c, "value": c} for c in comps], comps[0] if comps else None
 
 
-@app.callback(
-    Output("grafico-seccion-filtros", "children"),
-    [Input("filtro-seccion-seccion", "value"), Input("filtro-seccion-curso", "value"), Input("filtro-seccion-competencia", "value"), Input("bimestre-select", "value")],
-)
 def update_grafico_seccion_filtros(seccion, curso, competencia, bimestre):
     if not curso or not competencia:
         return html.Div()
-    df_seccion_comp = ctx_bimestre(bimestre)["df_seccion_comp"]
-    df_filt = df_seccion_comp[
-        (df_seccion_comp["Seccion"] == seccion)
-        & (df_seccion_comp["Curso"] == curso)
-        & (df_seccion_comp["Competencia"] == competencia)
-    ]
+    df_filt = consultar_agregado(bimestre, "df_seccion_comp", Seccion=seccion, Curso=curso, Competencia=competencia)
     if df_filt.empty:
         return html.Div("Sin datos", style={"padding": 20})
 
@@ -729,13 +1322,8 @@ def update_grafico_seccion_filtros(seccion, curso, competencia, bimestre):
     return dcc.Graph(figure=fig)
 
 
-@app.callback(
-    Output("grafico-comparacion-grados", "children"),
-    [Input("competencia-comparacion-grado", "value"), Input("bimestre-select", "value")],
-)
 def update_comp_grados(competencia, bimestre):
-    df_grado_comp = ctx_bimestre(bimestre)["df_grado_comp"]
-    df_filt = df_grado_comp[df_grado_comp["Competencia"] == competencia]
+    df_filt = consultar_agregado(bimestre, "df_grado_comp", Competencia=competencia)
     if df_filt.empty:
         return html.Div("Sin datos", style={"padding": 20})
 
@@ -755,25 +1343,15 @@ def update_comp_grados(competencia, bimestre):
     return dcc.Graph(figure=fig)
 
 
-@app.callback(
-    [Output("competencia-seccion-select", "options"), Output("competencia-seccion-select", "value")],
-    [Input("seccion-select", "value"), Input("bimestre-select", "value")],
-)
 def update_seccion_comp_options(seccion, bimestre):
-    df_seccion_comp = ctx_bimestre(bimestre)["df_seccion_comp"]
-    comps = sorted(df_seccion_comp[df_seccion_comp["Seccion"] == seccion]["Competencia"].unique())
+    comps = valores_agregado(bimestre, "df_seccion_comp", "Competencia", Seccion=seccion)
     return [{"label": c, "value": c} for c in comps], comps[0] if comps else None
 
 
-@app.callback(
-    Output("grafico-seccion", "children"),
-    [Input("seccion-select", "value"), Input("competencia-seccion-select", "value"), Input("bimestre-select", "value")],
-)
 def update_seccion(seccion, competencia, bimestre):
     if not competencia:
         return html.Div()
-    df_seccion_comp = ctx_bimestre(bimestre)["df_seccion_comp"]
-    df_filt = df_seccion_comp[(df_seccion_comp["Seccion"] == seccion) & (df_seccion_comp["Competencia"] == competencia)]
+    df_filt = consultar_agregado(bimestre, "df_seccion_comp", Seccion=seccion, Competencia=competencia)
     if df_filt.empty:
         return html.Div("Sin datos", style={"padding": 20})
 
@@ -793,13 +1371,8 @@ def update_seccion(seccion, competencia, bimestre):
     return dcc.Graph(figure=fig)
 
 
-@app.callback(
-    Output("grafico-comparacion-secciones", "children"),
-    [Input("competencia-comparacion-seccion", "value"), Input("bimestre-select", "value")],
-)
 def update_comp_secciones(competencia, bimestre):
-    df_seccion_comp_simple = ctx_bimestre(bimestre)["df_seccion_comp_simple"]
-    df_filt = df_seccion_comp_simple[df_seccion_comp_simple["Competencia"] == competencia]
+    df_filt = consultar_agregado(bimestre, "df_seccion_comp_simple", Competencia=competencia)
     if df_filt.empty:
         return html.Div("Sin datos", style={"padding": 20})
 
@@ -819,20 +1392,55 @@ def update_comp_secciones(competencia, bimestre):
     return dcc.Graph(figure=fig)
 
 
-@app.callback(
-    [Output("alumno-seccion-select", "options"), Output("alumno-seccion-select", "value")],
-    [Input("alumno-grado-select", "value"), Input("bimestre-select", "value")],
-)
+def update_mapa_secciones(indicador, curso, bimestre):
+    # Las secciones se repiten entre grados (RESPONSABILIDAD en CUARTO y QUINTO),
+    # así que cada fila es un par Grado - Sección; sin curso se suman todos
+    filtros = {"Curso": curso} if curso else {}
+    df_filt = consultar_agregado(bimestre, "df_grado_seccion_comp", **filtros)
+    if df_filt.empty:
+        return html.Div("Sin datos", style={"padding": 20})
+
+    # Un solo pivote: (Grado - Sección, Competencia) x Nivel con las cantidades
+    df_filt = df_filt.assign(Fila=df_filt["Grado"] + " - " + df_filt["Seccion"])
+    conteos = df_filt.pivot_table(index=["Fila", "Competencia"], columns="Nivel", values="Cantidad", aggfunc="sum", fill_value=0)
+    totales = conteos.sum(axis=1)
+    if indicador == "puntaje":
+        pesos = conteos.columns.map(lambda nivel: NIVEL_PESOS.get(nivel, 0))
+        valores = conteos.mul(pesos, axis=1).sum(axis=1) / totales
+        escala, rango, formato, decimales = "RdYlGn", (1, 4), "%{z:.2f}", 2
+    else:
+        valores = conteos.get(indicador, 0) / totales * 100
+        escala = "Reds" if indicador in ("B", "C") else "Greens"
+        rango, formato, decimales = (0, 100), "%{z:.1f}%", 1
+    # Se redondea a lo que se muestra para no enviar floats de 17 dígitos
+    matriz = valores.round(decimales).unstack("Competencia")
+
+    # El nombre completo va en x (para el hover) y el abreviado solo en las etiquetas del eje
+    competencias = list(matriz.columns)
+    fig = go.Figure(
+        go.Heatmap(
+            z=matriz.values,
+            x=competencias,
+            y=list(matriz.index),
+            colorscale=escala,
+            zmin=rango[0],
+            zmax=rango[1],
+            texttemplate=formato,
+            hovertemplate="Grado - Sección: %{y}<br>%{x}<br>" + INDICADORES_MAPA[indicador] + ": " + formato + "<extra></extra>",
+        )
+    )
+    titulo = f"{INDICADORES_MAPA[indicador]} - {curso if curso else 'Todos los cursos'}"
+    fig.update_layout(title=titulo, height=max(400, 30 * len(matriz.index) + 250), xaxis_title="Competencia", yaxis_title="Grado - Sección", xaxis_tickangle=-45)
+    fig.update_xaxes(tickvals=competencias, ticktext=[c[:30] + "..." if len(c) > 30 else c for c in competencias])
+    return dcc.Graph(figure=fig)
+
+
 def update_alumno_seccion(grado, bimestre):
     df_estadisticas = ctx_bimestre(bimestre)["df_estadisticas"]
     secciones = sorted(df_estadisticas[df_estadisticas["Grado"] == grado]["Seccion"].unique())
     return [{"label": s, "value": s} for s in secciones], secciones[0] if secciones else None
 
 
-@app.callback(
-    [Output("alumno-curso-select", "options"), Output("alumno-curso-select", "value")],
-    [Input("alumno-grado-select", "value"), Input("alumno-seccion-select", "value"), Input("bimestre-select", "value")],
-)
 def update_alumno_curso(grado, seccion, bimestre):
     if not seccion:
         return [], None
@@ -843,10 +1451,24 @@ def update_alumno_curso(grado, seccion, bimestre):
     return [{"label": c, "value": c} for c in cursos], cursos[0] if cursos else None
 
 
-@app.callback(
-    Output("tabla-alumnos", "children"),
-    [Input("alumno-grado-select", "value"), Input("alumno-seccion-select", "value"), Input("alumno-curso-select", "value"), Input("bimestre-select", "value")],
-)
+def get_nivel_color(nivel):
+    colors = {"AD": "#d5f4e6", "A": "#a9dfbf", "B": "#fdeaa1", "C": "#f5b7b1", "-": "#ecf0f1"}
+    return colors.get(nivel, "#ecf0f1")
+
+
+def celda(contenido, tipo: str, nivel=None):
+    """Td de las tablas de alumnos; en modo compacto el estilo va en clases CSS."""
+    if COMPACTO:
+        clase = f"celda-{tipo}"
+        if tipo == "nivel" and nivel in NIVEL_CLASES:
+            clase += f" {NIVEL_CLASES[nivel]}"
+        return html.Td(contenido, className=clase)
+    estilo = ESTILOS_CELDA[tipo]
+    if tipo == "nivel":
+        estilo = {**estilo, "backgroundColor": get_nivel_color(nivel)}
+    return html.Td(contenido, style=estilo)
+
+
 def mostrar_tabla_alumnos(grado, seccion, curso, bimestre):
     if not seccion or not curso:
         return html.Div("Por favor, seleccione Grado, Sección y Curso", style={"padding": "20px", "textAlign": "center", "color": "#7f8c8d"})
@@ -901,31 +1523,13 @@ def mostrar_tabla_alumnos(grado, seccion, curso, bimestre):
             )
         )
 
-    def get_nivel_color(nivel):
-        colors = {"AD": "#d5f4e6", "A": "#a9dfbf", "B": "#fdeaa1", "C": "#f5b7b1", "-": "#ecf0f1"}
-        return colors.get(nivel, "#ecf0f1")
-
     filas = []
     for alumno in alumnos_data:
-        celdas = [
-            html.Td(alumno["Nro"], style={"padding": "8px", "border": "1px solid #ddd", "textAlign": "center", "backgroundColor": "white", "position": "sticky", "left": "0", "zIndex": "5"}),
-            html.Td(alumno["Alumno"], style={"padding": "8px", "border": "1px solid #ddd", "backgroundColor": "white", "position": "sticky", "left": "50px", "zIndex": "5", "fontSize": "13px"}),
-        ]
+        celdas = [celda(alumno["Nro"], "nro"), celda(alumno["Alumno"], "alumno")]
         for comp in competencias:
             comp_short = comp[:30] + "..." if len(comp) > 30 else comp
             nivel = alumno.get(comp_short, "-")
-            celdas.append(
-                html.Td(
-                    nivel,
-                    style={
-                        "padding": "8px",
-                        "border": "1px solid #ddd",
-                        "textAlign": "center",
-                        "fontWeight": "bold",
-                        "backgroundColor": get_nivel_color(nivel),
-                    },
-                )
-            )
+            celdas.append(celda(nivel, "nivel", nivel))
         filas.append(html.Tr(celdas))
 
     tabla_html = html.Div(
@@ -959,6 +1563,332 @@ def mostrar_tabla_alumnos(grado, seccion, curso, bimestre):
     return tabla_html
 
 
+@app.callback(
+    Output("resultados-busqueda-alumno", "children"),
+    Input("buscar-alumno", "value"),
+)
+def buscar_alumnos(texto):
+    if not texto or not texto.strip():
+        return []
+    resultados = INDICE_ALUMNOS.buscar(texto)
+    if not resultados:
+        return html.Div("No se encontraron alumnos", style={"padding": "10px", "color": "#7f8c8d"})
+
+    botones = []
+    for entrada in resultados:
+        ultimo = entrada["bimestres"][max(entrada["bimestres"], key=clave_bimestre)]
+        botones.append(
+            html.Button(
+                [html.Strong(entrada["nombre"]), html.Span(f"  {ultimo['grado']} - {ultimo['seccion']}", style={"color": "#7f8c8d"})],
+                id={"type": "resultado-alumno", "index": entrada["id"]},
+                n_clicks=0,
+                style={"display": "block", "width": "100%", "textAlign": "left", "padding": "8px 10px", "border": "none", "borderBottom": "1px solid #edebe9", "backgroundColor": "white", "cursor": "pointer", "fontSize": "14px"},
+            )
+        )
+    return html.Div(botones, style={"border": "1px solid #e1dfdd", "borderRadius": "2px", "maxHeight": "300px", "overflowY": "auto"})
+
+
+@app.callback(
+    Output("perfil-alumno", "children"),
+    Input({"type": "resultado-alumno", "index": ALL}, "n_clicks"),
+)
+def mostrar_perfil_alumno(clicks):
+    if not dash.ctx.triggered_id or not any(clicks):
+        return dash.no_update
+    return perfil_alumno(dash.ctx.triggered_id["index"])
+
+
+def perfil_alumno(entrada_id: int):
+    entrada = INDICE_ALUMNOS.entradas[entrada_id]
+    bimestres = sorted(entrada["bimestres"], key=clave_bimestre)
+
+    # (curso, competencia) -> {bimestre: nivel}
+    niveles = {}
+    for bimestre in bimestres:
+        ctx = ctx_bimestre(bimestre)
+        fila = ctx["df_data"].iloc[entrada["bimestres"][bimestre]["fila"]]
+        for col_idx, info in ctx["mapeo_columnas"].items():
+            nivel = fila.iloc[col_idx] if col_idx < len(fila) else "-"
+            nivel = "-" if pd.isna(nivel) else str(nivel).strip()
+            niveles.setdefault((info["curso"], info["competencia"]), {})[bimestre] = nivel
+
+    headers = [
+        html.Th("Curso", style={"padding": "10px", "border": "1px solid #ddd", "backgroundColor": "#3498db", "color": "white", "textAlign": "left", "minWidth": "180px"}),
+        html.Th("Competencia", style={"padding": "10px", "border": "1px solid #ddd", "backgroundColor": "#3498db", "color": "white", "textAlign": "left", "minWidth": "250px"}),
+    ] + [
+        html.Th(f"Bimestre {b}", style={"padding": "10px", "border": "1px solid #ddd", "backgroundColor": "#2c3e50", "color": "white", "textAlign": "center", "minWidth": "100px"})
+        for b in bimestres
+    ]
+
+    filas = []
+    for (curso, competencia), por_bimestre in sorted(niveles.items()):
+        celdas = [celda(curso, "texto"), celda(competencia, "texto")]
+        for bimestre in bimestres:
+            nivel = por_bimestre.get(bimestre, "-")
+            celdas.append(celda(nivel, "nivel", nivel))
+        filas.append(html.Tr(celdas))
+
+    ubicacion = " | ".join(f"{b}: {entrada['bimestres'][b]['grado']} - {entrada['bimestres'][b]['seccion']}" for b in bimestres)
+    return html.Div(
+        [
+            html.H3(f"👤 {entrada['nombre']}", style={"color": "#2c3e50", "marginBottom": "10px"}),
+            html.P(ubicacion, style={"fontSize": "14px", "color": "#7f8c8d", "marginBottom": "20px"}),
+            html.Div(
+                html.Table([html.Thead(html.Tr(headers)), html.Tbody(filas)], style={"borderCollapse": "collapse", "boxShadow": "0 2px 4px rgba(0,0,0,0.1)", "fontSize": "14px"}),
+                style={"overflowX": "auto", "overflowY": "auto", "maxHeight": "600px", "border": "1px solid #ddd", "borderRadius": "5px"},
+            ),
+        ]
+    )
+
+
+@app.callback(
+    [
+        Output("riesgo-grado-select", "options"),
+        Output("riesgo-seccion-select", "options"),
+        Output("riesgo-seccion-select", "value"),
+        Output("tabla-riesgo", "children"),
+    ],
+    [
+        Input("bimestre-select", "value"),
+        Input("riesgo-grado-select", "value"),
+        Input("riesgo-seccion-select", "value"),
+        Input("riesgo-cantidad", "value"),
+        Input("riesgo-por-seccion", "value"),
+    ],
+)
+def actualizar_tab_riesgo(bimestre, grado, seccion, cantidad, por_seccion):
+    disparador = dash.ctx.triggered_id
+    inicio = disparador in (None, "bimestre-select")
+    df_estadisticas = ctx_bimestre(bimestre)["df_estadisticas"]
+
+    grado_opts = dash.no_update
+    if inicio:
+        grados = sorted(df_estadisticas["Grado"].unique())
+        grado_opts = [{"label": g, "value": g} for g in grados]
+        if grado not in grados:
+            grado = None
+    seccion_opts, seccion_val = SIN_CAMBIO
+    if inicio or disparador == "riesgo-grado-select":
+        filtro = df_estadisticas if not grado else df_estadisticas[df_estadisticas["Grado"] == grado]
+        secciones = sorted(filtro["Seccion"].unique())
+        seccion_opts = [{"label": s, "value": s} for s in secciones]
+        if seccion not in secciones:
+            seccion = seccion_val = None
+
+    return grado_opts, seccion_opts, seccion_val, mostrar_ranking_riesgo(grado, seccion, cantidad, por_seccion, bimestre)
+
+
+def mostrar_ranking_riesgo(grado, seccion, cantidad, por_seccion, bimestre):
+    ranking = ranking_riesgo(bimestre, grado, seccion, int(cantidad or 10), bool(por_seccion))
+    if ranking.empty:
+        tabla = html.Div("No hay alumnos con niveles C o B en esta selección", style={"padding": "20px", "textAlign": "center", "color": "#7f8c8d"})
+    else:
+        estilo_th = {"padding": "10px", "border": "1px solid #ddd", "backgroundColor": "#2c3e50", "color": "white", "textAlign": "center"}
+        headers = [html.Th(col, style=estilo_th) for col in ["Nro", "Alumno", "Grado", "Sección", "C", "B", "Evaluadas", "Puntaje"]]
+        filas = [
+            html.Tr([
+                celda(fila.Nro, "nro"),
+                celda(fila.Alumno, "alumno"),
+                celda(fila.Grado, "texto"),
+                celda(fila.Seccion, "texto"),
+                celda(fila.C, "nivel", "C" if fila.C else "-"),
+                celda(fila.B, "nivel", "B" if fila.B else "-"),
+                celda(fila.Evaluadas, "texto"),
+                celda(f"{fila.Puntaje:.2f}", "texto"),
+            ])
+            for fila in ranking.itertuples(index=False)
+        ]
+        tabla = html.Div(
+            html.Table([html.Thead(html.Tr(headers)), html.Tbody(filas)], style={"borderCollapse": "collapse", "boxShadow": "0 2px 4px rgba(0,0,0,0.1)", "fontSize": "14px"}),
+            style={"overflowX": "auto", "overflowY": "auto", "maxHeight": "600px", "border": "1px solid #ddd", "borderRadius": "5px"},
+        )
+    return tabla
+
+
+NIVEL_COLORES = {"AD": "#27ae60", "A": "#2ecc71", "B": "#f39c12", "C": "#e74c3c"}
+
+
+def grafico_tendencia(grado, seccion, curso, competencia):
+    filtros = {"Grado": grado} if grado else {}
+    # Las secciones solo se ofrecen dentro de un grado
+    if grado and seccion:
+        filtros["Seccion"] = seccion
+    # La competencia ya identifica su curso
+    if competencia:
+        filtros["Competencia"] = competencia
+    elif curso:
+        filtros["Curso"] = curso
+    serie = TENDENCIAS.serie(**filtros)
+    if serie.empty:
+        return html.Div("Sin datos", style={"padding": 20})
+
+    fig = go.Figure(
+        data=[
+            go.Scatter(
+                x=serie.loc[serie["Nivel"] == nivel, "Bimestre"],
+                y=serie.loc[serie["Nivel"] == nivel, "Porcentaje"],
+                customdata=serie.loc[serie["Nivel"] == nivel, "Cantidad"],
+                hovertemplate="%{y:.1f}% (%{customdata})",
+                mode="lines+markers",
+                name=nivel,
+                line_color=color,
+            )
+            for nivel, color in NIVEL_COLORES.items()
+        ]
+    )
+    titulo = " - ".join(str(v) for v in filtros.values()) or "Todo el colegio"
+    fig.update_layout(
+        title=titulo,
+        xaxis=dict(title="Bimestre", type="category", categoryorder="array", categoryarray=TENDENCIAS.bimestres),
+        yaxis_title="Porcentaje (%)",
+        height=450,
+        hovermode="x unified",
+    )
+    return dcc.Graph(figure=fig)
+
+
+@app.callback(
+    [
+        Output("tendencia-seccion-select", "options"),
+        Output("tendencia-seccion-select", "value"),
+        Output("tendencia-competencia-select", "options"),
+        Output("tendencia-competencia-select", "value"),
+        Output("grafico-tendencia", "children"),
+    ],
+    [
+        Input("tendencia-grado-select", "value"),
+        Input("tendencia-seccion-select", "value"),
+        Input("tendencia-curso-select", "value"),
+        Input("tendencia-competencia-select", "value"),
+    ],
+)
+def actualizar_tab_tendencias(grado, seccion, curso, competencia):
+    disparador = dash.ctx.triggered_id
+    seccion_opts, seccion_val = SIN_CAMBIO
+    if disparador in (None, "tendencia-grado-select"):
+        secciones = sorted(SECCIONES_POR_GRADO.get(grado, set())) if grado else []
+        seccion_opts = [{"label": s, "value": s} for s in secciones]
+        if seccion not in secciones:
+            seccion = seccion_val = None
+    comp_opts, comp_val = SIN_CAMBIO
+    if disparador in (None, "tendencia-curso-select"):
+        comps = TENDENCIAS.valores("Competencia", Curso=curso) if curso else []
+        comp_opts = [{"label": c, "value": c} for c in comps]
+        if competencia not in comps:
+            competencia = comp_val = None
+    return seccion_opts, seccion_val, comp_opts, comp_val, grafico_tendencia(grado, seccion, curso, competencia)
+
+
+def como_lista(valor) -> list:
+    # Un dropdown múltiple puede entregar un solo valor suelto
+    if valor is None:
+        return []
+    return list(valor) if isinstance(valor, (list, tuple)) else [valor]
+
+
+def grafico_consulta(bimestre, grados, secciones, cursos, competencias):
+    indice = ctx_bimestre(bimestre)["indice_bits"]
+    filtros = {"Grado": grados, "Seccion": secciones, "Curso": cursos, "Competencia": competencias}
+    total = indice.contar(indice.seleccion(**filtros))
+    evaluaciones = sum(total.values())
+    if not evaluaciones:
+        return html.Div("Sin datos para esta combinación", style={"padding": 20})
+
+    # Con cursos o competencias elegidos se detalla por competencia; si no, por curso
+    campo = "Competencia" if cursos or competencias else "Curso"
+    desglose = indice.desglose(campo, **filtros)
+    etiquetas = ["TOTAL"] + sorted(desglose)
+    conteos = [total] + [desglose[e] for e in etiquetas[1:]]
+    fig = go.Figure(
+        data=[
+            go.Bar(
+                y=etiquetas,
+                x=[c[nivel] / sum(c.values()) * 100 for c in conteos],
+                customdata=[c[nivel] for c in conteos],
+                hovertemplate="%{x:.1f}% (%{customdata})",
+                orientation="h",
+                name=nivel,
+                marker_color=color,
+            )
+            for nivel, color in NIVEL_COLORES.items()
+        ]
+    )
+    partes = [", ".join(v) for v in (grados, secciones, cursos) if v]
+    fig.update_layout(
+        title=f"{' | '.join(partes) or 'Todo el colegio'} - {evaluaciones:,} evaluaciones",
+        barmode="stack",
+        xaxis_title="Porcentaje (%)",
+        yaxis=dict(
+            autorange="reversed",
+            tickvals=etiquetas,
+            ticktext=[e if len(e) <= 45 else e[:42] + "..." for e in etiquetas],
+        ),
+        height=max(300, 60 + 28 * len(etiquetas)),
+    )
+    return dcc.Graph(figure=fig)
+
+
+@app.callback(
+    [
+        Output("consulta-grados", "options"),
+        Output("consulta-grados", "value"),
+        Output("consulta-secciones", "options"),
+        Output("consulta-secciones", "value"),
+        Output("consulta-cursos", "options"),
+        Output("consulta-cursos", "value"),
+        Output("consulta-competencias", "options"),
+        Output("consulta-competencias", "value"),
+        Output("grafico-consulta", "children"),
+    ],
+    [
+        Input("bimestre-select", "value"),
+        Input("consulta-grados", "value"),
+        Input("consulta-secciones", "value"),
+        Input("consulta-cursos", "value"),
+        Input("consulta-competencias", "value"),
+    ],
+)
+def actualizar_tab_consulta(bimestre, grados, secciones, cursos, competencias):
+    disparador = dash.ctx.triggered_id
+    inicio = disparador in (None, "bimestre-select")
+    campos = ctx_bimestre(bimestre)["indice_bits"].campos
+    df_estadisticas = ctx_bimestre(bimestre)["df_estadisticas"]
+    grados, secciones, cursos, competencias = map(como_lista, (grados, secciones, cursos, competencias))
+
+    (grado_opts, grado_val), (curso_opts, curso_val) = SIN_CAMBIO, SIN_CAMBIO
+    if inicio:
+        grado_opts = [{"label": g, "value": g} for g in sorted(campos["Grado"])]
+        curso_opts = [{"label": c, "value": c} for c in sorted(campos["Curso"])]
+        grados = grado_val = [g for g in grados if g in campos["Grado"]]
+        cursos = curso_val = [c for c in cursos if c in campos["Curso"]]
+
+    seccion_opts, seccion_val = SIN_CAMBIO
+    if inicio or disparador == "consulta-grados":
+        filtro = df_estadisticas[df_estadisticas["Grado"].isin(grados)] if grados else df_estadisticas
+        validas = sorted(filtro["Seccion"].unique())
+        seccion_opts = [{"label": s, "value": s} for s in validas]
+        secciones = seccion_val = [s for s in secciones if s in validas]
+
+    comp_opts, comp_val = SIN_CAMBIO
+    if inicio or disparador == "consulta-cursos":
+        mapeo = ctx_bimestre(bimestre)["mapeo_columnas"].values()
+        validas = sorted({info["competencia"] for info in mapeo if not cursos or info["curso"] in cursos})
+        comp_opts = [{"label": c, "value": c} for c in validas]
+        competencias = comp_val = [c for c in competencias if c in validas]
+
+    return (
+        grado_opts,
+        grado_val,
+        seccion_opts,
+        seccion_val,
+        curso_opts,
+        curso_val,
+        comp_opts,
+        comp_val,
+        grafico_consulta(bimestre, grados, secciones, cursos, competencias),
+    )
+
+
 if __name__ == "__main__":
     print("\n[*] Iniciando Dashboard...")
     app.run(debug=False, host="0.0.0.0", port=8050)
@@ -0,0 +1,504 @@
+"""Exporta el dashboard completo como sitio estático (HTML + JSON).
+
+Para el reporte de fin de bimestre a padres y UGEL: se cargan los contextos una
+vez y se pre-renderiza cada pestaña, cada combinación de filtros, cada tabla de
+alumnos y cada perfil individual con las mismas funciones que usa el servidor.
+El resultado es un `index.html` con el layout real de las pestañas, un
+`manifiesto.json` con el árbol de opciones de cada filtro y un fragmento JSON
+por vista en `fragmentos/`. Un script pequeño (`vistas.js`) llena los
+dropdowns en cascada y carga el fragmento elegido, así que basta cualquier
+servidor de archivos estáticos:
+
+    python exportar_estatico.py --destino estatico
+    python -m http.server -d estatico 8000
+
+El renderizado se reparte entre procesos (uno por núcleo por defecto).
+"""
+import argparse
+import hashlib
+import html as html_std
+import json
+import os
+import re
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import plotly
+from dash import dcc
+from dash.development.base_component import Component
+from plotly.offline import get_plotlyjs
+
+import dashboard_web as dw
+from tendencias import clave_bimestre
+
+# El ranking de riesgo se exporta con la cantidad por defecto de la pestaña
+CANTIDAD_RIESGO = 10
+# Los filtros múltiples de la consulta libre no se pueden pre-renderizar
+PESTANAS_SIN_EXPORTAR = {"tab-consulta"}
+TAMANO_LOTE = 40
+
+ATRIBUTOS = {"id": "id", "className": "class", "title": "title", "colSpan": "colspan", "rowSpan": "rowspan", "src": "src", "href": "href", "alt": "alt"}
+ETIQUETAS_VACIAS = {"hr", "br", "img", "input"}
+CSS_SIN_UNIDAD = {"fontWeight", "opacity", "zIndex", "flex", "flexGrow", "flexShrink", "lineHeight", "order"}
+
+CSS_ESTATICO = """
+[role='tab'] { display: inline-block; cursor: pointer; }
+select, input[type='text'], input[type='number'] { width: 100%; padding: 6px 8px; border: 1px solid #8a8886; border-radius: 2px; background: #ffffff; font-size: 14px; }
+.resultados { border: 1px solid #e1dfdd; border-radius: 2px; max-height: 300px; overflow-y: auto; }
+.resultado-alumno { display: block; width: 100%; text-align: left; padding: 8px 10px; border: none; border-bottom: 1px solid #edebe9; background: white; cursor: pointer; font-size: 14px; }
+.resultado-alumno span { color: #7f8c8d; }
+.sin-resultados { padding: 10px; color: #7f8c8d; }
+"""
+
+VISTAS_JS = r"""
+(function () {
+  "use strict";
+  let M = null;
+  let bimestre = null;
+  let pestana = "tab-secundaria";
+  const fragmentos = new Map();
+  const vigentes = new Set();
+  const vistaDeSelector = {};
+
+  function fragmento(id) {
+    if (!fragmentos.has(id)) fragmentos.set(id, fetch("fragmentos/" + id + ".json").then((r) => r.json()));
+    return fragmentos.get(id);
+  }
+
+  function mostrar(destino, id) {
+    const el = document.getElementById(destino);
+    if (!el) return;
+    el.dataset.fragmento = id || "";
+    if (!id) { el.innerHTML = ""; return; }
+    fragmento(id).then((f) => {
+      if (el.dataset.fragmento !== id) return;
+      el.innerHTML = f.html;
+      el.querySelectorAll("[data-figura]").forEach((div) => {
+        const fig = f.figuras[Number(div.dataset.figura)];
+        Plotly.newPlot(div, fig.data, fig.layout, { displaylogo: false, responsive: true });
+      });
+    });
+  }
+
+  function valor(el) {
+    return el.type === "checkbox" ? (el.checked ? el.value : "") : el.value;
+  }
+
+  // Recorre el árbol [[valor, subárbol], ...] de la vista llenando cada
+  // dropdown con las opciones válidas para los anteriores, como la cascada
+  // de callbacks del servidor.
+  function actualizarVista(nombre) {
+    const vista = M.vistas[nombre];
+    let nodo = vista.global ? vista.arbol : vista.arbol[bimestre];
+    for (const id of vista.selectores) {
+      const el = document.getElementById(id);
+      if (!el || !Array.isArray(nodo)) { nodo = null; break; }
+      if (el.tagName === "SELECT") {
+        const actual = el.value;
+        const etiquetas = M.etiquetas[id] || {};
+        el.innerHTML = "";
+        for (const [clave] of nodo) el.add(new Option(clave === "" ? (el.dataset.placeholder || "—") : (etiquetas[clave] || clave), clave));
+        if (nodo.some(([clave]) => clave === actual)) el.value = actual;
+      }
+      const elegido = nodo.find(([clave]) => clave === valor(el));
+      nodo = elegido ? elegido[1] : null;
+    }
+    mostrar(nombre, typeof nodo === "string" ? nodo : null);
+  }
+
+  function actualizarPestana() {
+    document.querySelectorAll("[role=tab]").forEach((t) => t.classList.toggle("tab--selected", t.dataset.tab === pestana));
+    document.querySelectorAll("[role=tabpanel]").forEach((p) => { p.hidden = p.dataset.tab !== pestana; });
+    mostrar("metricas-dinamicas", (M.metricas[bimestre] || {})[pestana]);
+    for (const nombre in M.vistas) {
+      if (M.vistas[nombre].pestana === pestana && !vigentes.has(nombre)) {
+        vigentes.add(nombre);
+        actualizarVista(nombre);
+      }
+    }
+  }
+
+  function normalizar(texto) {
+    return texto.normalize("NFKD").replace(/[\u0300-\u036f]/g, "").toLowerCase().replace(/[^a-z0-9]+/g, " ").trim();
+  }
+
+  function buscar(texto) {
+    const destino = document.getElementById("resultados-busqueda-alumno");
+    const palabras = normalizar(texto).split(" ").filter(Boolean);
+    destino.innerHTML = "";
+    if (!palabras.length) return;
+    const encontrados = M.alumnos.filter((a) => palabras.every((p) => a[2].includes(p))).slice(0, 15);
+    if (!encontrados.length) {
+      destino.innerHTML = '<div class="sin-resultados">No se encontraron alumnos</div>';
+      return;
+    }
+    const lista = document.createElement("div");
+    lista.className = "resultados";
+    for (const [id, nombre, , ubicacion] of encontrados) {
+      const boton = document.createElement("button");
+      boton.className = "resultado-alumno";
+      boton.append(document.createElement("strong"), document.createElement("span"));
+      boton.firstChild.textContent = nombre;
+      boton.lastChild.textContent = "  " + ubicacion;
+      boton.addEventListener("click", () => mostrar("perfil-alumno", M.perfiles[id]));
+      lista.appendChild(boton);
+    }
+    destino.appendChild(lista);
+  }
+
+  document.addEventListener("DOMContentLoaded", () => {
+    fetch("manifiesto.json").then((r) => r.json()).then((manifiesto) => {
+      M = manifiesto;
+      bimestre = document.getElementById("bimestre-select").value || M.defecto;
+      for (const nombre in M.vistas) for (const id of M.vistas[nombre].selectores) vistaDeSelector[id] = nombre;
+
+      document.addEventListener("change", (e) => {
+        const id = e.target.id;
+        if (id === "bimestre-select") {
+          bimestre = e.target.value;
+          document.getElementById("titulo-bimestre").textContent = "Dashboard Académico - " + bimestre + " Bimestre";
+          vigentes.clear();
+          actualizarPestana();
+        } else if (vistaDeSelector[id]) {
+          actualizarVista(vistaDeSelector[id]);
+        }
+      });
+      document.querySelectorAll("[role=tab]").forEach((t) => t.addEventListener("click", () => {
+        pestana = t.dataset.tab;
+        actualizarPestana();
+      }));
+      const busqueda = document.getElementById("buscar-alumno");
+      if (busqueda) busqueda.addEventListener("input", () => buscar(busqueda.value));
+      actualizarPestana();
+    });
+  });
+})();
+"""
+
+
+def _valores(par) -> list:
+    """Valores de las opciones que devuelve un helper `update_*_options`."""
+    return [opcion["value"] for opcion in par[0]]
+
+
+def _opcional(valores: list) -> list:
+    return [None] + list(valores)
+
+
+# Vistas que dependen del bimestre: contenedor -> (pestaña, [(dropdown,
+# valores(bimestre, *anteriores))], hoja(bimestre, *valores) -> (función, args)).
+# Los valores de cada dropdown salen de los mismos helpers que usan los callbacks.
+VISTAS = {
+    "grafico-secundaria": (
+        "tab-secundaria",
+        [("competencia-secundaria", lambda b: dw.valores_agregado(b, "df_secundaria_comp", "Competencia"))],
+        lambda b, comp: ("update_secundaria", (comp, b)),
+    ),
+    "grafico-curso": (
+        "tab-secundaria",
+        [
+            ("curso-select", lambda b: dw.valores_agregado(b, "df_curso_comp", "Curso")),
+            ("competencia-curso-select", lambda b, curso: _valores(dw.update_curso_comp_options(curso, b))),
+        ],
+        lambda b, curso, comp: ("update_curso", (curso, comp, b)),
+    ),
+    "grafico-curso-grado": (
+        "tab-curso",
+        [
+            ("filtro-curso-grado", lambda b: dw.valores_agregado(b, "df_curso_comp_grado", "Grado")),
+            ("filtro-curso-curso", lambda b, grado: _valores(dw.update_curso_options_grado(grado, b))),
+            ("filtro-curso-competencia", lambda b, grado, curso: _valores(dw.update_competencia_options_grado(grado, curso, b))),
+        ],
+        lambda b, grado, curso, comp: ("update_grafico_curso_grado", (grado, curso, comp, b)),
+    ),
+    "grafico-comparacion-grados": (
+        "tab-curso",
+        [("competencia-comparacion-grado", lambda b: dw.valores_agregado(b, "df_grado_comp", "Competencia"))],
+        lambda b, comp: ("update_comp_grados", (comp, b)),
+    ),
+    "grafico-mapa-secciones": (
+        "tab-seccion",
+        [
+            ("mapa-indicador", lambda b: list(dw.INDICADORES_MAPA)),
+            ("mapa-curso", lambda b, indicador: _opcional(dw.valores_agregado(b, "df_curso_comp", "Curso"))),
+        ],
+        lambda b, indicador, curso: ("update_mapa_secciones", (indicador, curso, b)),
+    ),
+    "grafico-seccion-filtros": (
+        "tab-seccion",
+        [
+            ("filtro-seccion-seccion", lambda b: dw.valores_agregado(b, "df_seccion_comp", "Seccion")),
+            ("filtro-seccion-curso", lambda b, seccion: _valores(dw.update_curso_options_seccion(seccion, b))),
+            ("filtro-seccion-competencia", lambda b, seccion, curso: _valores(dw.update_competencia_options_seccion(seccion, curso, b))),
+        ],
+        lambda b, seccion, curso, comp: ("update_grafico_seccion_filtros", (seccion, curso, comp, b)),
+    ),
+    "grafico-comparacion-secciones": (
+        "tab-seccion",
+        [("competencia-comparacion-seccion", lambda b: dw.valores_agregado(b, "df_seccion_comp_simple", "Competencia"))],
+        lambda b, comp: ("update_comp_secciones", (comp, b)),
+    ),
+    "grafico-seccion": (
+        "tab-seccion",
+        [
+            ("seccion-select", lambda b: dw.valores_agregado(b, "df_seccion_comp", "Seccion")),
+            ("competencia-seccion-select", lambda b, seccion: _valores(dw.update_seccion_comp_options(seccion, b))),
+        ],
+        lambda b, seccion, comp: ("update_seccion", (seccion, comp, b)),
+    ),
+    "tabla-alumnos": (
+        "tab-alumno",
+        [
+            ("alumno-grado-select", lambda b: sorted(dw.ctx_bimestre(b)["df_estadisticas"]["Grado"].unique())),
+            ("alumno-seccion-select", lambda b, grado: _valores(dw.update_alumno_seccion(grado, b))),
+            ("alumno-curso-select", lambda b, grado, seccion: _valores(dw.update_alumno_curso(grado, seccion, b))),
+        ],
+        lambda b, grado, seccion, curso: ("mostrar_tabla_alumnos", (grado, seccion, curso, b)),
+    ),
+    "tabla-riesgo": (
+        "tab-riesgo",
+        [
+            ("riesgo-grado-select", lambda b: _opcional(sorted(dw.ctx_bimestre(b)["df_estadisticas"]["Grado"].unique()))),
+            ("riesgo-seccion-select", lambda b, grado: _opcional(_valores(dw.update_alumno_seccion(grado, b)) if grado else sorted(dw.ctx_bimestre(b)["df_estadisticas"]["Seccion"].unique()))),
+            ("riesgo-por-seccion", lambda b, grado, seccion: [None, "si"]),
+        ],
+        lambda b, grado, seccion, por_seccion: ("mostrar_ranking_riesgo", (grado, seccion, CANTIDAD_RIESGO, [por_seccion] if por_seccion else [], b)),
+    ),
+}
+
+# La tendencia recorre todos los bimestres, así que no depende del seleccionado
+VISTAS_GLOBALES = {
+    "grafico-tendencia": (
+        "tab-tendencias",
+        [
+            ("tendencia-grado-select", lambda b: _opcional(dw.TENDENCIAS.valores("Grado"))),
+            ("tendencia-seccion-select", lambda b, grado: _opcional(sorted(dw.SECCIONES_POR_GRADO.get(grado, set())) if grado else [])),
+            ("tendencia-curso-select", lambda b, grado, seccion: _opcional(dw.TENDENCIAS.valores("Curso"))),
+            ("tendencia-competencia-select", lambda b, grado, seccion, curso: _opcional(dw.TENDENCIAS.valores("Competencia", Curso=curso) if curso else [])),
+        ],
+        # Igual que `grafico_tendencia`: la competencia manda sobre el curso
+        lambda b, grado, seccion, curso, comp: (
+            "grafico_tendencia",
+            (grado, seccion, None if comp else curso, comp),
+        ),
+    ),
+}
+
+
+def id_fragmento(nombre: str, args: tuple) -> str:
+    return hashlib.sha1(repr((nombre, args)).encode("utf-8")).hexdigest()[:16]
+
+
+def registrar(tareas: dict, nombre: str, args: tuple) -> str:
+    fid = id_fragmento(nombre, args)
+    tareas.setdefault(fid, (nombre, args))
+    return fid
+
+
+def arbol_vista(tareas: dict, bimestre, niveles: list, hoja, anteriores: tuple = ()):
+    """Árbol [[valor, subárbol], ...] de un grupo de dropdowns en cascada; cada
+    hoja es el id del fragmento pre-renderizado. Un dropdown sin opciones queda
+    vacío (None), como en el servidor."""
+    if len(anteriores) == len(niveles):
+        return registrar(tareas, *hoja(bimestre, *anteriores))
+    _, valores = niveles[len(anteriores)]
+    return [
+        ["" if valor is None else str(valor), arbol_vista(tareas, bimestre, niveles, hoja, anteriores + (valor,))]
+        for valor in (valores(bimestre, *anteriores) or [None])
+    ]
+
+
+def construir_manifiesto(tareas: dict) -> dict:
+    bimestres = dw.TENDENCIAS.bimestres
+    vistas = {}
+    for contenedor, (pestana, niveles, hoja) in VISTAS.items():
+        vistas[contenedor] = {
+            "pestana": pestana,
+            "selectores": [selector for selector, _ in niveles],
+            "global": False,
+            "arbol": {b: arbol_vista(tareas, b, niveles, hoja) for b in bimestres},
+        }
+    for contenedor, (pestana, niveles, hoja) in VISTAS_GLOBALES.items():
+        vistas[contenedor] = {
+            "pestana": pestana,
+            "selectores": [selector for selector, _ in niveles],
+            "global": True,
+            "arbol": arbol_vista(tareas, None, niveles, hoja),
+        }
+
+    alumnos = []
+    perfiles = {}
+    for entrada_id, entrada in sorted(enumerate(dw.INDICE_ALUMNOS.entradas), key=lambda e: e[1]["clave"]):
+        ultimo = entrada["bimestres"][max(entrada["bimestres"], key=clave_bimestre)]
+        alumnos.append([entrada_id, entrada["nombre"], entrada["clave"], f"{ultimo['grado']} - {ultimo['seccion']}"])
+        perfiles[entrada_id] = registrar(tareas, "perfil_alumno", (entrada_id,))
+
+    return {
+        "bimestres": bimestres,
+        "defecto": dw.DEFAULT_BIMESTRE,
+        "vistas": vistas,
+        "metricas": {b: {tab: registrar(tareas, "actualizar_metricas", (tab, b)) for tab in dw.LAYOUTS_TAB if tab not in PESTANAS_SIN_EXPORTAR} for b in bimestres},
+        "etiquetas": {"mapa-indicador": dw.INDICADORES_MAPA},
+        "alumnos": alumnos,
+        "perfiles": perfiles,
+    }
+
+
+def _css(estilo: dict) -> str:
+    declaraciones = []
+    for clave, valor in estilo.items():
+        propiedad = re.sub(r"([A-Z])", lambda m: "-" + m.group(1).lower(), clave)
+        if isinstance(valor, (int, float)) and valor != 0 and clave not in CSS_SIN_UNIDAD:
+            valor = f"{valor}px"
+        declaraciones.append(f"{propiedad}:{valor}")
+    return ";".join(declaraciones)
+
+
+def _atributos(props: dict) -> str:
+    partes = []
+    for prop, atributo in ATRIBUTOS.items():
+        valor = props.get(prop)
+        if valor is None or not isinstance(valor, (str, int)):
+            continue
+        if prop in ("src", "href") and str(valor).startswith("/"):
+            valor = str(valor)[1:]  # rutas relativas para publicar en cualquier subcarpeta
+        partes.append(f' {atributo}="{html_std.escape(str(valor))}"')
+    if props.get("style"):
+        partes.append(f' style="{html_std.escape(_css(props["style"]))}"')
+    return "".join(partes)
+
+
+def _dropdown(props: dict) -> str:
+    placeholder = html_std.escape(props.get("placeholder") or "")
+    opciones = []
+    if props.get("value") is None:
+        # Sin valor inicial el dropdown muestra su placeholder (vale "" en el manifiesto)
+        opciones.append(f'<option value="" selected>{placeholder or "—"}</option>')
+    for opcion in props.get("options") or []:
+        valor, etiqueta = (opcion["value"], opcion["label"]) if isinstance(opcion, dict) else (opcion, opcion)
+        seleccionado = " selected" if valor == props.get("value") else ""
+        opciones.append(f'<option value="{html_std.escape(str(valor))}"{seleccionado}>{html_std.escape(str(etiqueta))}</option>')
+    return f'<select{_atributos(props)} data-placeholder="{placeholder}">{"".join(opciones)}</select>'
+
+
+def a_html(nodo, figuras: list) -> str:
+    """HTML de un árbol de componentes Dash. Las figuras se agregan a
+    `figuras` y quedan como `<div data-figura=i>` para que `vistas.js` las dibuje."""
+    if nodo is None:
+        return ""
+    if isinstance(nodo, (list, tuple)):
+        return "".join(a_html(hijo, figuras) for hijo in nodo)
+    if not isinstance(nodo, Component):
+        return html_std.escape(str(nodo))
+
+    props = nodo.to_plotly_json()["props"]
+    if isinstance(nodo, dcc.Graph):
+        figura = props.get("figure") or {}
+        figuras.append(figura.to_plotly_json() if hasattr(figura, "to_plotly_json") else figura)
+        return f'<div class="grafico" data-figura="{len(figuras) - 1}"{_atributos(props)}></div>'
+    if isinstance(nodo, dcc.Dropdown):
+        return _dropdown(props)
+    if isinstance(nodo, dcc.Input):
+        extra = f' type="{props.get("type", "text")}" placeholder="{html_std.escape(props.get("placeholder") or "")}"'
+        if props.get("type") == "number":
+            extra += f' value="{props.get("value", "")}" disabled'
+        return f"<input{_atributos(props)}{extra}>"
+    if isinstance(nodo, dcc.Checklist):
+        # Cada opción es una casilla; el id queda en la casilla, no en la etiqueta
+        etiqueta = _atributos({k: v for k, v in props.items() if k != "id"})
+        return "".join(
+            f'<label{etiqueta}><input type="checkbox" id="{props["id"]}" value="{html_std.escape(str(o["value"]))}">{html_std.escape(o["label"])}</label>'
+            for o in props.get("options", [])
+        )
+
+    etiqueta = nodo._type.lower()
+    if etiqueta in ETIQUETAS_VACIAS:
+        return f"<{etiqueta}{_atributos(props)}>"
+    return f"<{etiqueta}{_atributos(props)}>{a_html(props.get('children'), figuras)}</{etiqueta}>"
+
+
+def pagina() -> str:
+    encabezado, metricas, _, pestanas = dw.app.layout.children
+    css = re.search(r"<style>(.*?)</style>", dw.app.index_string, re.S).group(1)
+    barra = "".join(
+        f'<div role="tab" class="tab" data-tab="{tab.value}">{html_std.escape(tab.label)}</div>'
+        for tab in pestanas.children
+        if tab.value not in PESTANAS_SIN_EXPORTAR
+    )
+    paneles = "".join(
+        f'<div role="tabpanel" data-tab="{tab}"><div id="contenido-{tab}" style="padding:20px">{a_html(layout(), [])}</div></div>'
+        for tab, layout in dw.LAYOUTS_TAB.items()
+        if tab not in PESTANAS_SIN_EXPORTAR
+    )
+    cuerpo = a_html(encabezado, []) + a_html(metricas, []) + f'<div role="tablist">{barra}</div>{paneles}'
+    return (
+        '<!DOCTYPE html>\n<html lang="es">\n<head>\n<meta charset="utf-8">\n'
+        '<meta name="viewport" content="width=device-width, initial-scale=1">\n'
+        "<title>Dashboard Académico - I.E. Amalia del Águila Velásquez</title>\n"
+        f"<style>{css}{CSS_ESTATICO}</style>\n"
+        '<script src="plotly.min.js"></script>\n<script src="vistas.js"></script>\n</head>\n<body>\n'
+        f'<div id="react-entry-point"><div style="padding:30px;font-family:Arial, sans-serif;background-color:#f5f6fa">{cuerpo}</div></div>\n'
+        "</body>\n</html>\n"
+    )
+
+
+def _componente(nombre: str, args: tuple):
+    if nombre == "actualizar_metricas":
+        return dw.actualizar_metricas(*args)[0]
+    return getattr(dw, nombre)(*args)
+
+
+def renderizar_lote(lote: list, carpeta: str) -> int:
+    """Se ejecuta en cada proceso: renderiza un lote de fragmentos y devuelve los bytes escritos."""
+    escritos = 0
+    for fid, nombre, args in lote:
+        figuras = []
+        contenido = a_html(_componente(nombre, args), figuras)
+        datos = json.dumps({"html": contenido, "figuras": figuras}, cls=plotly.utils.PlotlyJSONEncoder, separators=(",", ":"))
+        (Path(carpeta) / f"{fid}.json").write_text(datos, encoding="utf-8")
+        escritos += len(datos)
+    return escritos
+
+
+def exportar(destino: Path, procesos: int):
+    inicio = time.perf_counter()
+    fragmentos = destino / "fragmentos"
+    if fragmentos.exists():
+        shutil.rmtree(fragmentos)
+    fragmentos.mkdir(parents=True)
+
+    tareas = {}
+    manifiesto = construir_manifiesto(tareas)
+    (destino / "manifiesto.json").write_text(json.dumps(manifiesto, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+    (destino / "index.html").write_text(pagina(), encoding="utf-8")
+    (destino / "vistas.js").write_text(VISTAS_JS, encoding="utf-8")
+    (destino / "plotly.min.js").write_text(get_plotlyjs(), encoding="utf-8")
+    assets = Path(dw.__file__).resolve().parent / "assets"
+    if assets.is_dir():
+        shutil.copytree(assets, destino / "assets", dirs_exist_ok=True)
+    print(f"Manifiesto: {len(manifiesto['vistas'])} vistas, {len(tareas):,} fragmentos por renderizar")
+
+    pendientes = [(fid, nombre, args) for fid, (nombre, args) in tareas.items()]
+    lotes = [pendientes[i:i + TAMANO_LOTE] for i in range(0, len(pendientes), TAMANO_LOTE)]
+    # Con fork los procesos heredan los contextos ya cargados
+    with ProcessPoolExecutor(max_workers=procesos) as pool:
+        total = sum(pool.map(renderizar_lote, lotes, [str(fragmentos)] * len(lotes)))
+
+    print(f"Exportado en {destino}: {len(pendientes):,} fragmentos, {total / 1024 ** 2:,.1f} MB, {time.perf_counter() - inicio:.1f}s con {procesos} procesos")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Exporta el dashboard como sitio estático")
+    parser.add_argument("--destino", default="estatico", help="Carpeta de salida")
+    parser.add_argument("--procesos", type=int, default=os.cpu_count() or 1, help="Procesos para renderizar")
+    args = parser.parse_args()
+
+    destino = Path(args.destino)
+    destino.mkdir(parents=True, exist_ok=True)
+    exportar(destino, args.procesos)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+import re
+import unicodedata
+from bisect import bisect_left
+
+
+def normalizar(texto: str) -> str:
+    """Minúsculas, sin tildes ni signos: "Ñahui, José" -> "nahui jose"."""
+    texto = unicodedata.normalize("NFKD", str(texto))
+    texto = "".join(c for c in texto if not unicodedata.combining(c)).lower()
+    return re.sub(r"[^a-z0-9]+", " ", texto).strip()
+
+
+def trigramas(texto: str) -> set:
+    return {texto[i:i + 3] for i in range(len(texto) - 2)}
+
+
+class IndiceAlumnos:
+    """Índice de nombres de alumnos sobre todos los bimestres cargados.
+
+    Cada entrada es un alumno con a lo sumo una fila del `df_data` de cada
+    bimestre, y se identifica por (bimestre, fila) de la primera. El nombre
+    normalizado solo sirve para buscar y para enlazar la fila de otro bimestre
+    (de preferencia con el mismo grado y sección), así que dos homónimos de un
+    mismo bimestre quedan como entradas distintas. Las palabras de 3 o más
+    letras se buscan por intersección de trigramas y las más cortas por
+    prefijo sobre la lista ordenada de palabras, así que una búsqueda solo
+    recorre los alumnos candidatos y no el padrón completo.
+    """
+
+    def __init__(self):
+        self.entradas = []
+        self._por_fila = {}
+        self._por_clave = {}
+        self._trigramas = {}
+        self._palabras = []
+
+    def _enlazar(self, clave: str, bimestre: str, grado, seccion):
+        """Entrada de otro bimestre con el mismo nombre que aún no tiene fila en `bimestre`."""
+        libres = [e for e in self._por_clave.get(clave, []) if bimestre not in self.entradas[e]["bimestres"]]
+        for entrada_id in libres:
+            ubicaciones = self.entradas[entrada_id]["bimestres"].values()
+            if any(u["grado"] == grado and u["seccion"] == seccion for u in ubicaciones):
+                return entrada_id
+        return libres[0] if libres else None
+
+    def agregar_bimestre(self, bimestre: str, alumnos):
+        """`alumnos`: nombre_alumno, grado y seccion en el orden de `df_data`."""
+        nuevas_palabras = []
+        for fila, (nombre, grado, seccion) in enumerate(zip(alumnos["nombre_alumno"], alumnos["grado"], alumnos["seccion"])):
+            clave = normalizar(nombre)
+            if not clave or (bimestre, fila) in self._por_fila:
+                continue
+            entrada_id = self._enlazar(clave, bimestre, grado, seccion)
+            if entrada_id is None:
+                entrada_id = len(self.entradas)
+                self._por_clave.setdefault(clave, []).append(entrada_id)
+                self.entradas.append({"clave": clave, "nombre": nombre, "bimestres": {}})
+                for tri in trigramas(clave):
+                    self._trigramas.setdefault(tri, set()).add(entrada_id)
+                nuevas_palabras.extend((palabra, entrada_id) for palabra in clave.split())
+            self._por_fila[(bimestre, fila)] = entrada_id
+            self.entradas[entrada_id]["bimestres"][bimestre] = {"fila": fila, "grado": grado, "seccion": seccion}
+        if nuevas_palabras:
+            self._palabras = sorted(self._palabras + nuevas_palabras)
+
+    def _por_prefijo(self, prefijo: str) -> set:
+        encontrados = set()
+        pos = bisect_left(self._palabras, (prefijo,))
+        while pos < len(self._palabras) and self._palabras[pos][0].startswith(prefijo):
+            encontrados.add(self._palabras[pos][1])
+            pos += 1
+        return encontrados
+
+    def _candidatos(self, palabra: str) -> set:
+        if len(palabra) < 3:
+            return self._por_prefijo(palabra)
+        postings = sorted((self._trigramas.get(tri, set()) for tri in trigramas(palabra)), key=len)
+        candidatos = set(postings[0])
+        for posting in postings[1:]:
+            candidatos &= posting
+            if not candidatos:
+                break
+        return candidatos
+
+    def buscar(self, texto: str, limite: int = 15) -> list:
+        palabras = normalizar(texto).split()
+        if not palabras:
+            return []
+        # Primero la palabra más larga: suele dejar menos candidatos
+        palabras.sort(key=len, reverse=True)
+        candidatos = None
+        for palabra in palabras:
+            encontrados = self._candidatos(palabra)
+            candidatos = encontrados if candidatos is None else candidatos & encontrados
+            if not candidatos:
+                return []
+        resultados = [
+            entrada_id
+            for entrada_id in candidatos
+            if all(palabra in self.entradas[entrada_id]["clave"] for palabra in palabras)
+        ]
+        resultados.sort(key=lambda entrada_id: (self.entradas[entrada_id]["clave"], entrada_id))
+        return [dict(self.entradas[entrada_id], id=entrada_id) for entrada_id in resultados[:limite]]
@@ -0,0 +1,59 @@
+import numpy as np
+
+
+def _bits(mascara: np.ndarray) -> int:
+    """Arreglo booleano -> entero cuyo bit i vale mascara[i]."""
+    return int.from_bytes(np.packbits(mascara, bitorder="little").tobytes(), "little")
+
+
+class IndiceBits:
+    """Índice de bitsets sobre las evaluaciones (alumno x competencia) de un bimestre.
+
+    La evaluación del alumno `a` en la columna `c` es el bit `a * columnas + c`.
+    Cada valor de grado, sección, curso, competencia y nivel tiene su bitset, así
+    que un filtro de varios valores por campo se resuelve con OR dentro del campo,
+    AND entre campos y `int.bit_count` por nivel, sin máscaras de pandas.
+    """
+
+    def __init__(self, matriz: np.ndarray, por_alumno: dict, por_columna: dict, niveles: dict):
+        """`matriz`: códigos de nivel alumnos x columnas (0 = sin nota).
+        `por_alumno` / `por_columna`: campo -> valor de cada fila / columna.
+        `niveles`: nombre del nivel -> código en la matriz."""
+        alumnos, columnas = matriz.shape
+        self.total = alumnos * columnas
+        self.todos = (1 << self.total) - 1
+        self.campos = {}
+        for campo, valores in por_alumno.items():
+            valores = np.asarray(valores)
+            self.campos[campo] = {v: _bits(np.repeat(valores == v, columnas)) for v in np.unique(valores)}
+        for campo, valores in por_columna.items():
+            valores = np.asarray(valores)
+            self.campos[campo] = {v: _bits(np.tile(valores == v, alumnos)) for v in np.unique(valores)}
+        plana = matriz.ravel()
+        self.niveles = {nivel: _bits(plana == codigo) for nivel, codigo in niveles.items()}
+
+    def seleccion(self, **filtros) -> int:
+        """Bitset de `Grado=["CUARTO", "QUINTO"], Curso=["MATEMATICA"]`; campos
+        vacíos o ausentes no filtran."""
+        mascara = self.todos
+        for campo, valores in filtros.items():
+            if not valores:
+                continue
+            union = 0
+            for valor in valores:
+                union |= self.campos[campo].get(valor, 0)
+            mascara &= union
+        return mascara
+
+    def contar(self, mascara: int) -> dict:
+        return {nivel: (mascara & bits).bit_count() for nivel, bits in self.niveles.items()}
+
+    def desglose(self, campo: str, **filtros) -> dict:
+        """{valor de `campo`: conteo por nivel} dentro de la selección, solo valores con notas."""
+        mascara = self.seleccion(**filtros)
+        resultado = {}
+        for valor, bits in self.campos[campo].items():
+            conteo = self.contar(mascara & bits)
+            if any(conteo.values()):
+                resultado[valor] = conteo
+        return resultado
@@ -1,19 +1,170 @@
-import pandas as pd
+"""Perfil de los libros de bimestre y detección de su estructura.
+
+Cada hoja se lee una sola vez por motor (sin encabezado) y sobre esa lectura se
+ubican la fila de encabezados (la que contiene nro, GRADO y SECCION) y la fila
+de cursos encima de ella. `dashboard_web.leer_bimestre` usa la misma detección,
+así que un libro con filas de título extra se carga igual.
+
+Uso:
+    python inspect_excel.py
+    python inspect_excel.py DASHBOARD_IV_BIMESTRE.xlsx --motores openpyxl calamine
+"""
+import argparse
+import time
 from pathlib import Path
 
-for fname in ["DASHBOARD_II_BIMESTRE.xlsx", "DASHBOARD_III_BIMESTRE.xlsx"]:
-    path = Path(fname)
-    if not path.exists():
-        print(f"Missing file: {path}")
-        continue
-    xl = pd.ExcelFile(path)
-    print(f"\n=== {path.name} sheets: {xl.sheet_names}")
-    for sheet in xl.sheet_names:
-        df = xl.parse(sheet)
-        print(f"\n-- {sheet} --")
-        print(df.head())
-        print("columns", df.columns.tolist())
-
-        df_raw = xl.parse(sheet, header=None)
-        print("raw head:")
-        print(df_raw.head())
+import pandas as pd
+from pandas.io.parsers import TextParser
+
+ARCHIVOS = ["DASHBOARD_II_BIMESTRE.xlsx", "DASHBOARD_III_BIMESTRE.xlsx"]
+MOTORES = ["openpyxl", "calamine"]
+# Encabezados que debe tener la hoja de alumnos (los renombra `leer_bimestre`)
+COLUMNAS_ALUMNO = ["nro", "GRADO/SECCION", "GRADO", "SECCION", "APELLIDOS Y NOMBRES"]
+COLUMNAS_REQUERIDAS = ["nro", "GRADO", "SECCION"]
+# Sin estas columnas el libro se carga igual
+COLUMNAS_OPCIONALES = ["GRADO/SECCION"]
+FILAS_BUSQUEDA = 20
+
+
+def _texto(valor) -> str:
+    return str(valor).strip() if pd.notna(valor) else ""
+
+
+def detectar_layout(raw: pd.DataFrame) -> dict:
+    """Filas de encabezados y de cursos de una hoja leída con `header=None`.
+
+    La fila de cursos es, entre las de arriba del encabezado, la que tiene más
+    valores distintos sobre las columnas de competencias (la fila de títulos
+    "COMPETENCIAS" repite un solo valor). Si no hay ninguna queda en None.
+    """
+    for fila_encabezados in range(min(FILAS_BUSQUEDA, len(raw))):
+        encabezados = [_texto(v) for v in raw.iloc[fila_encabezados]]
+        if all(col in encabezados for col in COLUMNAS_REQUERIDAS):
+            break
+    else:
+        raise ValueError(
+            f"No se encontró la fila con {', '.join(COLUMNAS_REQUERIDAS)} en las primeras {FILAS_BUSQUEDA} filas"
+        )
+
+    columnas_comp = [i for i, col in enumerate(encabezados) if col and col not in COLUMNAS_ALUMNO]
+    fila_cursos, mejor = None, 0
+    for fila in range(fila_encabezados):
+        distintos = len({_texto(v) for v in raw.iloc[fila, columnas_comp]} - {""})
+        if distintos > mejor:
+            fila_cursos, mejor = fila, distintos
+
+    return {
+        "fila_encabezados": fila_encabezados,
+        "fila_cursos": fila_cursos,
+        "faltantes": [col for col in COLUMNAS_ALUMNO if col not in encabezados],
+        "faltantes_obligatorias": [col for col in COLUMNAS_ALUMNO if col not in encabezados + COLUMNAS_OPCIONALES],
+        "columnas_competencia": len(columnas_comp),
+    }
+
+
+def tabla_desde_raw(raw: pd.DataFrame, fila_encabezados: int) -> pd.DataFrame:
+    """Lo mismo que `read_excel(header=fila_encabezados)`, sin volver a leer el libro."""
+    return TextParser(raw.values.tolist(), header=fila_encabezados).read()
+
+
+def fila_cursos(raw: pd.DataFrame, layout: dict) -> pd.Series:
+    if layout["fila_cursos"] is None:
+        return pd.Series([None] * raw.shape[1])
+    return raw.iloc[layout["fila_cursos"]].reset_index(drop=True)
+
+
+def validar_alumnos(df: pd.DataFrame) -> list:
+    problemas = []
+    nro = pd.to_numeric(df["nro"], errors="coerce")
+    if nro.isna().any():
+        problemas.append(f"{int(nro.isna().sum())} filas sin nro numérico (se descartan)")
+    validas = df[nro.notna()]
+    for col in ("GRADO", "SECCION"):
+        vacias = validas[col].isna().sum()
+        if vacias:
+            problemas.append(f"{int(vacias)} alumnos sin {col}")
+    return problemas
+
+
+def estimar_contexto(df: pd.DataFrame, cursos: pd.Series) -> dict:
+    """Tamaño aproximado en memoria de `df_data` y de la tabla larga de evaluaciones."""
+    compet_cols = [c for c in df.columns if c not in COLUMNAS_ALUMNO]
+    niveles = df[compet_cols].astype(str).apply(lambda col: col.str.strip())
+    evaluadas = niveles.isin(["AD", "A", "B", "C"])
+    largo = niveles.where(evaluadas).melt(var_name="Competencia", value_name="Nivel").dropna()
+    curso_por_columna = dict(zip(df.columns, cursos))
+    largo["Curso"] = largo["Competencia"].map(curso_por_columna)
+    # `leer_bimestre` repite por evaluación alumno_id, nombre y grado/sección (dos veces)
+    por_fila = df[["nro", "APELLIDOS Y NOMBRES", "GRADO", "SECCION", "GRADO", "SECCION"]].memory_usage(deep=True, index=False).sum() / max(len(df), 1)
+    return {
+        "evaluaciones": len(largo),
+        "bytes_data": int(df.memory_usage(deep=True).sum()),
+        "bytes_largo": int(largo.memory_usage(deep=True).sum() + por_fila * len(largo)),
+        "sin_curso": sum(not _texto(curso_por_columna[c]) for c in compet_cols),
+    }
+
+
+def leer_crudo(path: Path, motor: str):
+    """Todas las hojas sin encabezado, en una sola pasada. None si el motor no está instalado."""
+    inicio = time.perf_counter()
+    try:
+        hojas = pd.read_excel(path, sheet_name=None, header=None, engine=motor)
+    except ImportError:
+        return None, 0.0
+    return hojas, time.perf_counter() - inicio
+
+
+def perfilar(path: Path, motores: list):
+    print(f"\n=== {path.name} ({path.stat().st_size / 1024:,.0f} KB)")
+    hojas = None
+    for motor in motores:
+        crudo, segundos = leer_crudo(path, motor)
+        if crudo is None:
+            print(f"  motor {motor:<10} no disponible")
+            continue
+        print(f"  motor {motor:<10} {segundos * 1000:>8.0f} ms")
+        hojas = hojas or crudo
+    if hojas is None:
+        return
+
+    for nombre, raw in hojas.items():
+        print(f"\n  -- {nombre}: {raw.shape[0]} filas x {raw.shape[1]} columnas")
+        try:
+            layout = detectar_layout(raw)
+        except ValueError as error:
+            print(f"     sin tabla de alumnos ({error})")
+            continue
+        cursos = fila_cursos(raw, layout)
+        df = tabla_desde_raw(raw, layout["fila_encabezados"])
+        print(f"     encabezados en fila {layout['fila_encabezados']}, cursos en fila {layout['fila_cursos']}")
+        print(f"     {len(df)} filas de datos, {layout['columnas_competencia']} competencias")
+        for problema in [f"falta la columna {col}" for col in layout["faltantes"]] + validar_alumnos(df):
+            print(f"     ! {problema}")
+        if layout["faltantes_obligatorias"]:
+            continue
+        estimado = estimar_contexto(df.dropna(subset=["nro"]), cursos)
+        if estimado["sin_curso"]:
+            print(f"     ! {estimado['sin_curso']} competencias sin curso en la fila de cursos (quedan como 'Sin curso')")
+        total = (estimado["bytes_data"] + estimado["bytes_largo"]) / 1024 ** 2
+        print(
+            f"     contexto estimado: {total:,.1f} MB "
+            f"(df_data {estimado['bytes_data'] / 1024 ** 2:,.1f} MB, {estimado['evaluaciones']:,} evaluaciones en formato largo)"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Perfil y estructura de los libros de bimestre")
+    parser.add_argument("archivos", nargs="*", default=ARCHIVOS)
+    parser.add_argument("--motores", nargs="+", default=MOTORES, help="Motores de pandas.read_excel a comparar")
+    args = parser.parse_args()
+
+    for fname in args.archivos:
+        path = Path(fname)
+        if not path.exists():
+            print(f"Missing file: {path}")
+            continue
+        perfilar(path, args.motores)
+
+
+if __name__ == "__main__":
+    main()
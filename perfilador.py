@@ -0,0 +1,180 @@
+import cProfile
+import hashlib
+import hmac
+import html
+import io
+import json
+import pstats
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+from flask import abort, g, request, send_from_directory
+
+RUTA_CALLBACKS = "/_dash-update-component"
+CABECERA = "X-Perfilar"
+PARAMETRO = "perfilar"
+COOKIE = "perfilar"
+
+
+class Perfilador:
+    """Perfila bajo demanda callbacks individuales del dashboard.
+
+    Solo se instala si hay un token de administrador. Una solicitud a
+    `/_dash-update-component` se perfila con cProfile cuando trae el token en la
+    cabecera `X-Perfilar`, en `?perfilar=` o en la cookie que deja abrir el
+    dashboard con `?perfilar=<token>`. Cada llamada perfilada guarda su `.prof`
+    (para pstats o snakeviz) y un `.json` con el callback, sus entradas y la
+    duración; `/admin/perfiles` lista las más lentas.
+
+    cProfile perfila todo el proceso, no solo el hilo de la solicitud. En
+    Python 3.12 solo puede haber un perfil activo a la vez, así que se
+    perfila una sola llamada a la vez. Las que llegan mientras tanto se
+    atienden sin perfil (cabecera `X-Perfil: ocupado`). Además, un perfil
+    incluye el trabajo de los otros hilos del worker, así que conviene
+    perfilar con poca carga, por ejemplo `carga_prueba.py --usuarios 1`.
+    """
+
+    def __init__(self, carpeta, token: str, lento_ms: float = 500, max_registros: int = 200):
+        self.carpeta = Path(carpeta)
+        self.carpeta.mkdir(parents=True, exist_ok=True)
+        self.token = token
+        self.lento_ms = lento_ms
+        self.max_registros = max_registros
+        self._activo = threading.Lock()
+        # La cookie guarda un valor derivado del token, no el token mismo
+        self._cookie = hmac.new(token.encode("utf-8"), b"cookie-perfilar", hashlib.sha256).hexdigest()
+
+    def instalar(self, server):
+        server.before_request(self._antes)
+        server.after_request(self._despues)
+        server.teardown_request(self._liberar)
+        server.add_url_rule("/admin/perfiles", "perfiles", self.pagina)
+        server.add_url_rule("/admin/perfiles/<registro>", "perfil_detalle", self.detalle)
+        server.add_url_rule("/admin/perfiles/<registro>.prof", "perfil_descarga", self.descarga)
+
+    def autorizado(self) -> bool:
+        enviado = request.headers.get(CABECERA) or request.args.get(PARAMETRO)
+        if enviado:
+            return hmac.compare_digest(enviado, self.token)
+        cookie = request.cookies.get(COOKIE)
+        return bool(cookie) and hmac.compare_digest(cookie, self._cookie)
+
+    def _antes(self):
+        if not (request.path.endswith(RUTA_CALLBACKS) and self.autorizado()):
+            return
+        if not self._activo.acquire(blocking=False):
+            g.perfil_ocupado = True
+            return
+        perfil = cProfile.Profile()
+        try:
+            perfil.enable()
+        except ValueError:
+            # Otra herramienta de perfilado ya está activa en el proceso
+            self._activo.release()
+            g.perfil_ocupado = True
+            return
+        g.perfil = perfil
+        g.perfil_inicio = time.perf_counter()
+
+    def _despues(self, respuesta):
+        perfil = g.pop("perfil", None)
+        if perfil is not None:
+            perfil.disable()
+            self._activo.release()
+            duracion_ms = (time.perf_counter() - g.pop("perfil_inicio")) * 1000
+            respuesta.headers["X-Perfil"] = self._guardar(perfil, duracion_ms, respuesta.status_code)
+        elif g.pop("perfil_ocupado", False):
+            respuesta.headers["X-Perfil"] = "ocupado"
+        elif request.args.get(PARAMETRO) and self.autorizado():
+            # Abrir el dashboard con ?perfilar=<token> perfila los callbacks de esa sesión
+            respuesta.set_cookie(COOKIE, self._cookie, httponly=True, secure=True, samesite="Strict")
+        return respuesta
+
+    def _liberar(self, error=None):
+        # Si after_request no llegó a correr, el perfil no puede quedar activo
+        perfil = g.pop("perfil", None)
+        if perfil is not None:
+            perfil.disable()
+            self._activo.release()
+
+    def _guardar(self, perfil: cProfile.Profile, duracion_ms: float, status: int) -> str:
+        fecha = datetime.now()
+        payload = request.get_json(silent=True) or {}
+        registro = f"{fecha:%Y%m%d-%H%M%S-%f}"
+
+        resumen = io.StringIO()
+        estadisticas = pstats.Stats(perfil, stream=resumen)
+        estadisticas.dump_stats(self.carpeta / f"{registro}.prof")
+        estadisticas.sort_stats("cumulative").print_stats(30)
+
+        datos = {
+            "registro": registro,
+            "fecha": fecha.isoformat(timespec="seconds"),
+            "callback": payload.get("output", ""),
+            "disparador": payload.get("changedPropIds", []),
+            "entradas": {f"{e.get('id')}.{e.get('property')}": e.get("value") for e in payload.get("inputs", []) + payload.get("state", []) if isinstance(e, dict)},
+            "duracion_ms": round(duracion_ms, 1),
+            "status": status,
+            "resumen": resumen.getvalue(),
+        }
+        (self.carpeta / f"{registro}.json").write_text(json.dumps(datos, ensure_ascii=False, default=str), encoding="utf-8")
+
+        # Se conservan solo los registros más recientes
+        for viejo in sorted(self.carpeta.glob("*.json"))[: -self.max_registros]:
+            viejo.unlink(missing_ok=True)
+            viejo.with_suffix(".prof").unlink(missing_ok=True)
+        return registro
+
+    def registros(self, limite: int = 50) -> list:
+        recientes = sorted(self.carpeta.glob("*.json"), reverse=True)[:limite]
+        datos = [json.loads(path.read_text(encoding="utf-8")) for path in recientes]
+        return sorted(datos, key=lambda d: d["duracion_ms"], reverse=True)
+
+    def pagina(self):
+        if not self.autorizado():
+            abort(403)
+        filas = []
+        for d in self.registros():
+            lento = d["duracion_ms"] >= self.lento_ms
+            entradas = html.escape(json.dumps(d["entradas"], ensure_ascii=False, default=str))
+            filas.append(
+                f"<tr{' class=lento' if lento else ''}><td>{d['fecha']}</td>"
+                f"<td><a href='/admin/perfiles/{d['registro']}'>{html.escape(d['callback'])}</a></td>"
+                f"<td class=num>{d['duracion_ms']:.1f}</td><td>{html.escape(', '.join(d['disparador']))}</td>"
+                f"<td class=entradas>{entradas[:200]}</td></tr>"
+            )
+        return (
+            "<!DOCTYPE html><html><head><meta charset='utf-8'><title>Perfiles de callbacks</title><style>"
+            "body{font-family:Arial,sans-serif;margin:30px}table{border-collapse:collapse;font-size:13px}"
+            "td,th{border:1px solid #ddd;padding:6px;vertical-align:top}.num{text-align:right}"
+            ".lento{background:#f5b7b1}.entradas{font-family:monospace;max-width:500px;word-break:break-all}"
+            "</style></head><body>"
+            f"<h2>Últimas llamadas perfiladas (más lentas primero, en rojo las de {self.lento_ms:.0f} ms o más)</h2>"
+            f"<p>Para perfilar una sesión abra el dashboard con <code>?{PARAMETRO}=&lt;token&gt;</code> "
+            f"o envíe la cabecera <code>{CABECERA}</code>.</p>"
+            "<table><tr><th>Fecha</th><th>Callback</th><th>ms</th><th>Disparador</th><th>Entradas</th></tr>"
+            f"{''.join(filas)}</table></body></html>"
+        )
+
+    def detalle(self, registro: str):
+        if not self.autorizado():
+            abort(403)
+        path = self.carpeta / f"{Path(registro).name}.json"
+        if not path.exists():
+            abort(404)
+        d = json.loads(path.read_text(encoding="utf-8"))
+        return (
+            "<!DOCTYPE html><html><head><meta charset='utf-8'><title>Perfil</title></head>"
+            "<body style='font-family:Arial,sans-serif;margin:30px'>"
+            f"<p><a href='/admin/perfiles'>← volver</a> · <a href='/admin/perfiles/{d['registro']}.prof'>descargar .prof</a></p>"
+            f"<h2>{html.escape(d['callback'])}</h2><p>{d['fecha']} · {d['duracion_ms']:.1f} ms · status {d['status']}</p>"
+            f"<pre>{html.escape(json.dumps(d['entradas'], ensure_ascii=False, indent=2, default=str))}</pre>"
+            f"<pre>{html.escape(d['resumen'])}</pre></body></html>"
+        )
+
+    def descarga(self, registro: str):
+        if not self.autorizado():
+            abort(403)
+        return send_from_directory(self.carpeta.resolve(), f"{Path(registro).name}.prof", as_attachment=True)
@@ -0,0 +1,115 @@
+import re
+
+import pandas as pd
+
+ROMANOS = {"I": 1, "II": 2, "III": 3, "IV": 4}
+
+
+def clave_bimestre(bimestre: str):
+    """Orden cronológico de claves como "III" o "2024-II" (año, número de bimestre)."""
+    m = re.fullmatch(r"(?:(\d{4})\s*-\s*)?([IV]+)", str(bimestre).strip())
+    if not m:
+        return (0, 0, str(bimestre))
+    return (int(m.group(1) or 0), ROMANOS.get(m.group(2), 0), str(bimestre))
+
+
+def _porcentajes(tabla: pd.DataFrame, campos: list) -> pd.DataFrame:
+    grupo = campos + ["Bimestre"]
+    total = tabla.groupby(grupo)["Cantidad"].transform("sum")
+    tabla["Porcentaje"] = (tabla["Cantidad"] / total * 100).round(1)
+    return tabla
+
+
+class MotorTendencias:
+    """Distribución de niveles por bimestre, apilada en un eje de tiempo.
+
+    Cada contexto que se carga aporta sus tablas agregadas (una vez). Los
+    gráficos de tendencia solo toman una rebanada del índice ya ordenado, sin
+    volver a recorrer los libros de cada bimestre.
+    """
+
+    def __init__(self):
+        self._partes = {}
+        self._series = {}
+        self.bimestres = []
+
+    def agregar(self, bimestre: str, agregados: dict):
+        """`agregados`: {("Grado", "Competencia"): df con Nivel y Cantidad, ...}."""
+        tablas = {tuple(campos): df for campos, df in agregados.items()}
+        # Niveles derivados: por curso (sumando sus competencias), por competencia
+        # sin el curso, sin ninguno de los dos y del colegio completo
+        for campos, df in list(tablas.items()):
+            if "Competencia" not in campos:
+                continue
+            for quitar in ({"Competencia"}, {"Curso"}, {"Curso", "Competencia"}):
+                reducidos = tuple(c for c in campos if c not in quitar)
+                if reducidos and reducidos != campos:
+                    tablas.setdefault(reducidos, df.groupby(list(reducidos) + ["Nivel"], as_index=False)["Cantidad"].sum())
+        if ("Competencia",) in tablas:
+            tablas.setdefault((), tablas[("Competencia",)].groupby("Nivel", as_index=False)["Cantidad"].sum())
+
+        for campos, df in tablas.items():
+            parte = df[list(campos) + ["Nivel", "Cantidad"]].copy()
+            parte["Bimestre"] = bimestre
+            self._partes.setdefault(campos, []).append(parte)
+            self._series.pop(campos, None)
+        if bimestre not in self.bimestres:
+            self.bimestres = sorted(self.bimestres + [bimestre], key=clave_bimestre)
+
+    def _serie(self, campos: tuple) -> pd.DataFrame:
+        serie = self._series.get(campos)
+        if serie is None:
+            serie = _porcentajes(pd.concat(self._partes[campos], ignore_index=True), list(campos))
+            orden = {b: i for i, b in enumerate(self.bimestres)}
+            serie["Orden"] = serie["Bimestre"].map(orden)
+            serie = serie.set_index(list(campos) + ["Orden"], drop=False).sort_index() if campos else serie.sort_values("Orden")
+            self._series[campos] = serie
+        return serie
+
+    def serie(self, **filtros) -> pd.DataFrame:
+        """Bimestre, Nivel, Cantidad y Porcentaje para la combinación pedida,
+        p. ej. `serie(Grado="PRIMERO", Curso="MATEMATICA")`."""
+        campos = tuple(c for c in ("Grado", "Seccion", "Curso", "Competencia") if c in filtros)
+        if campos not in self._partes:
+            raise KeyError(f"No hay tendencia precalculada para {campos}")
+        serie = self._serie(campos)
+        if campos:
+            try:
+                serie = serie.loc[tuple(filtros[c] for c in campos)]
+            except KeyError:
+                serie = serie.iloc[0:0]
+        return serie.reset_index(drop=True)[["Bimestre", "Orden", "Nivel", "Cantidad", "Porcentaje"]]
+
+    def valores(self, campo: str, **filtros) -> list:
+        """Valores de `campo` presentes en algún bimestre, para llenar los filtros."""
+        necesarios = {campo, *filtros}
+        campos = min((c for c in self._partes if necesarios <= set(c)), key=len, default=None)
+        if campos is None:
+            return []
+        serie = self._serie(campos)
+        for nombre, valor in filtros.items():
+            serie = serie[serie[nombre] == valor]
+        return sorted(serie[campo].dropna().unique())
+
+
+class TendenciasAlmacen:
+    """La misma consulta que `MotorTendencias`, resuelta en el almacén SQLite.
+
+    Con almacén el historial puede abarcar varios años, así que en lugar de
+    juntar en memoria las tablas agregadas de todos los bimestres se lee la
+    tabla `conteos`, que el almacén agrega una sola vez al guardar cada
+    bimestre.
+    """
+
+    def __init__(self, almacen, bimestres: list):
+        self.almacen = almacen
+        self.bimestres = sorted(bimestres, key=clave_bimestre)
+
+    def serie(self, **filtros) -> pd.DataFrame:
+        serie = self.almacen.tendencia(filtros)
+        serie["Orden"] = serie["Bimestre"].map({b: i for i, b in enumerate(self.bimestres)})
+        serie = serie.sort_values("Orden", kind="stable").reset_index(drop=True)
+        return serie[["Bimestre", "Orden", "Nivel", "Cantidad", "Porcentaje"]]
+
+    def valores(self, campo: str, **filtros) -> list:
+        return self.almacen.valores_tendencia(campo, filtros)
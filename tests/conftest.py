@@ -0,0 +1,18 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+RAIZ = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ))
+
+
+@pytest.fixture(scope="session")
+def dw():
+    """dashboard_web cargado en memoria (sin almacén ni perfilador)."""
+    for variable in ("DASHBOARD_DB", "DASHBOARD_PERFIL_TOKEN"):
+        os.environ.pop(variable, None)
+    import dashboard_web
+
+    return dashboard_web
@@ -0,0 +1,88 @@
+import pandas as pd
+import pytest
+
+from almacen import AlmacenEvaluaciones
+
+
+@pytest.fixture(scope="module")
+def almacen(dw, tmp_path_factory):
+    almacen = AlmacenEvaluaciones(tmp_path_factory.mktemp("almacen") / "evaluaciones.db")
+    for clave, archivo in dw.BIMESTRE_FILES.items():
+        dw.sincronizar_almacen(almacen, f"2025-{clave}", archivo)
+    return almacen
+
+
+def test_agregados_iguales_a_memoria(dw, almacen):
+    for clave in dw.BIMESTRES:
+        ctx = dw.CONTEXTOS_BIMESTRE[clave]
+        for tabla, campos in dw.AGREGADOS.items():
+            esperado = ctx[tabla].reset_index(drop=True)
+            obtenido = almacen.agregado(f"2025-{clave}", campos, {})
+            pd.testing.assert_frame_equal(obtenido[esperado.columns], esperado, check_dtype=False)
+
+
+def test_agregado_filtrado(dw, almacen):
+    ctx = dw.CONTEXTOS_BIMESTRE["III"]
+    grado = ctx["df_curso_comp_grado"]["Grado"].iloc[0]
+    esperado = ctx["df_curso_comp_grado"]
+    esperado = esperado[esperado["Grado"] == grado].reset_index(drop=True)
+    obtenido = almacen.agregado("2025-III", ["Grado", "Curso", "Competencia"], {"Grado": grado})
+    pd.testing.assert_frame_equal(obtenido[esperado.columns], esperado, check_dtype=False)
+
+
+def test_contexto_iguales_a_memoria(dw, almacen):
+    for clave in dw.BIMESTRES:
+        ctx = dw.CONTEXTOS_BIMESTRE[clave]
+        guardado = almacen.contexto(f"2025-{clave}")
+        assert guardado["nivel_counts"] == ctx["nivel_counts"]
+        for total in ("total_evaluaciones", "total_cursos", "total_competencias", "total_grados", "total_secciones"):
+            assert guardado[total] == ctx[total]
+        assert guardado["mapeo_columnas"] == ctx["mapeo_columnas"]
+        assert (dw.codificar_niveles(guardado["df_data"], guardado["mapeo_columnas"]) == ctx["matriz_niveles"]).all()
+
+
+def test_anios_distintos_no_se_reemplazan(dw, tmp_path):
+    almacen = AlmacenEvaluaciones(tmp_path / "evaluaciones.db")
+    archivo = dw.BIMESTRE_FILES["III"]
+    df, df_long, mapeo_columnas = dw.leer_bimestre(archivo)
+    # El Excel del año siguiente tiene el mismo nombre pero otra fecha
+    almacen.guardar("2024-III", archivo, 1.0, df, df_long, mapeo_columnas)
+    almacen.guardar("2025-III", archivo, 2.0, df, df_long, mapeo_columnas)
+    assert almacen.bimestres() == ["2024-III", "2025-III"]
+    for clave in almacen.bimestres():
+        assert almacen.contexto(clave)["total_evaluaciones"] == dw.CONTEXTOS_BIMESTRE["III"]["total_evaluaciones"]
+
+
+def test_mismo_excel_no_se_guarda_con_otro_anio(dw, tmp_path):
+    almacen = AlmacenEvaluaciones(tmp_path / "evaluaciones.db")
+    archivo = dw.BIMESTRE_FILES["III"]
+    dw.sincronizar_almacen(almacen, "2025-III", archivo)
+    with pytest.raises(ValueError, match="2025-III"):
+        dw.sincronizar_almacen(almacen, "2026-III", archivo)
+    assert almacen.bimestres() == ["2025-III"]
+
+
+def test_nro_repetido(dw, tmp_path):
+    almacen = AlmacenEvaluaciones(tmp_path / "evaluaciones.db")
+    archivo = dw.BIMESTRE_FILES["III"]
+    df, df_long, mapeo_columnas = dw.leer_bimestre(archivo)
+    repetido = df["alumno_id"].iloc[0]
+    df.loc[1, "alumno_id"] = repetido
+    df_long.loc[df_long["fila"] == 1, "alumno_id"] = repetido
+    almacen.guardar("2025-III", archivo, 1.0, df, df_long, mapeo_columnas)
+    guardado = almacen.contexto("2025-III")
+    assert (dw.codificar_niveles(guardado["df_data"], mapeo_columnas) == dw.CONTEXTOS_BIMESTRE["III"]["matriz_niveles"]).all()
+
+
+def test_tendencia_igual_a_memoria(dw, almacen):
+    tabla = dw.CONTEXTOS_BIMESTRE["III"]["df_curso_comp_grado"]
+    for (grado, curso), _ in list(tabla.groupby(["Grado", "Curso"]))[:10]:
+        esperado = dw.TENDENCIAS.serie(Grado=grado, Curso=curso)
+        obtenido = almacen.tendencia({"Grado": grado, "Curso": curso})
+        obtenido["Bimestre"] = obtenido["Bimestre"].str.removeprefix("2025-")
+        columnas = ["Bimestre", "Nivel", "Cantidad", "Porcentaje"]
+        pd.testing.assert_frame_equal(
+            obtenido[columnas].sort_values(["Bimestre", "Nivel"]).reset_index(drop=True),
+            esperado[columnas].sort_values(["Bimestre", "Nivel"]).reset_index(drop=True),
+            check_dtype=False,
+        )
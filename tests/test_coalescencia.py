@@ -0,0 +1,66 @@
+import threading
+import time
+
+import pytest
+
+from coalescencia import Coalescedor
+
+
+def en_paralelo(cantidad, funcion):
+    hilos = [threading.Thread(target=funcion) for _ in range(cantidad)]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+
+
+def test_llamadas_identicas_comparten_un_calculo():
+    coalescedor = Coalescedor()
+    calculos, resultados = [], []
+
+    def lenta():
+        calculos.append(1)
+        time.sleep(0.2)
+        return b"respuesta"
+
+    en_paralelo(8, lambda: resultados.append(coalescedor.ejecutar("clave", "cb", lenta)))
+    assert len(calculos) == 1
+    assert resultados == [b"respuesta"] * 8
+    assert coalescedor.calculadas["cb"] == 1 and coalescedor.unidas["cb"] == 7
+
+
+def test_el_error_se_comparte_y_no_queda_en_vuelo():
+    coalescedor = Coalescedor()
+    errores = []
+
+    def falla():
+        time.sleep(0.2)
+        raise ValueError("sin datos")
+
+    def llamar():
+        with pytest.raises(ValueError):
+            coalescedor.ejecutar("clave", "cb", falla)
+        errores.append(1)
+
+    en_paralelo(4, llamar)
+    assert len(errores) == 4
+    assert coalescedor._en_vuelo == {}
+    assert coalescedor.ejecutar("clave", "cb", lambda: 1) == 1
+
+
+def test_claves_distintas_no_se_unen():
+    coalescedor = Coalescedor()
+    en_paralelo(1, lambda: coalescedor.ejecutar("a", "cb", lambda: 1))
+    coalescedor.ejecutar("b", "cb", lambda: 2)
+    assert coalescedor.calculadas["cb"] == 2 and coalescedor.unidas["cb"] == 0
+
+
+def test_conteos_en_el_log(capsys):
+    coalescedor = Coalescedor(intervalo_log=0.1)
+    coalescedor.ejecutar("a", "cb", lambda: 1)
+    assert capsys.readouterr().out == ""
+    time.sleep(0.15)
+    coalescedor.ejecutar("a", "cb", lambda: 1)
+    assert capsys.readouterr().out == "[coalescencia] 2 calculadas, 0 unidas, 1 en vuelo\n"
+    coalescedor.ejecutar("a", "cb", lambda: 1)
+    assert capsys.readouterr().out == ""
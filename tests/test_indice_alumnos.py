@@ -0,0 +1,38 @@
+import pandas as pd
+
+from indice_alumnos import IndiceAlumnos, normalizar
+
+
+def padron(*filas):
+    return pd.DataFrame(filas, columns=["nombre_alumno", "grado", "seccion"])
+
+
+def test_normalizar():
+    assert normalizar("Ñahui, José ") == "nahui jose"
+
+
+def test_homonimos_del_mismo_bimestre_no_se_juntan():
+    indice = IndiceAlumnos()
+    indice.agregar_bimestre("II", padron(("Pérez, Juan", "PRIMERO", "A"), ("PEREZ JUAN", "SEGUNDO", "B")))
+    indice.agregar_bimestre("III", padron(("PEREZ JUAN", "SEGUNDO", "B"), ("Perez Juan", "PRIMERO", "A")))
+    resultados = indice.buscar("juan perez")
+    assert len(resultados) == 2
+    # Cada homónimo se enlaza con la fila de su mismo grado y sección
+    for entrada in resultados:
+        ubicaciones = {(u["grado"], u["seccion"]) for u in entrada["bimestres"].values()}
+        assert len(ubicaciones) == 1
+    assert sorted(e["bimestres"]["II"]["fila"] for e in resultados) == [0, 1]
+
+
+def test_busqueda_por_prefijo_y_sin_tildes():
+    indice = IndiceAlumnos()
+    indice.agregar_bimestre("II", padron(("Ñahui Ríos, Ana", "PRIMERO", "A"), ("Torres, Luis", "PRIMERO", "A")))
+    assert [e["nombre"] for e in indice.buscar("nahui an")] == ["Ñahui Ríos, Ana"]
+    assert [e["nombre"] for e in indice.buscar("lu")] == ["Torres, Luis"]
+    assert indice.buscar("xyz") == []
+
+
+def test_todas_las_filas_indexadas(dw):
+    for clave in dw.BIMESTRES:
+        filas = sum(1 for nombre in dw.CONTEXTOS_BIMESTRE[clave]["df_data"]["nombre_alumno"] if normalizar(nombre))
+        assert sum(clave in e["bimestres"] for e in dw.INDICE_ALUMNOS.entradas) == filas
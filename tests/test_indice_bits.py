@@ -0,0 +1,52 @@
+def test_conteo_total_igual_a_nivel_counts(dw):
+    for clave in dw.BIMESTRES:
+        ctx = dw.CONTEXTOS_BIMESTRE[clave]
+        indice = ctx["indice_bits"]
+        assert indice.contar(indice.todos) == {nivel: ctx["nivel_counts"].get(nivel, 0) for nivel in dw.NIVEL_PESOS}
+
+
+def test_desglose_igual_a_agregados(dw):
+    for clave in dw.BIMESTRES:
+        ctx = dw.CONTEXTOS_BIMESTRE[clave]
+        indice = ctx["indice_bits"]
+        for campo, tabla in (("Grado", "df_grado_comp"), ("Seccion", "df_seccion_comp_simple"), ("Curso", "df_curso_comp")):
+            esperado = ctx[tabla].groupby([campo, "Nivel"])["Cantidad"].sum()
+            for valor, conteo in indice.desglose(campo).items():
+                for nivel, cantidad in conteo.items():
+                    assert cantidad == esperado.get((valor, nivel), 0)
+
+
+def test_seleccion_multiple(dw):
+    ctx = dw.CONTEXTOS_BIMESTRE["III"]
+    indice = ctx["indice_bits"]
+    grados = sorted(ctx["df_data"]["grado"].unique())[:2]
+    tabla = ctx["df_curso_comp_grado"]
+    curso = tabla["Curso"].iloc[0]
+    esperado = tabla[tabla["Grado"].isin(grados) & (tabla["Curso"] == curso)].groupby("Nivel")["Cantidad"].sum()
+    conteo = indice.contar(indice.seleccion(Grado=grados, Curso=[curso]))
+    assert conteo == {nivel: int(esperado.get(nivel, 0)) for nivel in dw.NIVEL_PESOS}
+
+
+def test_consulta_descarta_grados_y_cursos_de_otro_bimestre(dw):
+    salidas = [
+        ("consulta-grados", "options"), ("consulta-grados", "value"),
+        ("consulta-secciones", "options"), ("consulta-secciones", "value"),
+        ("consulta-cursos", "options"), ("consulta-cursos", "value"),
+        ("consulta-competencias", "options"), ("consulta-competencias", "value"),
+        ("grafico-consulta", "children"),
+    ]
+    grado = sorted(dw.CONTEXTOS_BIMESTRE["III"]["indice_bits"].campos["Grado"])[0]
+    curso = sorted(dw.CONTEXTOS_BIMESTRE["III"]["indice_bits"].campos["Curso"])[0]
+    valores = {"bimestre-select": "III", "consulta-grados": [grado, "NO EXISTE"], "consulta-secciones": [],
+               "consulta-cursos": [curso, "NO EXISTE"], "consulta-competencias": []}
+    respuesta = dw.server.test_client().post("/_dash-update-component", json={
+        "output": ".." + "...".join(f"{i}.{p}" for i, p in salidas) + "..",
+        "outputs": [{"id": i, "property": p} for i, p in salidas],
+        "inputs": [{"id": i, "property": "value", "value": v} for i, v in valores.items()],
+        "changedPropIds": ["bimestre-select.value"],
+        "state": [],
+    })
+    assert respuesta.status_code == 200
+    cambios = respuesta.get_json()["response"]
+    assert cambios["consulta-grados"]["value"] == [grado]
+    assert cambios["consulta-cursos"]["value"] == [curso]
@@ -0,0 +1,6 @@
+def test_una_fila_por_grado_y_seccion(dw):
+    for clave in dw.BIMESTRES:
+        df = dw.CONTEXTOS_BIMESTRE[clave]["df_data"]
+        pares = sorted(f"{g} - {s}" for g, s in df[["grado", "seccion"]].drop_duplicates().itertuples(index=False))
+        figura = dw.update_mapa_secciones("C", None, clave).figure
+        assert sorted(figura.data[0].y) == pares
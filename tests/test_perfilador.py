@@ -0,0 +1,50 @@
+import threading
+import time
+
+import pytest
+from flask import Flask
+
+from perfilador import Perfilador
+
+
+@pytest.fixture
+def app(tmp_path):
+    app = Flask(__name__)
+
+    @app.post("/_dash-update-component")
+    def callback():
+        time.sleep(0.2)
+        return {"ok": True}
+
+    Perfilador(tmp_path, "secreto").instalar(app)
+    return app
+
+
+def test_un_perfil_a_la_vez(app):
+    cabeceras = []
+
+    def llamar():
+        respuesta = app.test_client().post("/_dash-update-component", json={"output": "a.b"}, headers={"X-Perfilar": "secreto"})
+        assert respuesta.status_code == 200
+        cabeceras.append(respuesta.headers["X-Perfil"])
+
+    hilos = [threading.Thread(target=llamar) for _ in range(3)]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+    assert sorted(c == "ocupado" for c in cabeceras) == [False, True, True]
+
+
+def test_token_y_cookie(app):
+    cliente = app.test_client()
+    assert cliente.get("/admin/perfiles").status_code == 403
+    respuesta = cliente.get("/admin/perfiles?perfilar=secreto")
+    assert respuesta.status_code == 200
+    cookie = respuesta.headers["Set-Cookie"]
+    assert "secreto" not in cookie and "Secure" in cookie
+    # La cookie derivada autoriza; el token crudo en la cookie no
+    assert cliente.get("/admin/perfiles").status_code == 200
+    otro = app.test_client()
+    otro.set_cookie("perfilar", "secreto")
+    assert otro.get("/admin/perfiles").status_code == 403
@@ -0,0 +1,25 @@
+import pytest
+
+
+@pytest.mark.parametrize("n", [1, 5, 10, 25])
+def test_top_n_igual_al_orden_completo(dw, n):
+    for clave in dw.BIMESTRES:
+        for grado in (None, sorted(dw.CONTEXTOS_BIMESTRE[clave]["df_data"]["grado"].unique())[0]):
+            completo = dw.ranking_riesgo(clave, grado=grado, n=dw.MAX_RANKING_RIESGO)
+            top = dw.ranking_riesgo(clave, grado=grado, n=n)
+            assert top.equals(completo.head(n).reset_index(drop=True))
+
+
+def test_por_seccion_respeta_n(dw):
+    ranking = dw.ranking_riesgo("III", n=3, por_seccion=True)
+    assert ranking.groupby(["Grado", "Seccion"]).size().max() <= 3
+    assert (ranking["C"] + ranking["B"] > 0).all()
+
+
+@pytest.mark.parametrize("n", [0, -5])
+def test_n_no_positivo_devuelve_uno(dw, n):
+    assert len(dw.ranking_riesgo("III", n=n)) == 1
+
+
+def test_n_se_acota_al_maximo(dw):
+    assert len(dw.ranking_riesgo("III", n=10 ** 6)) == dw.MAX_RANKING_RIESGO
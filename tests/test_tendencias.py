@@ -0,0 +1,27 @@
+from tendencias import clave_bimestre
+
+
+def test_clave_bimestre():
+    claves = ["2025-II", "III", "2024-IV", "II", "2025-I"]
+    assert sorted(claves, key=clave_bimestre) == ["II", "III", "2024-IV", "2025-I", "2025-II"]
+
+
+def test_serie_igual_a_agregados(dw):
+    for clave in dw.BIMESTRES:
+        tabla = dw.CONTEXTOS_BIMESTRE[clave]["df_curso_comp_grado"]
+        for (grado, curso), grupo in list(tabla.groupby(["Grado", "Curso"]))[:10]:
+            serie = dw.TENDENCIAS.serie(Grado=grado, Curso=curso)
+            obtenido = serie[serie["Bimestre"] == clave].set_index("Nivel")["Cantidad"].to_dict()
+            assert obtenido == grupo.groupby("Nivel")["Cantidad"].sum().to_dict()
+
+
+def test_seccion_se_filtra_dentro_del_grado(dw):
+    for clave in dw.BIMESTRES:
+        df = dw.CONTEXTOS_BIMESTRE[clave]["df_data"]
+        repetidas = df.groupby("seccion")["grado"].nunique()
+        for seccion in repetidas[repetidas > 1].index:
+            for grado in df.loc[df["seccion"] == seccion, "grado"].unique():
+                serie = dw.TENDENCIAS.serie(Grado=grado, Seccion=seccion)
+                total = serie.loc[serie["Bimestre"] == clave, "Cantidad"].sum()
+                matriz = dw.CONTEXTOS_BIMESTRE[clave]["matriz_niveles"]
+                assert total == (matriz[((df["grado"] == grado) & (df["seccion"] == seccion)).to_numpy()] > 0).sum()